@@ -1,18 +1,162 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from backend.settings import settings
+
+# 1. Define the database URL. By default this points to a file named 'sql_app.db' in the same directory.
+SQLALCHEMY_DATABASE_URL = settings.database_url
+
+PROFILES = ("default", "tuned")
+# Pragmas reported by /diagnostics/database
+REPORTED_PRAGMAS = ("journal_mode", "synchronous", "mmap_size", "cache_size", "busy_timeout", "page_size")
+
+
+def _is_file_sqlite(url: str) -> bool:
+    return url.startswith("sqlite") and ":memory:" not in url and not url.rstrip("/").endswith(":")
+
+
+def sqlite_pragmas() -> dict:
+    """Pragmas the tuned profile sets on every new connection."""
+    return {
+        # WAL: readers no longer block the writer (or vice versa)
+        "journal_mode": settings.sqlite_journal_mode,
+        # NORMAL under WAL only fsyncs at checkpoints; still crash-safe
+        "synchronous": settings.sqlite_synchronous,
+        "mmap_size": settings.sqlite_mmap_size,
+        "cache_size": settings.sqlite_cache_size,
+        # wait for the write lock instead of failing with "database is locked"
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+    }
+
+
+def apply_sqlite_profile(sync_engine) -> None:
+    """Run the tuned pragmas on each new DBAPI connection of `sync_engine`."""
+    pragmas = sqlite_pragmas()
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def make_engine(url: str, profile: str = None):
+    profile = profile or settings.db_profile
+    if profile not in PROFILES:
+        raise ValueError(f"db_profile must be one of {', '.join(PROFILES)}")
+    # The 'connect_args' is needed only for SQLite to allow multi-threaded interaction;
+    # other drivers (psycopg2, ...) reject the option.
+    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
+    if profile == "default" or not _is_file_sqlite(url):
+        return create_engine(url, connect_args=connect_args)
+
+    # SQLAlchemy 1.4 defaults file SQLite to NullPool, which reopens the file
+    # (and re-runs the pragmas, and drops the page cache) on every session.
+    # Keep a bounded pool of open connections instead.
+    sync_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+    )
+    apply_sqlite_profile(sync_engine)
+    return sync_engine
 
-# 1. Define the database URL. This points to a file named 'sql_app.db' in the same directory.
-SQLALCHEMY_DATABASE_URL = "sqlite:///./sql_app.db"
 
 # 2. Create the SQLAlchemy engine. This is the core of the database connection.
-# The 'connect_args' is needed only for SQLite to allow multi-threaded interaction.
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+engine = make_engine(SQLALCHEMY_DATABASE_URL)
+
+
+def active_pragmas(bind=None) -> dict:
+    """Current values of REPORTED_PRAGMAS on a pooled connection."""
+    bind = bind or engine
+    with bind.connect() as conn:
+        return {name: conn.exec_driver_sql(f"PRAGMA {name}").scalar() for name in REPORTED_PRAGMAS}
+
+
+def add_missing_columns(metadata, bind=None) -> None:
+    """create_all() does not alter existing tables; add new nullable columns to them."""
+    bind = bind or engine
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    with bind.begin() as conn:
+        for table in metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            present = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in present:
+                    column_type = column.type.compile(dialect=bind.dialect)
+                    conn.exec_driver_sql(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}')
+
+
+def create_missing_indexes(metadata, bind=None) -> None:
+    """create_all() skips indexes of tables that already exist; add any new ones."""
+    bind = bind or engine
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
 
 # 3. Create a SessionLocal class. Each instance of this class will be a new database session.
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # 4. Create a Base class. Our database model classes will inherit from this class.
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+# 5. Async engine and sessions for DB_ASYNC=true (aiosqlite behind SQLAlchemy's
+# asyncio API). Built on first use so aiosqlite is only needed in that mode.
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def async_database_url(url: str) -> str:
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+def make_async_engine(url: str, profile: str = None):
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    # SQLite has one writer at a time: a small bounded pool makes extra
+    # requests queue (without holding a thread) instead of opening more
+    # connections that only fight over the file lock.
+    async_engine = create_async_engine(
+        async_database_url(url),
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.db_async_pool_size,
+        max_overflow=0,
+        pool_timeout=60,
+    )
+    if (profile or settings.db_profile) == "tuned" and _is_file_sqlite(url):
+        apply_sqlite_profile(async_engine.sync_engine)
+    return async_engine
+
+
+def make_async_sessionmaker(async_engine):
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    return sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+
+def get_async_sessionmaker():
+    global _async_engine, _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _async_engine = make_async_engine(SQLALCHEMY_DATABASE_URL)
+        _AsyncSessionLocal = make_async_sessionmaker(_async_engine)
+    return _AsyncSessionLocal
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = _AsyncSessionLocal = None
@@ -1,17 +1,45 @@
+import threading
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from typing import List
 from datetime import datetime
 from backend.logging_config import logger
 from backend import models
-from backend.database import engine
-from backend.routers import goals, planner, market, nlp, agent
+from backend.database import add_missing_columns, create_missing_indexes, dispose_async_engine, engine
+from backend.routers import goals, goals_async, planner, market, nlp, agent, diagnostics
+from backend.services import nlp_batch
+from backend.services.nlp import warm_dateparser
+from backend.services.inflation import warm_inflation
+from backend.services.recompute import recompute_job
+from backend.settings import settings
 from backend.schemas import ExpenseIn, Expense, IncomeIn, Income, AdviceResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 # Create tables
 models.Base.metadata.create_all(bind=engine)
-
-app = FastAPI(title="Finance Agent")
+add_missing_columns(models.Base.metadata)
+create_missing_indexes(models.Base.metadata)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Heavy NLP deps load lazily; warm them off the event loop so the worker
+    # starts accepting requests immediately.
+    if settings.nlp_warm_on_startup:
+        threading.Thread(target=warm_dateparser, name="nlp-warmup", daemon=True).start()
+        threading.Thread(target=nlp_batch.warm_pool, name="nlp-pool-warmup", daemon=True).start()
+    # Load inflation into memory so the first plan does not wait on disk/network.
+    threading.Thread(target=warm_inflation, name="inflation-warmup", daemon=True).start()
+    # Refresh calculations stored under an older inflation version or year.
+    if settings.recompute_interval_seconds > 0:
+        recompute_job.start_schedule(settings.recompute_interval_seconds)
+    yield
+    recompute_job.stop()
+    nlp_batch.shutdown_pool()
+    await dispose_async_engine()
+
+
+app = FastAPI(title="Finance Agent", lifespan=lifespan)
 
 # CORS (allow all for now; tighten with frontend origin when available)
 app.add_middleware(
@@ -20,14 +48,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # GET /goals paging cursor
 )
 
 # Include Routers
-app.include_router(goals.router)
+app.include_router(goals_async.router if settings.db_async else goals.router)
 app.include_router(planner.router)
 app.include_router(market.router)
 app.include_router(nlp.router)
 app.include_router(agent.router)
+app.include_router(diagnostics.router)
 
 @app.get("/")
 def root():
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from sqlalchemy import Column, Date, Index, Integer, String, Float, ForeignKey
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -12,7 +12,7 @@ class Goal(Base):
     id = Column(Integer, primary_key=True, index=True)
     event_name = Column(String, index=True)
     today_cost = Column(Float)
-    target_year = Column(Integer)
+    target_year = Column(Integer, index=True)
 
     # NEW: one-to-one with Calculation (delete calc if goal is deleted)
     calculation = relationship(
@@ -27,7 +27,15 @@ class Calculation(Base):
     id = Column(Integer, primary_key=True, index=True)
     future_cost = Column(Float)
     monthly_saving = Column(Float)
-    goal_id = Column(Integer, ForeignKey("goals.id"))
+    goal_id = Column(Integer, ForeignKey("goals.id"), index=True)
+    # What the numbers were computed with; see backend.services.recompute
+    inflation_version = Column(String)
+    computed_on = Column(Date)
 
     # NEW: backref to Goal
     goal = relationship("Goal", back_populates="calculation")
+
+    __table_args__ = (
+        # serves the stale-row finder (version mismatch, or computed before this year)
+        Index("ix_calculations_stamp", "inflation_version", "computed_on"),
+    )
@@ -1,74 +1,185 @@
 # backend/routers/agent.py
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Optional, Tuple
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from backend.logging_config import logger
 from backend.schemas import ChatMessageRequest, ChatMessageResponse, PlanResponse
-from backend.services.nlp import parse_goal_text, _extract_year, _extract_amount, _extract_event_name  # type: ignore
+from backend.services.nlp import parse_goal_fields
 from backend.services.planner import plan_event
 from backend.services.market import fetch_index_summary
+from backend.settings import settings
 
 router = APIRouter(
     prefix="/agent",
     tags=["Agent"],
 )
 
-@router.post("/chat", response_model=ChatMessageResponse)
-def chat(req: ChatMessageRequest):
-    text = (req.message or "").strip()
-    if not text:
-        raise HTTPException(status_code=400, detail="message cannot be empty")
+# Dedicated pool so slow upstreams past the deadline cannot starve the
+# event loop's default executor.
+_executor = ThreadPoolExecutor(max_workers=settings.agent_max_workers, thread_name_prefix="agent")
 
-    reply_lines = []
-    plan_data: PlanResponse | None = None  # type: ignore[assignment]
-    market = None
+MARKET_KEYWORDS = {"market", "nifty", "sensex", "index", "stock", "stocks", "indices", "nse", "bse"}
 
-    # Try parsing a goal from free text
+HELP_REPLY = (
+    "I can help set goals from natural language (e.g., 'Plan wedding Dec 2026 for 8L') and share market summaries. Ask me!"
+)
+# Marks a sub-task that was still running when the deadline expired
+PENDING = object()
+
+TIMEOUT_REPLIES = {
+    "plan": "Your plan is taking longer than usual to compute; please try again shortly.",
+    "market": "Market data is taking longer than usual; please try again shortly.",
+}
+
+
+def _plan_part(text: str) -> Optional[Tuple[PlanResponse, str]]:
+    # One extraction pass; plan only when both amount and year were found
+    parsed = parse_goal_fields(text)
+    if parsed.amount is None or parsed.year is None:
+        logger.info("No complete goal in message", extra={"amount": parsed.amount, "year": parsed.year})
+        return None
     try:
-        event_name, today_cost, target_year = parse_goal_text(text)
-        p = plan_event(event_name, float(today_cost), int(target_year))
+        p = plan_event(parsed.event_name, float(parsed.amount), int(parsed.year))
         plan_data = PlanResponse(**p)
-        reply_lines.append(
-            f"Planned '{plan_data.event_name}' for {plan_data.target_year}. Future cost ≈ ₹{int(plan_data.future_cost):,}. "
-            f"You'd need ≈ ₹{int(plan_data.monthly_saving_needed):,}/month."
-        )
     except Exception as e:
-        logger.info("parse_goal_text failed; attempting fallback parsing", extra={"err": str(e)})
-        # Fallback: best-effort extraction; only plan if both amount and year are present
-        try:
-            event_name_fb = _extract_event_name(text)
-            amount_fb = _extract_amount(text)
-            year_fb = _extract_year(text)
-            if amount_fb is not None and year_fb is not None:
-                p = plan_event(event_name_fb, float(amount_fb), int(year_fb))
-                plan_data = PlanResponse(**p)
-                reply_lines.append(
-                    f"Planned '{plan_data.event_name}' for {plan_data.target_year}. Future cost ≈ ₹{int(plan_data.future_cost):,}. "
-                    f"You'd need ≈ ₹{int(plan_data.monthly_saving_needed):,}/month."
-                )
-        except Exception as e2:
-            logger.info("Fallback parsing also failed", extra={"err": str(e2)})
-
-    # If the user asks about the market, fetch summary
+        logger.info("Planning from parsed goal failed", extra={"err": str(e)})
+        return None
+    line = (
+        f"Planned '{plan_data.event_name}' for {plan_data.target_year}. Future cost ≈ ₹{int(plan_data.future_cost):,}. "
+        f"You'd need ≈ ₹{int(plan_data.monthly_saving_needed):,}/month."
+    )
+    return plan_data, line
+
+
+def _market_part() -> Optional[Tuple[dict, str]]:
+    try:
+        market = fetch_index_summary()
+    except Exception as e:
+        logger.warning("Market summary fetch failed", extra={"err": str(e)})
+        return None
+    n = market.get("NIFTY_50", {})
+    s = market.get("SENSEX", {})
+    line = (
+        f"Market: NIFTY 50 {n.get('last_price', '—')} {n.get('currency', '')}, "
+        f"SENSEX {s.get('last_price', '—')} {s.get('currency', '')}."
+    )
+    return market, line
+
+
+def _wants_market(text: str) -> bool:
     lowered = text.lower()
-    market_keywords = {"market", "nifty", "sensex", "index", "stock", "stocks", "indices", "nse", "bse"}
-    if any(k in lowered for k in market_keywords):
-        try:
-            market = fetch_index_summary()
-            n = market.get("NIFTY_50", {})
-            s = market.get("SENSEX", {})
-            reply_lines.append(
-                f"Market: NIFTY 50 {n.get('last_price', '—')} {n.get('currency', '')}, "
-                f"SENSEX {s.get('last_price', '—')} {s.get('currency', '')}."
-            )
-        except Exception as e:
-            logger.warning("Market summary fetch failed", extra={"err": str(e)})
+    return any(k in lowered for k in MARKET_KEYWORDS)
+
+
+def _start_parts(text: str) -> dict:
+    """Kick off the independent sub-tasks for a message, keyed by part name."""
+    loop = asyncio.get_running_loop()
+    tasks = {"plan": loop.run_in_executor(_executor, _plan_part, text)}
+    if _wants_market(text):
+        tasks["market"] = loop.run_in_executor(_executor, _market_part)
+    return tasks
+
+
+async def _iter_parts(tasks: dict) -> AsyncIterator[Tuple[str, object]]:
+    """Yield (part, result) as sub-tasks finish, then (part, PENDING) for any
+    still running when the agent deadline expires."""
+    deadline = time.monotonic() + settings.agent_deadline_seconds
+    names = {task: name for name, task in tasks.items()}
+    pending = set(tasks.values())
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            yield names[task], task.result()
+    for task in pending:
+        logger.warning("Agent sub-task missed deadline", extra={"part": names[task]})
+        yield names[task], PENDING
+
+
+def _build_response(order: list, results: dict) -> ChatMessageResponse:
+    reply_lines = []
+    for name in order:  # plan first, then market
+        result = results.get(name)
+        if result is PENDING:
+            reply_lines.append(TIMEOUT_REPLIES[name])
+        elif result is not None:
+            reply_lines.append(result[1])
 
     if not reply_lines:
-        reply_lines.append(
-            "I can help set goals from natural language (e.g., 'Plan wedding Dec 2026 for 8L') and share market summaries. Ask me!"
-        )
+        reply_lines.append(HELP_REPLY)
+
+    def payload(name):
+        result = results.get(name)
+        return result[0] if result is not None and result is not PENDING else None
 
     return ChatMessageResponse(
         reply=" ".join(reply_lines),
-        plan=plan_data,
-        market_summary=market,
+        plan=payload("plan"),
+        market_summary=payload("market"),
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _validated_text(req: ChatMessageRequest) -> str:
+    text = (req.message or "").strip()
+    if not text:
+        raise HTTPException(status_code=400, detail="message cannot be empty")
+    return text
+
+
+@router.post("/chat", response_model=ChatMessageResponse)
+async def chat(req: ChatMessageRequest):
+    """
+    Plan any goal in the message and, if asked, fetch the market summary.
+    Both run concurrently; whatever is not ready by the agent deadline is
+    reported as pending instead of holding up the reply.
+    """
+    text = _validated_text(req)
+
+    started = time.monotonic()
+    tasks = _start_parts(text)
+    results = {name: result async for name, result in _iter_parts(tasks)}
+
+    logger.info("Agent chat answered", extra={"elapsed_ms": round((time.monotonic() - started) * 1000, 1)})
+    return _build_response(list(tasks), results)
+
+
+@router.post("/chat/stream")
+async def chat_stream(req: ChatMessageRequest):
+    """
+    Streaming variant of /agent/chat over Server-Sent Events.
+
+    Emits `plan` and `market` events as each part is ready (`timeout` for
+    parts that miss the deadline), then a `final` event carrying the full
+    ChatMessageResponse.
+    """
+    text = _validated_text(req)
+    tasks = _start_parts(text)
+
+    async def events():
+        results = {}
+        async for name, result in _iter_parts(tasks):
+            results[name] = result
+            if result is PENDING:
+                yield _sse("timeout", {"part": name, "reply": TIMEOUT_REPLIES[name]})
+            elif result is not None:
+                payload, line = result
+                data = payload.model_dump(mode="json") if isinstance(payload, PlanResponse) else payload
+                yield _sse(name, {"reply": line, name: data})
+        yield _sse("final", _build_response(list(tasks), results).model_dump(mode="json"))
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
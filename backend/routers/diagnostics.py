@@ -0,0 +1,61 @@
+# backend/routers/diagnostics.py
+from fastapi import APIRouter
+from backend import database
+from backend.settings import settings
+from backend.services import recompute
+from backend.services.market_stream import poller_stats
+from backend.services.planner import _get_inflation_percent
+from backend.utils.circuit_breaker import breaker_states
+
+router = APIRouter(prefix="/diagnostics", tags=["Diagnostics"])
+
+
+@router.get("/circuits")
+def get_circuit_states():
+    """
+    State of every upstream circuit breaker (closed / open / half_open).
+    """
+    return breaker_states()
+
+
+@router.get("/market-pollers")
+def get_market_pollers():
+    """
+    Active shared market pollers with their subscriber and poll counts.
+    """
+    return poller_stats()
+
+
+@router.get("/database")
+def get_database_profile():
+    """
+    Active SQLite pragmas and connection pool state of the main engine.
+    """
+    return {
+        "profile": settings.db_profile,
+        "pool": database.engine.pool.status(),
+        "pragmas": database.active_pragmas(),
+    }
+
+
+@router.get("/recompute")
+def get_recompute_status():
+    """
+    Background recompute of stored calculations: job state and how many rows
+    are stale against the current inflation version.
+    """
+    version = recompute.inflation_version(_get_inflation_percent())
+    db = database.SessionLocal()
+    try:
+        stale = recompute.count_stale(db, version)
+    finally:
+        db.close()
+    return {**recompute.recompute_job.status(), "current_inflation_version": version, "stale": stale}
+
+
+@router.post("/recompute", status_code=202)
+def trigger_recompute():
+    """
+    Start a recompute pass now (resuming an interrupted one) unless one is running.
+    """
+    return {"started": recompute.recompute_job.trigger(), **recompute.recompute_job.status()}
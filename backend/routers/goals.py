@@ -1,11 +1,14 @@
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session, joinedload
+from starlette.concurrency import run_in_threadpool
 
 from backend.database import SessionLocal
 from backend import models, schemas
+from backend.services import goal_import, goal_queries
 from backend.services.planner import plan_event
+from backend.services.recompute import calculation_stamp
 
 router = APIRouter(prefix="/goals", tags=["Goals"])
 
@@ -38,6 +41,7 @@ def create_goal(goal_in: schemas.GoalCreate, db: Session = Depends(get_db)):
     calc = models.Calculation(
         future_cost=plan["future_cost"],
         monthly_saving=plan["monthly_saving_needed"],
+        **calculation_stamp(plan["inflation_percent_used"]),
         goal_id=goal.id,
     )
     db.add(calc)
@@ -48,13 +52,69 @@ def create_goal(goal_in: schemas.GoalCreate, db: Session = Depends(get_db)):
     # Let Pydantic serialize the ORM objects (orm_mode=True)
     return goal
 
-@router.get("/", response_model=List[schemas.GoalOut])
-def get_all_goals(db: Session = Depends(get_db)):
-    """Return all goals with their calculations eager-loaded."""
-    goals = db.query(models.Goal).options(
-        joinedload(models.Goal.calculation)
-    ).all()
-    return goals
+async def run_goal_import(request: Request, write: goal_import.WriteChunk) -> dict:
+    """Shared body of POST /goals/import; `write` stores one chunk."""
+    try:
+        return await goal_import.import_stream(request.stream(), request.headers.get("content-type", ""), write)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+@router.post("/import", response_model=schemas.GoalImportResponse)
+async def import_goals(request: Request, db: Session = Depends(get_db)):
+    """
+    Create many goals at once from JSON lines (one GoalCreate object per line)
+    or CSV with an event_name,today_cost,target_year header (Content-Type:
+    text/csv). The body is streamed and saved in chunks, each in its own
+    transaction; invalid rows are listed in `errors` by line number and skipped.
+    """
+    async def write(rows, plans):
+        await run_in_threadpool(goal_import.write_chunk, db, rows, plans)
+
+    return await run_goal_import(request, write)
+
+class GoalListParams:
+    """Query parameters of GET /goals, shared with the async router."""
+
+    def __init__(
+        self,
+        limit: int = Query(100, ge=1, le=1000),
+        after_id: Optional[int] = Query(None, ge=0, description="Cursor: the X-Next-Cursor of the previous page"),
+        target_year: Optional[int] = None,
+        event_name: Optional[str] = None,
+        event_name_prefix: Optional[str] = None,
+        fields: Optional[List[str]] = Query(None, description="Subset of id,event_name,today_cost,target_year,calculation"),
+    ):
+        try:
+            self.fields = goal_queries.parse_fields(fields)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        self.limit = limit
+        self.after_id = after_id
+        self.target_year = target_year
+        self.event_name = event_name
+        self.event_name_prefix = event_name_prefix
+
+    def statement(self):
+        return goal_queries.list_goals_statement(
+            self.fields, self.limit, self.after_id, self.target_year, self.event_name, self.event_name_prefix
+        )
+
+    def page(self, goals, response: Response) -> List[dict]:
+        items, next_cursor = goal_queries.page(goals, self.fields, self.limit)
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = str(next_cursor)
+        return items
+
+@router.get("/", response_model=List[schemas.GoalListItem], response_model_exclude_unset=True)
+def get_all_goals(response: Response, params: GoalListParams = Depends(), db: Session = Depends(get_db)):
+    """
+    One page of goals ordered by id, with calculations unless `fields` leaves
+    them out. Pass the X-Next-Cursor response header as `after_id` to get the
+    next page; the header is absent on the last page. An event_name_prefix
+    page sorts all goals matching the prefix, so broad prefixes cost more.
+    """
+    goals = db.execute(params.statement()).scalars().all()
+    return params.page(goals, response)
 
 @router.get("/{goal_id}", response_model=schemas.GoalOut)
 def get_goal(goal_id: int, db: Session = Depends(get_db)):
@@ -84,10 +144,13 @@ def update_goal(goal_id: int, goal_update: schemas.GoalUpdate, db: Session = Dep
         goal.calculation = models.Calculation(
             future_cost=plan["future_cost"],
             monthly_saving=plan["monthly_saving_needed"],
+            **calculation_stamp(plan["inflation_percent_used"]),
         )
     else:
         goal.calculation.future_cost = plan["future_cost"]
         goal.calculation.monthly_saving = plan["monthly_saving_needed"]
+        for column, value in calculation_stamp(plan["inflation_percent_used"]).items():
+            setattr(goal.calculation, column, value)
 
     db.add(goal)
     db.commit()
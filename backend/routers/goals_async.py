@@ -0,0 +1,107 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from starlette.concurrency import run_in_threadpool
+
+from backend.database import get_async_sessionmaker
+from backend import models, schemas
+from backend.routers.goals import GoalListParams, run_goal_import
+from backend.services import goal_import
+from backend.services.planner import plan_event
+from backend.services.recompute import calculation_stamp
+
+# Async twin of backend.routers.goals, mounted instead of it when DB_ASYNC=true.
+# Requests wait on SQLite without holding a threadpool slot. Relationships are
+# never lazy-loaded here (that needs IO), so every query that is serialized
+# or deleted eager-loads the calculation.
+router = APIRouter(prefix="/goals", tags=["Goals"])
+
+# DB session dependency
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+async def _load_goal(db: AsyncSession, goal_id: int) -> models.Goal:
+    goal = await db.get(models.Goal, goal_id, options=[joinedload(models.Goal.calculation)])
+    if goal is None:
+        raise HTTPException(status_code=404, detail="Goal not found")
+    return goal
+
+async def _plan(goal: models.Goal) -> dict:
+    # plan_event may block on the first inflation load; keep it off the loop
+    return await run_in_threadpool(plan_event, goal.event_name, goal.today_cost, goal.target_year)
+
+@router.post("/", response_model=schemas.GoalOut)
+async def create_goal(goal_in: schemas.GoalCreate, db: AsyncSession = Depends(get_async_db)):
+    """Save the goal and its calculation in one transaction and return both."""
+    goal = models.Goal(
+        event_name=goal_in.event_name,
+        today_cost=goal_in.today_cost,
+        target_year=goal_in.target_year,
+    )
+    plan = await _plan(goal)
+    goal.calculation = models.Calculation(
+        future_cost=plan["future_cost"],
+        monthly_saving=plan["monthly_saving_needed"],
+        **calculation_stamp(plan["inflation_percent_used"]),
+    )
+    db.add(goal)
+    await db.commit()
+    return goal
+
+@router.post("/import", response_model=schemas.GoalImportResponse)
+async def import_goals(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """Bulk import; see backend.routers.goals.import_goals."""
+    async def write(rows, plans):
+        await goal_import.write_chunk_async(db, rows, plans)
+
+    return await run_goal_import(request, write)
+
+@router.get("/", response_model=List[schemas.GoalListItem], response_model_exclude_unset=True)
+async def get_all_goals(response: Response, params: GoalListParams = Depends(),
+                        db: AsyncSession = Depends(get_async_db)):
+    """One keyset page of goals; see backend.routers.goals.get_all_goals."""
+    result = await db.execute(params.statement())
+    return params.page(result.scalars().all(), response)
+
+@router.get("/{goal_id}", response_model=schemas.GoalOut)
+async def get_goal(goal_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await _load_goal(db, goal_id)
+
+@router.patch("/{goal_id}", response_model=schemas.GoalOut)
+async def update_goal(goal_id: int, goal_update: schemas.GoalUpdate, db: AsyncSession = Depends(get_async_db)):
+    goal = await _load_goal(db, goal_id)
+
+    # Apply updates if provided
+    if goal_update.event_name is not None:
+        goal.event_name = goal_update.event_name
+    if goal_update.today_cost is not None:
+        goal.today_cost = goal_update.today_cost
+    if goal_update.target_year is not None:
+        goal.target_year = goal_update.target_year
+
+    # Recalculate calculation
+    plan = await _plan(goal)
+
+    if goal.calculation is None:
+        goal.calculation = models.Calculation(
+            future_cost=plan["future_cost"],
+            monthly_saving=plan["monthly_saving_needed"],
+            **calculation_stamp(plan["inflation_percent_used"]),
+        )
+    else:
+        goal.calculation.future_cost = plan["future_cost"]
+        goal.calculation.monthly_saving = plan["monthly_saving_needed"]
+        for column, value in calculation_stamp(plan["inflation_percent_used"]).items():
+            setattr(goal.calculation, column, value)
+
+    await db.commit()
+    return goal
+
+@router.delete("/{goal_id}", status_code=204)
+async def delete_goal(goal_id: int, db: AsyncSession = Depends(get_async_db)):
+    goal = await _load_goal(db, goal_id)  # calculation loaded for the delete cascade
+    await db.delete(goal)
+    await db.commit()
+    return None
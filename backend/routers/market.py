@@ -1,13 +1,118 @@
 # backend/routers/market.py
-from fastapi import APIRouter
-from backend.services.market import fetch_index_summary
+import asyncio
+import json
+import re
+from datetime import date, datetime, time, timezone
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from backend.services import market_stream
+from backend.services.market import fetch_index_summary, fetch_quotes
+from backend.services.price_history import INTERVALS, PRICE_FIELDS, history_store
+from backend.settings import settings
 
 router = APIRouter(prefix="/market", tags=["Market"])
 
+# at least one letter, digit or "^": dot-only names like ".." are path segments
+_SYMBOL_RE = re.compile(r"^(?=.*[A-Za-z0-9^])[A-Za-z0-9^.=&\-]{1,20}$")
+
+
 @router.get("/summary")
 def get_market_summary():
     """
     Get latest market summary (Nifty + Sensex).
-    Cached for performance.
+    Cached in-process for CACHE_TTL_MARKET_SECONDS and refreshed in the
+    background once stale; each quote carries its fetched_at/age_seconds.
     """
     return fetch_index_summary()
+
+
+def _parse_symbols(symbols: List[str]) -> List[str]:
+    wanted = list(dict.fromkeys(s.strip() for part in symbols for s in part.split(",") if s.strip()))
+    if not wanted:
+        raise HTTPException(status_code=400, detail="at least one symbol is required")
+    if len(wanted) > settings.market_max_symbols:
+        raise HTTPException(status_code=400, detail=f"at most {settings.market_max_symbols} symbols per request")
+    bad = [s for s in wanted if not _SYMBOL_RE.match(s)]
+    if bad:
+        raise HTTPException(status_code=400, detail=f"invalid symbol(s): {', '.join(bad)}")
+    return wanted
+
+
+@router.get("/quotes")
+def get_market_quotes(symbols: List[str] = Query(...)):
+    """
+    Latest quotes for any Yahoo symbols (repeat `symbols` or comma-separate).
+    Symbols are fetched concurrently; concurrent callers share one upstream
+    request per symbol.
+    """
+    return fetch_quotes(_parse_symbols(symbols))
+
+
+@router.get("/stream")
+async def stream_market_quotes(symbols: List[str] = Query(["^NSEI", "^BSESN"])):
+    """
+    Live quotes over Server-Sent Events (`quote` events).
+    All clients share one background poller per symbol; a poller stops when
+    its last client disconnects.
+    """
+    wanted = _parse_symbols(symbols)
+    queue = market_stream.subscribe(wanted)
+
+    async def events():
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=settings.market_poll_interval_seconds * 2)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: quote\ndata: {json.dumps(item)}\n\n"
+        finally:
+            market_stream.unsubscribe(wanted, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _epoch(d: Optional[date]) -> Optional[int]:
+    if d is None:
+        return None
+    return int(datetime.combine(d, time.min, tzinfo=timezone.utc).timestamp())
+
+
+@router.get("/history/{symbol}")
+def get_market_history(
+    symbol: str,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    interval: str = "daily",
+    fields: List[str] = Query(["close"]),
+):
+    """
+    Stored OHLCV bars for a symbol from the local history (no network).
+    `start` is inclusive, `end` exclusive; `interval` is daily, weekly or monthly.
+    """
+    if interval not in INTERVALS:
+        raise HTTPException(status_code=400, detail=f"interval must be one of {', '.join(INTERVALS)}")
+    wanted = [f.strip() for part in fields for f in part.split(",") if f.strip()]
+    bad = [f for f in wanted if f not in PRICE_FIELDS]
+    if bad:
+        raise HTTPException(status_code=400, detail=f"unknown field(s): {', '.join(bad)}")
+
+    if not _SYMBOL_RE.match(symbol):
+        raise HTTPException(status_code=400, detail=f"invalid symbol: {symbol}")
+
+    bars = history_store.downsample(symbol, interval, _epoch(start), _epoch(end))
+    out = {
+        "symbol": symbol,
+        "interval": interval,
+        "date": bars["ts"].astype("datetime64[s]").astype("datetime64[D]").astype(str).tolist(),
+    }
+    for f in wanted:
+        out[f] = bars[f].tolist()
+    return out
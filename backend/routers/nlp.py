@@ -1,6 +1,14 @@
 from fastapi import APIRouter, HTTPException
-from backend.schemas import ParseTextRequest, ParseTextResponse
-from backend.services.nlp import parse_goal_text
+from backend.schemas import (
+    ParseTextRequest,
+    ParseTextResponse,
+    ParseBatchRequest,
+    ParseBatchItem,
+    ParseBatchResponse,
+)
+from backend.services.nlp import parse_goal_text, parse_cache_stats, year_tier_stats
+from backend.services.nlp_batch import parse_goal_texts
+from backend.settings import settings
 
 router = APIRouter(prefix="/nlp", tags=["NLP"])
 
@@ -11,4 +19,41 @@ def parse_text(request: ParseTextRequest):
         event_name, today_cost, target_year = parse_goal_text(request.text)
         return ParseTextResponse(event_name=event_name, today_cost=today_cost, target_year=target_year)
     except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) 
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.post("/parse-batch", response_model=ParseBatchResponse)
+def parse_text_batch(request: ParseBatchRequest):
+    """
+    Parse many goal texts at once across the NLP process pool.
+    Items come back in input order, each with either a result or an error.
+    """
+    if len(request.texts) > settings.nlp_batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"batch too large: {len(request.texts)} > {settings.nlp_batch_max_items} items",
+        )
+
+    items = []
+    for i, (parsed, error) in enumerate(parse_goal_texts(request.texts)):
+        if parsed is None:
+            items.append(ParseBatchItem(index=i, error=error))
+        else:
+            event_name, today_cost, target_year = parsed
+            items.append(ParseBatchItem(
+                index=i,
+                result=ParseTextResponse(event_name=event_name, today_cost=today_cost, target_year=target_year),
+            ))
+    return ParseBatchResponse(items=items)
+
+
+@router.get("/cache-stats")
+def get_cache_stats():
+    """Hit/miss/eviction counters of the parse cache, for sizing NLP_CACHE_SIZE."""
+    return parse_cache_stats()
+
+
+@router.get("/year-tier-stats")
+def get_year_tier_stats():
+    """How many year extractions each tier (explicit/relative/month/dateparser/none) resolved."""
+    return year_tier_stats()
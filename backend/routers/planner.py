@@ -1,9 +1,32 @@
 
 
 # backend/routers/planner.py
-from fastapi import APIRouter, HTTPException
-from backend.services.planner import plan_event
-from backend.schemas import PlanRequest, PlanResponse, TextPlanRequest
+import csv
+import io
+import json
+from itertools import islice
+from typing import Iterator, List, Optional
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from backend.services import planner_batch, scenarios, simulation
+from backend.services.inflation import current_inflation, current_inflation_series
+from backend.services.planner import plan_event, plan_sip
+from backend.utils.finance import sip_schedule, years_until
+from backend.settings import settings
+from backend.schemas import (
+    PlanRequest,
+    PlanResponse,
+    ScenarioSweepRequest,
+    ScenarioSweepResponse,
+    SimulationRequest,
+    SimulationResponse,
+    SipPlanRequest,
+    SipPlanResponse,
+    SipScheduleRequest,
+    SweepRange,
+    TextPlanRequest,
+)
 from backend.services.nlp import parse_goal_text
 
 router = APIRouter(
@@ -16,7 +39,204 @@ def create_plan(request: PlanRequest):
     """
     Create a financial plan for an event.
     """
-    return plan_event(request.event_name, request.today_cost, request.target_year, request.inflation_override_pct)
+    return plan_event(
+        request.event_name, request.today_cost, request.target_year, request.inflation_override_pct,
+        inflation_avg_years=request.inflation_avg_years, inflation_curve_pct=request.inflation_curve_pct,
+    )
+
+def _batch_rows(body: bytes, content_type: str) -> planner_batch.BatchRows:
+    text = body.decode("utf-8-sig")
+    if "csv" in content_type:
+        return planner_batch.rows_from_csv(text)
+    try:
+        payload = json.loads(text or "null")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="body must be JSON or CSV (Content-Type: text/csv)")
+    items = payload.get("goals") if isinstance(payload, dict) else payload
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="expected a JSON list of goals or {\"goals\": [...]}")
+    return planner_batch.rows_from_json(items)
+
+@router.post("/batch")
+async def create_plan_batch(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    inflation_override_pct: Optional[float] = Query(None, ge=0, le=50),
+):
+    """
+    Plan many goals in one request.
+
+    The body is either JSON (a list of PlanRequest objects, or {"goals": [...]})
+    or CSV with an event_name,today_cost,target_year[,inflation_override_pct]
+    header. Results stream back in input order as NDJSON or CSV; invalid rows
+    get an `error` instead of failing the batch.
+    """
+    body = await request.body()
+    rows = await run_in_threadpool(_batch_rows, body, request.headers.get("content-type", ""))
+    if rows.total > settings.planner_batch_max_rows:
+        raise HTTPException(
+            status_code=413,
+            detail=f"batch too large: {rows.total} > {settings.planner_batch_max_rows} rows",
+        )
+    plans = await run_in_threadpool(planner_batch.plan_rows, rows, inflation_override_pct)
+
+    if format == "csv":
+        return StreamingResponse(planner_batch.iter_csv(rows, plans), media_type="text/csv")
+    return StreamingResponse(planner_batch.iter_ndjson(rows, plans), media_type="application/x-ndjson")
+
+def _sip_for(goal: SipPlanRequest) -> dict:
+    return plan_sip(
+        goal.event_name, goal.today_cost, goal.target_year, goal.expected_return_pct, goal.step_up_pct,
+        goal.inflation_override_pct, inflation_avg_years=goal.inflation_avg_years,
+        inflation_curve_pct=goal.inflation_curve_pct,
+    )
+
+@router.post("/sip", response_model=SipPlanResponse)
+def create_sip_plan(request: SipPlanRequest):
+    """
+    Plan a goal with a return-aware SIP: the first-year monthly instalment
+    that reaches the future cost at the expected return, with an optional
+    yearly step-up.
+    """
+    return _sip_for(request)
+
+SCHEDULE_FIELDS = ("goal_index", "event_name", "month", "date", "contribution", "growth", "total_invested", "balance")
+# Schedule rows written per chunk of the streamed response
+SCHEDULE_CHUNK_ROWS = 240
+
+def _schedule_rows(goals: List[SipPlanRequest]) -> Iterator[dict]:
+    for i, goal in enumerate(goals):
+        plan = _sip_for(goal)
+        months = plan["years_to_goal"] * 12
+        for row in sip_schedule(plan["monthly_sip"], goal.expected_return_pct, months, goal.step_up_pct):
+            yield {"goal_index": i, "event_name": goal.event_name, **row}
+
+def _schedule_chunks(goals: List[SipPlanRequest], fmt: str) -> Iterator[str]:
+    rows = _schedule_rows(goals)
+    if fmt == "csv":
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=SCHEDULE_FIELDS)
+        writer.writeheader()
+        yield buf.getvalue()
+    while True:
+        chunk = list(islice(rows, SCHEDULE_CHUNK_ROWS))
+        if not chunk:
+            return
+        if fmt == "csv":
+            buf.seek(0)
+            buf.truncate()
+            writer.writerows(chunk)
+            yield buf.getvalue()
+        else:
+            yield "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in chunk)
+
+@router.post("/sip/schedule")
+def stream_sip_schedule(
+    request: SipScheduleRequest,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+):
+    """
+    Month-by-month contribution and balance schedule for each goal's SIP,
+    streamed as NDJSON or CSV while it is generated.
+    """
+    if len(request.goals) > settings.sip_schedule_max_goals:
+        raise HTTPException(
+            status_code=413,
+            detail=f"too many goals: {len(request.goals)} > {settings.sip_schedule_max_goals}",
+        )
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(_schedule_chunks(request.goals, format), media_type=media_type)
+
+def _axis(values, name: str) -> list:
+    if isinstance(values, SweepRange):
+        if values.step > 0 and (values.stop - values.start) / values.step >= settings.scenario_max_cells:
+            raise HTTPException(status_code=413, detail=f"{name}: range has too many values")
+        try:
+            values = scenarios.expand_range(values.start, values.stop, values.step)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=f"{name}: {exc}")
+    if not values:
+        raise HTTPException(status_code=400, detail=f"{name} cannot be empty")
+    return values
+
+@router.post("/scenarios", response_model=ScenarioSweepResponse)
+def sweep_scenarios(request: ScenarioSweepRequest):
+    """
+    Future cost and monthly saving over a grid of inflation rates x target
+    years (and, optionally, the SIP needed for each expected return), in one
+    request instead of one /planner/ call per point.
+    """
+    inflation = _axis(request.inflation_pct, "inflation_pct")
+    years = [int(y) for y in _axis(request.target_years, "target_years")]
+    returns = _axis(request.expected_return_pct, "expected_return_pct") if request.expected_return_pct else None
+
+    cells = len(inflation) * len(years) * (len(returns) if returns else 1)
+    if cells > settings.scenario_max_cells:
+        raise HTTPException(
+            status_code=413,
+            detail=f"grid too large: {cells} > {settings.scenario_max_cells} cells",
+        )
+    return scenarios.sweep(request.today_cost, inflation, years, returns)
+
+@router.post("/simulate", response_model=SimulationResponse)
+def simulate_plan(request: SimulationRequest):
+    """
+    Monte Carlo projection of a goal: percentile future costs and the chance
+    that the monthly SIP reaches the goal. Pass `seed` to reproduce a run.
+    """
+    if request.paths and request.paths > settings.simulation_max_paths:
+        raise HTTPException(
+            status_code=413,
+            detail=f"too many paths: {request.paths} > {settings.simulation_max_paths}",
+        )
+    years = years_until(request.target_year)
+    if years > settings.simulation_max_years:
+        raise HTTPException(
+            status_code=422,
+            detail=f"horizon too long: {years} > {settings.simulation_max_years} years",
+        )
+    path_months = (request.paths or settings.simulation_default_paths) * years * 12
+    if path_months > settings.simulation_max_path_months:
+        raise HTTPException(
+            status_code=413,
+            detail=f"simulation too large: {path_months} > {settings.simulation_max_path_months} path-months",
+        )
+    return simulation.simulate_goal(
+        request.today_cost,
+        request.target_year,
+        monthly_sip=request.monthly_sip,
+        n_paths=request.paths,
+        seed=request.seed,
+        inflation_model=request.inflation_model,
+        return_model=request.return_model,
+        expected_return_pct=request.expected_return_pct,
+        return_volatility_pct=request.return_volatility_pct,
+    )
+
+@router.get("/inflation")
+def inflation_summary(
+    windows: List[int] = Query([3, 5, 10, 20]),
+    include_history: bool = False,
+):
+    """
+    Latest inflation plus rolling N-year averages from the World Bank series.
+    """
+    current = current_inflation()
+    series = current_inflation_series()
+    if series is None:
+        return {**current, "first_year": None, "last_year": None, "rolling_average_percent": {}}
+    body = {
+        **current,
+        "first_year": series.first_year,
+        "last_year": series.last_year,
+        "rolling_average_percent": {str(n): round(series.rolling_average(n), 4) for n in windows if n > 0},
+    }
+    if include_history:
+        body["history"] = [
+            {"year": series.first_year + i, "inflation_percent": float(rate)}
+            for i, rate in enumerate(series.rates)
+        ]
+    return body
 
 @router.post("/parse-and-plan", response_model=PlanResponse)
 def parse_and_plan(request: TextPlanRequest):
@@ -1,6 +1,6 @@
 # backend/schemas.py
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, confloat
+from typing import Dict, List, Literal, Optional, Union
 from datetime import datetime
 try:
     from pydantic import field_validator  # Pydantic v2
@@ -59,6 +59,31 @@ class GoalOut(GoalBase):
         from_attributes = True
 
 
+class GoalListItem(BaseModel):
+    """One goal in GET /goals; fields not selected via `fields` are omitted."""
+    id: int
+    event_name: Optional[str] = None
+    today_cost: Optional[float] = None
+    target_year: Optional[int] = None
+    calculation: Optional[CalculationOut] = None
+
+    class Config:
+        from_attributes = True
+
+
+class GoalImportError(BaseModel):
+    line: int  # 1-based line of the request body (the CSV header is line 1)
+    error: str
+
+
+class GoalImportResponse(BaseModel):
+    """Outcome of POST /goals/import; `errors` lists at most goal_import_max_errors rows."""
+    received: int
+    imported: int
+    failed: int
+    errors: List[GoalImportError]
+
+
 # -------------------------
 # NLP-related schemas
 # -------------------------
@@ -72,6 +97,20 @@ class ParseTextResponse(BaseModel):
     target_year: int
 
 
+class ParseBatchRequest(BaseModel):
+    texts: List[str] = Field(..., example=["Plan Goa trip Dec 2026 for 50k", "Wedding in 2027 for 8 lakhs"])
+
+
+class ParseBatchItem(BaseModel):
+    index: int
+    result: Optional[ParseTextResponse] = None
+    error: Optional[str] = None
+
+
+class ParseBatchResponse(BaseModel):
+    items: List[ParseBatchItem]
+
+
 # -------------------------
 # Planner-related schemas
 # -------------------------
@@ -80,6 +119,10 @@ class PlanRequest(BaseModel):
     today_cost: float = Field(..., gt=0, example=500000)
     target_year: int = Field(..., gt=2025, example=2030)
     inflation_override_pct: Optional[float] = Field(None, ge=0, le=50)
+    # Rolling average of the last N years of the World Bank series
+    inflation_avg_years: Optional[int] = Field(None, ge=1, le=80)
+    # Per-year rates (%) starting next year; the last one repeats
+    inflation_curve_pct: Optional[List[confloat(ge=-50, le=100)]] = Field(None, min_length=1, max_length=100)
 
     if field_validator:
         @field_validator("today_cost")
@@ -113,6 +156,110 @@ class PlanResponse(BaseModel):
     recommendation: Optional[str] = None
 
 
+class SipPlanRequest(PlanRequest):
+    expected_return_pct: float = Field(12.0, ge=-20, le=50)
+    # Raise the SIP by this much every 12 months
+    step_up_pct: float = Field(0.0, ge=0, le=50)
+
+
+class SipPlanResponse(PlanResponse):
+    expected_return_pct: float
+    step_up_pct: float
+    monthly_sip: float
+    final_monthly_sip: float
+    total_invested: float
+    returns_earned: float
+
+
+class SipScheduleRequest(BaseModel):
+    goals: List[SipPlanRequest] = Field(..., min_length=1)
+
+
+class SimulationRequest(BaseModel):
+    today_cost: float = Field(..., gt=0, example=1000000)
+    target_year: int = Field(..., example=2045)
+    # Defaults to the deterministic plan's monthly saving
+    monthly_sip: Optional[float] = Field(None, ge=0)
+    paths: Optional[int] = Field(None, ge=100)
+    seed: Optional[int] = Field(None, ge=0)
+    inflation_model: Literal["bootstrap", "parametric"] = "bootstrap"
+    return_model: Literal["bootstrap", "parametric"] = "parametric"
+    expected_return_pct: Optional[float] = Field(None, ge=-20, le=50)
+    return_volatility_pct: Optional[float] = Field(None, ge=0, le=100)
+
+    if field_validator:
+        @field_validator("target_year")
+        @classmethod
+        def _validate_simulation_year(cls, v: int):
+            if v < datetime.now().year:
+                raise ValueError("target_year cannot be in the past")
+            return v
+
+
+class SimulationResponse(BaseModel):
+    today_cost: float
+    target_year: int
+    years_to_goal: int
+    paths: int
+    seed: int
+    inflation_model: str
+    return_model: str
+    monthly_sip: float
+    deterministic_future_cost: float
+    future_cost_percentiles: Dict[str, float]
+    corpus_percentiles: Dict[str, float]
+    probability_of_reaching_goal: float
+    elapsed_ms: float
+
+
+class SweepRange(BaseModel):
+    """Inclusive range: start, start + step, ... up to stop."""
+    start: float
+    stop: float
+    step: float = Field(..., gt=0)
+
+
+def _check_axis_bounds(values: Union[List[float], SweepRange], low: float, high: float):
+    """Every axis value within [low, high]; a range only needs its ends checked."""
+    points = [values.start, values.stop] if isinstance(values, SweepRange) else values
+    if not all(low <= v <= high for v in points):
+        raise ValueError(f"values must be between {low} and {high}")
+    return values
+
+
+class ScenarioSweepRequest(BaseModel):
+    today_cost: float = Field(..., gt=0, example=500000)
+    # Each axis is an explicit list or a {start, stop, step} range
+    inflation_pct: Union[List[float], SweepRange] = Field(..., example={"start": 3, "stop": 10, "step": 0.5})
+    target_years: Union[List[int], SweepRange] = Field(..., example=[2030, 2035, 2040])
+    expected_return_pct: Optional[Union[List[float], SweepRange]] = None
+
+    if field_validator:
+        # Same bounds as PlanRequest.inflation_override_pct and SipPlanRequest.expected_return_pct
+        @field_validator("inflation_pct")
+        @classmethod
+        def _validate_sweep_inflation(cls, v):
+            return _check_axis_bounds(v, 0, 50)
+
+        @field_validator("expected_return_pct")
+        @classmethod
+        def _validate_sweep_returns(cls, v):
+            return v if v is None else _check_axis_bounds(v, -20, 50)
+
+
+class ScenarioSweepResponse(BaseModel):
+    today_cost: float
+    inflation_pct: List[float]
+    target_years: List[int]
+    years_to_goal: List[int]
+    # [inflation][year]
+    future_cost: List[List[float]]
+    monthly_saving_needed: List[List[float]]
+    expected_return_pct: Optional[List[float]] = None
+    # [return][inflation][year], SIP invested at the start of each month
+    monthly_sip: Optional[List[List[List[float]]]] = None
+
+
 # -------------------------
 # Agent/Chat schemas
 # -------------------------
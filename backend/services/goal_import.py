@@ -0,0 +1,232 @@
+# backend/services/goal_import.py
+"""Bulk goal import for POST /goals/import.
+
+The body (JSON lines or CSV) is read as a stream and handled a chunk of lines
+at a time: rows are validated and planned with planner_batch's vectorized
+math, then goals and calculations go in with two executemany INSERTs and one
+commit per chunk. Invalid rows, and the rows of a chunk the database rejects,
+are reported by 1-based line number instead of failing the import.
+"""
+import codecs
+import csv
+import json
+from collections import defaultdict
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from backend import models
+from backend.services.planner import _get_inflation_percent
+from backend.services.planner_batch import BatchRows, _build_rows, compute_plans
+from backend.services.recompute import calculation_stamp
+from backend.settings import settings
+
+REQUIRED_COLUMNS = ("event_name", "today_cost", "target_year")
+
+_goals = models.Goal.__table__
+_calculations = models.Calculation.__table__
+
+# On SQLite goal ids are assigned up front (max id + 1 ...) inside a BEGIN
+# IMMEDIATE transaction, so calculations can point at them without a
+# round-trip per row; rowid tables would pick the same ids. SQLAlchemy 1.4
+# has no RETURNING for SQLite. Other databases assign the ids themselves
+# and hand them back with RETURNING.
+_NEXT_GOAL_ID = select(func.coalesce(func.max(models.Goal.id), 0) + 1)
+_BEGIN_IMMEDIATE = text("BEGIN IMMEDIATE")
+_GOAL_KEY = ("event_name", "today_cost", "target_year")
+
+Plans = Dict[str, np.ndarray]
+WriteChunk = Callable[[BatchRows, Plans], Awaitable[None]]
+
+
+async def iter_line_chunks(stream: AsyncIterator[bytes], size: int) -> AsyncIterator[Tuple[List[int], List[str]]]:
+    """Non-blank lines of a UTF-8 byte stream with their 1-based line numbers, `size` at a time."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    line_no = 0
+    numbers: List[int] = []
+    lines: List[str] = []
+    async for data in stream:
+        pending += decoder.decode(data)
+        *complete, pending = pending.split("\n")
+        for line in complete:
+            line_no += 1
+            if line.strip():
+                numbers.append(line_no)
+                lines.append(line.rstrip("\r"))
+                if len(lines) >= size:
+                    yield numbers, lines
+                    numbers, lines = [], []
+    pending += decoder.decode(b"", final=True)
+    if pending.strip():
+        numbers.append(line_no + 1)
+        lines.append(pending.rstrip("\r"))
+    if lines:
+        yield numbers, lines
+
+
+def csv_header(line: str) -> List[str]:
+    fieldnames = [name.strip() for name in next(csv.reader([line]))]
+    missing = [name for name in REQUIRED_COLUMNS if name not in fieldnames]
+    if missing:
+        raise ValueError(f"CSV header is missing: {', '.join(missing)}")
+    return fieldnames
+
+
+def _goal_fields(raw: Iterable[dict]) -> Iterable[dict]:
+    """Rows without inflation_override_pct: POST /goals/ has no override, so
+    imports neither use nor validate one."""
+    for row in raw:
+        row.pop("inflation_override_pct", None)
+        yield row
+
+
+def rows_from_ndjson_lines(lines: List[str]) -> BatchRows:
+    raw, bad = [], {}
+    for i, line in enumerate(lines):
+        try:
+            item = json.loads(line)
+        except ValueError:
+            bad[i], item = "invalid JSON", {}
+        if not isinstance(item, dict):
+            bad[i], item = "each line must be a JSON object", {}
+        raw.append(item)
+    rows = _build_rows(_goal_fields(raw))
+    rows.errors.update(bad)
+    return rows
+
+
+def rows_from_csv_lines(lines: List[str], fieldnames: List[str]) -> BatchRows:
+    return _build_rows(_goal_fields(csv.DictReader(lines, fieldnames=fieldnames)))
+
+
+def goal_params(rows: BatchRows) -> List[dict]:
+    """executemany parameters for the goals of one chunk (ids not set)."""
+    return [
+        {"event_name": name, "today_cost": cost, "target_year": year}
+        for name, cost, year in zip(rows.event_names, rows.today_costs.tolist(), rows.target_years.tolist())
+    ]
+
+
+def calculation_params(plans: Plans, goal_ids: Sequence[int]) -> List[dict]:
+    """executemany parameters for the calculations of one chunk, in goal order."""
+    stamp = calculation_stamp(plans["inflation_percent_used"][0]) if len(goal_ids) else {}  # one rate per import
+    return [
+        {"goal_id": goal_id, "future_cost": future, "monthly_saving": monthly, **stamp}
+        for goal_id, future, monthly in zip(goal_ids, plans["future_cost"].tolist(), plans["monthly_saving_needed"].tolist())
+    ]
+
+
+def _insert_goals_returning(goals: List[dict]):
+    return insert(_goals).values(goals).returning(_goals.c.id, *(_goals.c[name] for name in _GOAL_KEY))
+
+
+def _ids_in_input_order(returned, goals: List[dict]) -> List[int]:
+    """Match RETURNING rows (in no guaranteed order) back to `goals`. Rows with
+    equal inputs get equal calculations, so which of them gets which id is moot."""
+    ids = defaultdict(list)
+    for goal_id, *key in returned:
+        ids[tuple(key)].append(goal_id)
+    return [ids[tuple(goal[name] for name in _GOAL_KEY)].pop() for goal in goals]
+
+
+def write_chunk(db: Session, rows: BatchRows, plans: Plans) -> None:
+    """Insert one chunk in its own transaction (run in a worker thread)."""
+    goals = goal_params(rows)
+    try:
+        if db.bind.dialect.name == "sqlite":
+            # take the write lock before reading max(id), so no other writer can
+            # claim those ids (or invalidate our snapshot) before the INSERT
+            db.execute(_BEGIN_IMMEDIATE)
+            first_id = db.execute(_NEXT_GOAL_ID).scalar_one()
+            goal_ids = range(first_id, first_id + len(goals))
+            db.execute(insert(_goals), [dict(goal, id=goal_id) for goal, goal_id in zip(goals, goal_ids)])
+        else:
+            goal_ids = _ids_in_input_order(db.execute(_insert_goals_returning(goals)).all(), goals)
+        db.execute(insert(_calculations), calculation_params(plans, goal_ids))
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        raise
+
+
+async def write_chunk_async(db: AsyncSession, rows: BatchRows, plans: Plans) -> None:
+    """write_chunk for the async router."""
+    goals = goal_params(rows)
+    try:
+        if db.bind.dialect.name == "sqlite":
+            await db.execute(_BEGIN_IMMEDIATE)
+            first_id = (await db.execute(_NEXT_GOAL_ID)).scalar_one()
+            goal_ids = range(first_id, first_id + len(goals))
+            await db.execute(insert(_goals), [dict(goal, id=goal_id) for goal, goal_id in zip(goals, goal_ids)])
+        else:
+            goal_ids = _ids_in_input_order((await db.execute(_insert_goals_returning(goals))).all(), goals)
+        await db.execute(insert(_calculations), calculation_params(plans, goal_ids))
+        await db.commit()
+    except SQLAlchemyError:
+        await db.rollback()
+        raise
+
+
+class ImportReport:
+    def __init__(self, max_errors: int):
+        self.received = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[dict] = []
+        self.max_errors = max_errors
+
+    def error(self, line: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "error": message})
+
+    def add_chunk(self, rows: BatchRows, line_numbers: List[int], db_error: Optional[str] = None) -> None:
+        failed = dict(rows.errors)
+        if db_error is not None:
+            failed.update((int(i), db_error) for i in rows.indices.tolist())
+        for i in sorted(failed):
+            self.error(line_numbers[i], failed[i])
+        self.imported += rows.total - len(failed)
+        self.received += rows.total
+
+    def as_dict(self) -> dict:
+        return {"received": self.received, "imported": self.imported, "failed": self.failed, "errors": self.errors}
+
+
+def _prepare(lines: List[str], fieldnames: Optional[List[str]], inflation_pct: float) -> Tuple[BatchRows, Plans]:
+    rows = rows_from_ndjson_lines(lines) if fieldnames is None else rows_from_csv_lines(lines, fieldnames)
+    return rows, compute_plans(rows.today_costs, rows.target_years, inflation_pct)
+
+
+async def import_stream(stream: AsyncIterator[bytes], content_type: str, write: WriteChunk) -> dict:
+    """Import every row of `stream`; CSV when content_type says so, else JSON lines.
+
+    Raises ValueError (before anything is written) for a bad CSV header.
+    """
+    is_csv = "csv" in content_type
+    fieldnames: Optional[List[str]] = None
+    inflation_pct: Optional[float] = None
+    report = ImportReport(settings.goal_import_max_errors)
+    async for line_numbers, lines in iter_line_chunks(stream, settings.goal_import_chunk_rows):
+        if is_csv and fieldnames is None:
+            fieldnames = csv_header(lines.pop(0))
+            line_numbers.pop(0)
+            if not lines:
+                continue
+        if inflation_pct is None:
+            inflation_pct = await run_in_threadpool(_get_inflation_percent)  # once per import
+        rows, plans = await run_in_threadpool(_prepare, lines, fieldnames, inflation_pct)
+        db_error = None
+        if len(rows.indices):
+            try:
+                await write(rows, plans)
+            except SQLAlchemyError as exc:
+                db_error = f"chunk not saved: {exc.__class__.__name__}"
+        report.add_chunk(rows, line_numbers, db_error)
+    return report.as_dict()
@@ -0,0 +1,80 @@
+# backend/services/goal_queries.py
+"""Listing queries for /goals, shared by the sync and async routers.
+
+Pages are keyset-based: ordered by id and resumed with `id > after_id`, so
+every page is an index range scan however deep it is. The event_name and
+target_year equality filters are served by their indexes (SQLite appends the
+rowid, i.e. goals.id, to each index, so filter + ORDER BY id needs no sort).
+
+event_name_prefix is the exception: its range comes out of the index in name
+order, so SQLite reads every matching row and sorts them by id in a temp
+B-tree before the LIMIT applies. Each page therefore costs in proportion to
+the number of matching goals, not the page size (about 110 ms for 500k
+matches); it stays cheap for selective prefixes.
+"""
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, load_only
+
+from backend import models
+
+GOAL_FIELDS = ("id", "event_name", "today_cost", "target_year", "calculation")
+# Largest code point, so `prefix + _PREFIX_END` bounds every string starting with `prefix`
+_PREFIX_END = "\U0010ffff"
+
+
+def parse_fields(fields: Optional[Iterable[str]]) -> Set[str]:
+    """Requested output fields ("a,b" and repeated params both work); all by default."""
+    if not fields:
+        return set(GOAL_FIELDS)
+    requested = {f.strip() for value in fields for f in value.split(",") if f.strip()}
+    unknown = requested - set(GOAL_FIELDS)
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(sorted(unknown))}; choose from {', '.join(GOAL_FIELDS)}")
+    return requested | {"id"}  # the cursor needs the id
+
+
+def list_goals_statement(
+    fields: Set[str],
+    limit: int,
+    after_id: Optional[int] = None,
+    target_year: Optional[int] = None,
+    event_name: Optional[str] = None,
+    event_name_prefix: Optional[str] = None,
+):
+    """SELECT for one page; fetches limit + 1 rows to tell whether more follow."""
+    stmt = select(models.Goal)
+    if "calculation" in fields:
+        stmt = stmt.options(joinedload(models.Goal.calculation))
+    else:
+        # no join, and only the requested columns
+        columns = [getattr(models.Goal, f) for f in GOAL_FIELDS if f in fields and f not in ("id", "calculation")]
+        stmt = stmt.options(load_only(*columns)) if columns else stmt.options(load_only(models.Goal.id))
+    if after_id is not None:
+        stmt = stmt.where(models.Goal.id > after_id)
+    if target_year is not None:
+        stmt = stmt.where(models.Goal.target_year == target_year)
+    if event_name is not None:
+        stmt = stmt.where(models.Goal.event_name == event_name)
+    if event_name_prefix:
+        # a range, not LIKE, so the event_name index is used; the matches
+        # still need a sort by id (see the module docstring)
+        stmt = stmt.where(
+            models.Goal.event_name >= event_name_prefix,
+            models.Goal.event_name < event_name_prefix + _PREFIX_END,
+        )
+    return stmt.order_by(models.Goal.id).limit(limit + 1)
+
+
+def page(goals: Sequence[models.Goal], fields: Set[str], limit: int) -> Tuple[List[dict], Optional[int]]:
+    """Serializable items for one page plus the cursor of the next (None at the end)."""
+    has_more = len(goals) > limit
+    goals = goals[:limit]
+    items = []
+    for goal in goals:
+        item = {f: getattr(goal, f) for f in GOAL_FIELDS if f in fields and f != "calculation"}
+        if "calculation" in fields:
+            item["calculation"] = goal.calculation
+        items.append(item)
+    return items, (goals[-1].id if has_more and goals else None)
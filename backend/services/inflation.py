@@ -1,12 +1,17 @@
-import json
+import threading
+import time
 import requests
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Optional, Tuple
+from backend.logging_config import logger
 from backend.settings import settings
+from backend.utils.inflation_series import InflationSeries
 
 CACHE_DIR = Path(".cache")
 CACHE_DIR.mkdir(exist_ok=True)
-CACHE_FILE = CACHE_DIR / "worldbank_inflation.json"
+# Full annual series in the compact binary format of InflationSeries.save
+SERIES_CACHE_FILE = CACHE_DIR / "worldbank_inflation_series.npy"
 
 
 def _is_cache_valid(file_path: Path, ttl_seconds: int) -> bool:
@@ -16,41 +21,144 @@ def _is_cache_valid(file_path: Path, ttl_seconds: int) -> bool:
     return (datetime.now(timezone.utc) - modified_time) < timedelta(seconds=ttl_seconds)
 
 
-def fetch_worldbank_inflation() -> dict:
-    """Fetch latest inflation data for India from World Bank API with simple cache."""
-    if _is_cache_valid(CACHE_FILE, settings.cache_ttl_inflation_seconds):
-        try:
-            with open(CACHE_FILE, "r", encoding="utf-8") as f:
-                cached = json.load(f)
-                if "inflation_percent" in cached:
-                    return {"inflation_percent": float(cached["inflation_percent"])}
-        except Exception:
-            pass
+def _load_series_cache() -> Optional[InflationSeries]:
+    try:
+        return InflationSeries.load(SERIES_CACHE_FILE)
+    except Exception:
+        return None
+
+
+def fetch_worldbank_series() -> Tuple[Optional[InflationSeries], str]:
+    """Full annual inflation series for India as (series, source).
+
+    Served from the binary disk cache while fresh; otherwise fetched from the
+    World Bank (every year in one page) and re-cached. If the API is down an
+    expired cache is still better than nothing.
+    """
+    if _is_cache_valid(SERIES_CACHE_FILE, settings.cache_ttl_inflation_seconds):
+        series = _load_series_cache()
+        if series is not None:
+            return series, "cache"
 
     try:
         # Use full endpoint from settings (README/.env.example)
-        response = requests.get(settings.world_bank_base_url, timeout=15)
+        response = requests.get(
+            settings.world_bank_base_url,
+            params={"per_page": settings.world_bank_per_page},
+            timeout=15,
+        )
         response.raise_for_status()
         data = response.json()
 
-        if isinstance(data, list) and len(data) > 1:
-            records = data[1]
-            latest = next((r for r in records if r.get("value") is not None), None)
-            if latest:
-                payload = {
-                    "source": "worldbank",
-                    "inflation_percent": float(latest["value"]),
-                    "year": int(latest["date"]),
-                    "fetched_at": datetime.now(timezone.utc).isoformat(),
-                }
-                try:
-                    with open(CACHE_FILE, "w", encoding="utf-8") as f:
-                        json.dump(payload, f, ensure_ascii=False, indent=2)
-                except Exception:
-                    pass
-                return {"inflation_percent": payload["inflation_percent"]}
+        if isinstance(data, list) and len(data) > 1 and data[1]:
+            series = InflationSeries.from_records(data[1])
+            try:
+                series.save(SERIES_CACHE_FILE)
+            except Exception:
+                pass
+            return series, "worldbank"
     except Exception:
         pass
 
+    if SERIES_CACHE_FILE.exists():
+        series = _load_series_cache()
+        if series is not None:
+            return series, "stale-cache"
+    return None, "fallback"
+
+
+def fetch_worldbank_inflation() -> dict:
+    """Fetch latest inflation data for India from World Bank API with simple cache."""
+    series, source = fetch_worldbank_series()
+    if series is not None:
+        return {"inflation_percent": series.latest_rate, "source": source, "series": series}
+
     # fallback
-    return {"inflation_percent": float(settings.fallback_inflation)}
+    return {"inflation_percent": float(settings.fallback_inflation), "source": "fallback", "series": None}
+
+
+# In-memory provider: the value is loaded once and then served from memory.
+# When cache_ttl_inflation_seconds expires, one background thread refreshes it
+# while callers keep getting the current value, so planning never waits on
+# disk or the World Bank.
+_lock = threading.Lock()
+_init_lock = threading.Lock()  # concurrent cold callers share one load
+_current: Optional[dict] = None  # {"inflation_percent", "source", "series", "loaded_at"}
+_refreshing = False
+
+
+def _load() -> dict:
+    data = fetch_worldbank_inflation()
+    with _lock:
+        previous = _current
+    if data.get("source") == "fallback" and previous is not None and previous["source"] != "fallback":
+        logger.warning("Inflation refresh failed; keeping %.2f%% from %s", previous["inflation_percent"], previous["source"])
+        data = {**previous}
+    return {**data, "loaded_at": time.monotonic()}
+
+
+def _background_refresh() -> None:
+    global _current, _refreshing
+    try:
+        loaded = _load()
+        with _lock:
+            _current = loaded
+    except Exception as exc:
+        logger.warning("Inflation refresh failed: %s", exc)
+    finally:
+        with _lock:
+            _refreshing = False
+
+
+def _ttl_for(entry: dict) -> float:
+    # Retry a fallback value sooner than a real one.
+    if entry["source"] == "fallback":
+        return min(settings.inflation_retry_seconds, settings.cache_ttl_inflation_seconds)
+    return settings.cache_ttl_inflation_seconds
+
+
+def current_inflation() -> dict:
+    """Latest inflation as {"inflation_percent", "source"} from memory.
+
+    Only the very first call in a process loads synchronously (the app warms
+    this at startup); afterwards expiry triggers a single background refresh.
+    """
+    global _current, _refreshing
+    with _lock:
+        entry = _current
+        if entry is not None:
+            expired = time.monotonic() - entry["loaded_at"] >= _ttl_for(entry)
+            if expired and not _refreshing:
+                _refreshing = True
+                threading.Thread(target=_background_refresh, name="inflation-refresh", daemon=True).start()
+            return {"inflation_percent": entry["inflation_percent"], "source": entry["source"]}
+
+    with _init_lock:
+        with _lock:
+            entry = _current
+        if entry is None:
+            entry = _load()
+            with _lock:
+                _current = entry
+    return {"inflation_percent": entry["inflation_percent"], "source": entry["source"]}
+
+
+def current_inflation_series() -> Optional[InflationSeries]:
+    """The full historical series behind current_inflation(), if one loaded."""
+    current_inflation()
+    with _lock:
+        return _current.get("series") if _current is not None else None
+
+
+def warm_inflation() -> None:
+    try:
+        current_inflation()
+    except Exception as exc:
+        logger.warning("Inflation warm-up failed: %s", exc)
+
+
+def reset_inflation_provider() -> None:
+    global _current, _refreshing
+    with _lock:
+        _current = None
+        _refreshing = False
@@ -1,42 +1,246 @@
 # backend/services/market.py
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from backend.logging_config import logger
+from backend.services.price_history import bars_from_chart, history_store
 from backend.settings import settings
+from backend.utils.circuit_breaker import CircuitBreaker, get_breaker
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+FALLBACK_QUOTE = {"symbol": "N/A", "last_price": 0, "currency": "INR"}
+NOT_FOUND_QUOTE = {**FALLBACK_QUOTE, "error": "symbol not found"}
+
+# One keep-alive session for all Yahoo calls instead of a new connection per request.
+_session = requests.Session()
+_session.headers.update(HEADERS)
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=settings.market_max_workers))
+_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=settings.market_max_workers))
+
+_executor = ThreadPoolExecutor(max_workers=settings.market_max_workers, thread_name_prefix="market")
+
+
+def index_urls() -> Dict[str, str]:
+    """Configured indices, keyed by the name used in the summary."""
+    return {
+        "NIFTY_50": settings.yf_nifty_url,
+        "SENSEX": settings.yf_sensex_url,
+    }
+
+
+def yahoo_breaker() -> CircuitBreaker:
+    return get_breaker(
+        "yahoo_finance",
+        failure_threshold=settings.yahoo_breaker_failure_threshold,
+        cooldown_seconds=settings.yahoo_breaker_cooldown_seconds,
+    )
+
+
+def _record_history(symbol: str, result: dict) -> None:
+    """Append the chart's bars to the local history; never fails the quote."""
+    try:
+        history_store.append(symbol, bars_from_chart(result))
+    except Exception as e:
+        logger.warning("Could not record price history for %s: %s", symbol, e)
+
+
+def _counts_as_outage(status_code: int) -> bool:
+    """Statuses that say Yahoo itself is unwell (or throttling us), not the symbol."""
+    return status_code >= 500 or status_code == 429
+
 
 def fetch_yahoo_index(url: str) -> dict:
-    """Fetch latest market index data from Yahoo Finance."""
+    """Fetch latest market index data from Yahoo Finance.
+
+    Fails fast with the fallback quote while the Yahoo circuit is open. Only
+    transport errors, timeouts, 429 and 5xx count against the circuit; a 4xx
+    or empty chart is a per-symbol NOT_FOUND_QUOTE, so bad symbols from one
+    client cannot cut everyone off.
+    """
+    breaker = yahoo_breaker()
+    if not breaker.allow():
+        return dict(FALLBACK_QUOTE)
+
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        response = _session.get(url, timeout=settings.market_timeout_seconds)
+    except requests.exceptions.RequestException as e:
+        logger.warning("Request error fetching Yahoo Finance data: %s", e)
+        breaker.record_failure()
+        return dict(FALLBACK_QUOTE)
 
-        if not data.get("chart", {}).get("result"):
-            print(f"⚠️ Unexpected API response format: {data}")
-            return {}
+    if _counts_as_outage(response.status_code):
+        logger.warning("Yahoo Finance answered %s for %s", response.status_code, url)
+        breaker.record_failure()
+        return dict(FALLBACK_QUOTE)
 
-        result = data["chart"]["result"][0]
-        meta = result.get("meta", {})
+    # Yahoo answered, so the upstream is healthy even if this symbol is not.
+    breaker.record_success()
+    if response.status_code >= 400:
+        return dict(NOT_FOUND_QUOTE)
 
+    try:
+        data = response.json()
+        results = (data.get("chart") or {}).get("result")
+        if not results:
+            return dict(NOT_FOUND_QUOTE)
+
+        result = results[0]
+        meta = result.get("meta", {})
         if not all(key in meta for key in ["symbol", "regularMarketPrice", "currency"]):
-            print(f"⚠️ Missing required fields in API response: {meta}")
-            return {}
+            logger.warning("Missing required fields in Yahoo Finance response: %s", meta)
+            return dict(NOT_FOUND_QUOTE)
+    except (ValueError, KeyError, IndexError, AttributeError) as e:
+        logger.warning("Error parsing Yahoo Finance response: %s", e)
+        return dict(FALLBACK_QUOTE)
 
-        return {
-            "symbol": meta["symbol"],
-            "last_price": meta["regularMarketPrice"],
-            "currency": meta["currency"]
+    _record_history(meta["symbol"], result)
+    return {
+        "symbol": meta["symbol"],
+        "last_price": meta["regularMarketPrice"],
+        "currency": meta["currency"]
+    }
+
+
+# Last good quote per URL -> (quote, fetched_at epoch seconds). Served fresh
+# for cache_ttl_market_seconds, then served stale while a background refresh
+# runs; a failed refresh keeps the previous quote.
+_quote_cache: Dict[str, Tuple[dict, float]] = {}
+# Upstream requests currently running, per URL (single-flight): concurrent
+# callers for the same URL wait on the same Future instead of calling Yahoo.
+_inflight: Dict[str, Future] = {}
+# URLs Yahoo reported as unknown -> epoch seconds until which that answer is
+# reused without asking again (market_not_found_ttl_seconds).
+_not_found: Dict[str, float] = {}
+_cache_lock = threading.Lock()
+
+
+def _is_good_quote(quote: dict) -> bool:
+    return bool(quote) and quote.get("symbol") != "N/A" and bool(quote.get("last_price"))
+
+
+def _is_known_missing(url: str, now: float) -> bool:
+    """Whether `url` is negatively cached; call with _cache_lock held."""
+    return _not_found.get(url, 0) > now
+
+
+def _fetch_single_flight(url: str) -> dict:
+    with _cache_lock:
+        if _is_known_missing(url, time.time()):
+            return dict(NOT_FOUND_QUOTE)
+        future = _inflight.get(url)
+        owner = future is None
+        if owner:
+            future = _inflight[url] = Future()
+
+    if not owner:
+        return future.result()
+
+    try:
+        quote = fetch_yahoo_index(url)
+        if _is_good_quote(quote):
+            with _cache_lock:
+                _quote_cache[url] = (quote, time.time())
+                _not_found.pop(url, None)
+        elif quote.get("error") == NOT_FOUND_QUOTE["error"]:
+            with _cache_lock:
+                _not_found[url] = time.time() + settings.market_not_found_ttl_seconds
+        else:
+            logger.warning("Market fetch failed for %s", url)
+        future.set_result(quote)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        with _cache_lock:
+            _inflight.pop(url, None)
+    return quote
+
+
+def fetch_indices(urls: Dict[str, str]) -> Dict[str, dict]:
+    """Fetch several indices concurrently; latency is bounded by the slowest one."""
+    futures = {name: _executor.submit(_fetch_single_flight, url) for name, url in urls.items()}
+    return {name: f.result() for name, f in futures.items()}
+
+
+def _with_age(quote: dict, fetched_at: Optional[float], now: float) -> dict:
+    if fetched_at is None:
+        return {**quote, "fetched_at": None, "age_seconds": None}
+    return {
+        **quote,
+        "fetched_at": datetime.fromtimestamp(fetched_at, tz=timezone.utc).isoformat(),
+        "age_seconds": round(now - fetched_at, 1),
+    }
+
+
+def clear_market_cache() -> None:
+    with _cache_lock:
+        _quote_cache.clear()
+        _not_found.clear()
+
+
+def cached_quotes(urls: Dict[str, str]) -> Dict[str, dict]:
+    """Quotes for `urls` (name -> url) with stale-while-revalidate caching."""
+    ttl = settings.cache_ttl_market_seconds
+    now = time.time()
+    with _cache_lock:
+        missing = {
+            name: url for name, url in urls.items()
+            if url not in _quote_cache and not _is_known_missing(url, now)
+        }
+        stale = {
+            url for url in urls.values()
+            if url in _quote_cache and now - _quote_cache[url][1] >= ttl and url not in _inflight
         }
 
-    except requests.exceptions.RequestException as e:
-        print(f"⚠️ Request error fetching Yahoo Finance data: {e}")
-    except (ValueError, KeyError, IndexError) as e:
-        print(f"⚠️ Error parsing Yahoo Finance response: {e}")
-    except Exception as e:
-        print(f"⚠️ Unexpected error in fetch_yahoo_index: {e}")
-    
-    return {"symbol": "N/A", "last_price": 0, "currency": "INR"}
+    for url in stale:
+        _executor.submit(_fetch_single_flight, url)  # refresh in the background
+
+    # Nothing cached yet for these: fetch inline (still single-flight).
+    fetched = fetch_indices(missing) if missing else {}
+
+    now = time.time()
+    with _cache_lock:
+        summary = {}
+        for name, url in urls.items():
+            if url in _quote_cache:
+                quote, fetched_at = _quote_cache[url]
+                summary[name] = _with_age(quote, fetched_at, now)
+            elif _is_known_missing(url, now):
+                summary[name] = _with_age(NOT_FOUND_QUOTE, None, now)
+            else:
+                summary[name] = _with_age(fetched.get(name) or FALLBACK_QUOTE, None, now)
+    return summary
+
+
+def quote_url(symbol: str) -> str:
+    return settings.yf_chart_url_template.format(symbol=quote(symbol, safe=""))
+
+
+def refresh_quote(symbol: str) -> dict:
+    """Fetch `symbol` upstream now (bypassing the TTL, still single-flight)."""
+    url = quote_url(symbol)
+    fetched = _fetch_single_flight(url)
+    with _cache_lock:
+        cached = _quote_cache.get(url)
+    if cached is None:
+        return _with_age(fetched, None, time.time())
+    return _with_age(cached[0], cached[1], time.time())
+
+
+def fetch_quotes(symbols: List[str]) -> Dict[str, dict]:
+    """Quotes for arbitrary Yahoo symbols, keyed by symbol (cached, single-flight)."""
+    return cached_quotes({symbol: quote_url(symbol) for symbol in symbols})
+
 
 def fetch_index_summary() -> dict:
     """
@@ -49,7 +253,13 @@ def fetch_index_summary() -> dict:
             "SENSEX": {"symbol": "^BSESN", "last_price": 74000.3, "currency": "INR"},
         }
 
-    return {
-        "NIFTY_50": fetch_yahoo_index(settings.yf_nifty_url),
-        "SENSEX": fetch_yahoo_index(settings.yf_sensex_url),
-    }
+    return cached_quotes(index_urls())
+
+
+def backfill_history(symbol: str, range_: str = "max") -> int:
+    """Load up to `range_` of daily bars for `symbol` into the history store."""
+    url = settings.yf_history_url_template.format(symbol=quote(symbol, safe=""), range=range_)
+    response = _session.get(url, timeout=settings.market_timeout_seconds * 3)
+    response.raise_for_status()
+    result = response.json()["chart"]["result"][0]
+    return history_store.append(symbol, bars_from_chart(result))
@@ -0,0 +1,91 @@
+# backend/services/market_stream.py
+"""Shared per-symbol quote pollers with fan-out to streaming subscribers.
+
+Each symbol with at least one subscriber has exactly one poller task that
+refreshes the quote every `market_poll_interval_seconds` and pushes it to
+every subscriber queue, so upstream load grows with symbols, not clients.
+A poller exits once its last subscriber is gone.
+"""
+import asyncio
+from typing import Dict, List, Optional, Set
+
+from backend.logging_config import logger
+from backend.services.market import refresh_quote
+from backend.settings import settings
+
+
+class _SymbolPoller:
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.latest: Optional[dict] = None
+        self.polls = 0
+        self.task: Optional[asyncio.Task] = None
+
+    def publish(self, quote: dict) -> None:
+        self.latest = quote
+        for queue in self.subscribers:
+            _offer(queue, {"symbol": self.symbol, "quote": quote})
+
+    async def run(self) -> None:
+        try:
+            while self.subscribers:
+                try:
+                    quote = await asyncio.to_thread(refresh_quote, self.symbol)
+                    self.polls += 1
+                    if self.latest is None or quote.get("last_price") != self.latest.get("last_price"):
+                        self.publish(quote)
+                except Exception as e:
+                    logger.warning("Market poll failed for %s: %s", self.symbol, e)
+                await asyncio.sleep(settings.market_poll_interval_seconds)
+        finally:
+            if _pollers.get(self.symbol) is self:
+                del _pollers[self.symbol]
+            logger.info("Market poller for %s stopped", self.symbol)
+
+
+_pollers: Dict[str, _SymbolPoller] = {}
+
+
+def _offer(queue: asyncio.Queue, item: dict) -> None:
+    """Put without blocking; a slow subscriber only ever misses stale updates."""
+    if queue.full():
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+    queue.put_nowait(item)
+
+
+def subscribe(symbols: List[str]) -> asyncio.Queue:
+    """Register a subscriber for `symbols`, starting pollers as needed.
+
+    Must be called from the event loop. The queue receives
+    {"symbol": ..., "quote": ...} dicts, starting with the latest known quote.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2 * max(1, len(symbols)))
+    for symbol in symbols:
+        poller = _pollers.get(symbol)
+        if poller is None:
+            poller = _pollers[symbol] = _SymbolPoller(symbol)
+        poller.subscribers.add(queue)
+        if poller.task is None or poller.task.done():
+            poller.task = asyncio.create_task(poller.run(), name=f"market-poll-{symbol}")
+            logger.info("Market poller for %s started", symbol)
+        elif poller.latest is not None:
+            _offer(queue, {"symbol": symbol, "quote": poller.latest})
+    return queue
+
+
+def unsubscribe(symbols: List[str], queue: asyncio.Queue) -> None:
+    for symbol in symbols:
+        poller = _pollers.get(symbol)
+        if poller is not None:
+            poller.subscribers.discard(queue)
+
+
+def poller_stats() -> Dict[str, dict]:
+    return {
+        symbol: {"subscribers": len(p.subscribers), "polls": p.polls}
+        for symbol, p in _pollers.items()
+    }
@@ -1,12 +1,38 @@
 import re
+import threading
+from collections import Counter, OrderedDict
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-from dateparser.search import search_dates
+from backend.logging_config import logger
+from backend.settings import settings
 
 
 LAKH_KEYWORDS = {"lakh", "lakhs", "lac", "lacs", "l"}
 CRORE_KEYWORDS = {"crore", "crores", "cr"}
+THOUSAND_KEYWORDS = {"k", "thousand"}
+
+_UNIT_MULTIPLIERS: Dict[str, float] = {
+    **{k: 100_000 for k in LAKH_KEYWORDS},
+    **{k: 10_000_000 for k in CRORE_KEYWORDS},
+    **{k: 1_000 for k in THOUSAND_KEYWORDS},
+}
+
+# A single precompiled pattern replaces the old regex cascade. Its branches are
+# tried in the cascade's priority order: a contextual phrase ("for/budget/
+# cost/amount ..."), then ₹, then Rs/INR, then a bare number carrying a unit.
+# Bare numbers are never amounts so that years are not picked up.
+# "₹8,00,000" (Indian grouping) is just a number with commas.
+_AMOUNT_NUMBER = r"([0-9][0-9,]*\.?[0-9]*)\s*"
+_AMOUNT_UNIT = r"(lakhs?|lacs?|l|crores?|cr|k|thousand)\b"
+_AMOUNT_RE = re.compile(
+    r".*?\b(?:for|budget|cost|amount)\s*(?:of|is|=|:)?\s*(?:₹|\brs\.?|\binr)?\s*"
+    + _AMOUNT_NUMBER + "(?:" + _AMOUNT_UNIT + ")?"
+    + r"|.*?₹\s*" + _AMOUNT_NUMBER + "(?:" + _AMOUNT_UNIT + ")?"
+    + r"|.*?\b(?:rs\.?|inr)\s*" + _AMOUNT_NUMBER + "(?:" + _AMOUNT_UNIT + ")?"
+    + r"|.*?" + _AMOUNT_NUMBER + _AMOUNT_UNIT,
+    re.IGNORECASE | re.DOTALL,
+)
 
 
 def _to_amount(number_str: str, unit: Optional[str]) -> Optional[float]:
@@ -14,72 +40,168 @@ def _to_amount(number_str: str, unit: Optional[str]) -> Optional[float]:
         number = float(number_str.replace(",", ""))
     except Exception:
         return None
-    unit_norm = (unit or "").lower()
-    if unit_norm in LAKH_KEYWORDS:
-        return number * 100_000
-    if unit_norm in CRORE_KEYWORDS:
-        return number * 10_000_000
-    return number
+    if not unit:
+        return number
+    return number * _UNIT_MULTIPLIERS.get(unit.lower(), 1)
 
 
 def _extract_amount(text: str) -> Optional[float]:
-    t = text.strip()
-    t = t.replace("Rs.", "Rs").replace("rs.", "rs")
+    m = _AMOUNT_RE.match(text)
+    if m is None:
+        return None
+    groups = m.groups()
+    # Each branch owns a (number, unit) pair of groups; the matched branch is
+    # the first one whose number group is set.
+    for i in range(0, len(groups), 2):
+        if groups[i] is not None:
+            return _to_amount(groups[i], groups[i + 1])
+    return None
 
-    # 1) Look for contextual phrases like 'for/budget/cost/amount'
-    ctx_pattern = r"(?:for|budget|cost|amount)\s*(?:of|is|=|:)?\s*(₹|rs|inr)?\s*([0-9][0-9,]*\.?[0-9]*)\s*(lakh|lakhs|lac|lacs|l|crore|crores|cr)?"
-    m = re.search(ctx_pattern, t, flags=re.IGNORECASE)
-    if m:
-        amt = _to_amount(m.group(2), m.group(3))
-        if amt is not None:
-            return amt
-
-    # 2) Explicit currency symbol first (₹ or Rs/INR)
-    currency_patterns = [
-        r"₹\s*([0-9][0-9,]*\.?[0-9]*)\s*(lakh|lakhs|lac|lacs|l|crore|crores|cr)?",
-        r"(?:rs|inr)\s*([0-9][0-9,]*\.?[0-9]*)\s*(lakh|lakhs|lac|lacs|l|crore|crores|cr)?",
-    ]
-    for pat in currency_patterns:
-        m = re.search(pat, t, flags=re.IGNORECASE)
-        if m:
-            amt = _to_amount(m.group(1), m.group(2) if len(m.groups()) >= 2 else None)
-            if amt is not None:
-                return amt
-
-    # 3) Numbers with explicit units (lakhs/crore)
-    unit_pattern = r"([0-9][0-9,]*\.?[0-9]*)\s*(lakh|lakhs|lac|lacs|l|crore|crores|cr)\b"
-    m = re.search(unit_pattern, t, flags=re.IGNORECASE)
+
+# Year resolution is tiered: the precompiled lexers below cover the phrasings
+# we actually see ("Dec 2026", "by 2030", "next year", "in 3 years") and
+# dateparser's search_dates is only consulted when none of them match.
+YEAR_TIER_EXPLICIT = "explicit"
+YEAR_TIER_RELATIVE = "relative"
+YEAR_TIER_MONTH = "month"
+YEAR_TIER_DATEPARSER = "dateparser"
+YEAR_TIER_NONE = "none"
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+}
+_MONTH_NAME = r"(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+_COUNT = r"([0-9]{1,2}|" + "|".join(_NUMBER_WORDS) + r")"
+
+# 4-digit years not glued to amounts ("₹2030", "2,030", "20300").
+_EXPLICIT_YEAR_RE = re.compile(r"(?<![0-9,.₹])\b(20[0-9]{2})\b(?!,?[0-9])")
+# Two-digit years after a month: "Dec '26". "Dec-25" is a day of the month.
+_MONTH_SHORT_YEAR_RE = re.compile(_MONTH_NAME + r"\s*['’]\s*([0-9]{2})\b", re.IGNORECASE)
+_NEXT_THIS_YEAR_RE = re.compile(r"\b(next|this|coming)\s+year\b", re.IGNORECASE)
+_IN_N_YEARS_RE = re.compile(
+    r"\b(?:in|after|within)\s+(?:the\s+next\s+)?" + _COUNT + r"\s+(years?|months?)\b"
+    r"|\b" + _COUNT + r"\s+(years?|months?)\s+(?:from\s+now|later|hence)\b",
+    re.IGNORECASE,
+)
+# Bare month names, optionally with a day ("Dec-25"); "may" is left to
+# dateparser since it is usually a verb.
+_MONTH_ONLY_RE = re.compile(
+    r"\b(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|june?|july?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b"
+    r"(?:\s*-\s*([0-9]{1,2})\b)?",
+    re.IGNORECASE,
+)
+
+_year_tier_counts: Counter = Counter()
+
+
+def _count_value(token: str) -> int:
+    token = token.lower()
+    return int(token) if token.isdigit() else _NUMBER_WORDS[token]
+
+
+def _pick_year(years: List[int], now_year: int) -> int:
+    """First year that is not in the past, else the last one mentioned."""
+    for year in years:
+        if year >= now_year:
+            return year
+    return years[-1]
+
+
+def _extract_year_explicit(text: str, now_year: int) -> Optional[int]:
+    """First explicit year that is not in the past. Past ones ("Save 2000
+    monthly") are usually not years at all, so they fall through to the
+    next tier."""
+    years = [int(y) for y in _EXPLICIT_YEAR_RE.findall(text)]
+    years += [2000 + int(m.group(2)) for m in _MONTH_SHORT_YEAR_RE.finditer(text)]
+    return next((year for year in years if year >= now_year), None)
+
+
+def _extract_year_relative(text: str, now: datetime) -> Optional[int]:
+    m = _NEXT_THIS_YEAR_RE.search(text)
     if m:
-        amt = _to_amount(m.group(1), m.group(2))
-        if amt is not None:
-            return amt
+        return now.year if m.group(1).lower() == "this" else now.year + 1
 
-    # 4) As a last resort, avoid bare numbers to prevent picking years
+    m = _IN_N_YEARS_RE.search(text)
+    if m:
+        count = m.group(1) or m.group(3)
+        unit = (m.group(2) or m.group(4)).lower()
+        n = _count_value(count)
+        if unit.startswith("year"):
+            return now.year + n
+        return now.year + (now.month - 1 + n) // 12
     return None
 
 
-def _extract_year(text: str) -> Optional[int]:
-    now_year = datetime.now().year
+def _extract_year_month_only(text: str, now: datetime) -> Optional[int]:
+    m = _MONTH_ONLY_RE.search(text)
+    if not m:
+        return None
+    month = _MONTHS[m.group(1)[:3].lower()]
+    day = int(m.group(2)) if m.group(2) else 31
+    return now.year if (month, day) >= (now.month, now.day) else now.year + 1
+
 
-    # Prefer natural date parsing
+def _search_dates(text: str):
+    # dateparser costs ~0.4 s to import, so it is loaded on first use (or by
+    # warm_dateparser at startup) rather than when the API process boots.
+    from dateparser.search import search_dates
+
+    return search_dates(text, settings={"PREFER_DATES_FROM": "future"})
+
+
+def warm_dateparser() -> None:
+    """Import dateparser and load its language data ahead of the first request."""
+    try:
+        _search_dates("in December 2030")
+        logger.info("dateparser warmed")
+    except Exception as exc:
+        logger.warning("dateparser warm-up failed: %s", exc)
+
+
+def _extract_year_dateparser(text: str, now_year: int) -> Optional[int]:
     try:
-        results = search_dates(text, settings={"PREFER_DATES_FROM": "future"})
-        if results:
-            for _, dt in results:
-                year = dt.year
-                if year >= now_year:
-                    return year
-            return results[-1][1].year
+        results = _search_dates(text)
     except Exception:
-        pass
+        return None
+    if not results:
+        return None
+    return _pick_year([dt.year for _, dt in results], now_year)
 
-    # Fallback: explicit year like 2025, 2026
-    candidates = re.findall(r"(?<![0-9])20[2-9][0-9](?![0-9])", text)
-    for c in candidates:
-        year = int(c)
-        if year >= now_year:
-            return year
-    return None
+
+def _extract_year_tiered(text: str) -> Tuple[Optional[int], str]:
+    """Resolve the target year and report which tier resolved it."""
+    now = datetime.now()
+
+    year = _extract_year_explicit(text, now.year)
+    if year is not None:
+        return year, YEAR_TIER_EXPLICIT
+    year = _extract_year_relative(text, now)
+    if year is not None:
+        return year, YEAR_TIER_RELATIVE
+    year = _extract_year_month_only(text, now)
+    if year is not None:
+        return year, YEAR_TIER_MONTH
+    year = _extract_year_dateparser(text, now.year)
+    if year is not None:
+        return year, YEAR_TIER_DATEPARSER
+    return None, YEAR_TIER_NONE
+
+
+def _extract_year(text: str) -> Optional[int]:
+    year, tier = _extract_year_tiered(text)
+    _year_tier_counts[tier] += 1
+    logger.debug("year resolved by %s tier: %r -> %s", tier, text, year)
+    return year
+
+
+def year_tier_stats() -> Dict[str, int]:
+    """How many year extractions each tier has resolved since startup."""
+    return dict(_year_tier_counts)
 
 
 def _extract_event_name(text: str) -> str:
@@ -99,15 +221,105 @@ def _extract_event_name(text: str) -> str:
     return candidate or "Goal"
 
 
+class _ParseCache:
+    """Bounded LRU of (amount, year) keyed on whitespace/case-normalized text.
+
+    Year resolution depends on today's date ("next year", "in 6 months",
+    "December"), so the whole cache is dropped when the calendar month rolls
+    over, which also covers the year changing.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[Optional[float], Optional[int]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._epoch = self._current_epoch()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _current_epoch() -> Tuple[int, int]:
+        now = datetime.now()
+        return now.year, now.month
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(text.split()).lower()
+
+    def get_or_compute(self, text: str) -> Tuple[Optional[float], Optional[int]]:
+        key = self.normalize(text)
+        with self._lock:
+            epoch = self._current_epoch()
+            if epoch != self._epoch:
+                self._data.clear()
+                self._epoch = epoch
+            cached = self._data.get(key)
+            if cached is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        value = (_extract_amount(text), _extract_year(text))
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_parse_cache = _ParseCache(settings.nlp_cache_size)
+
+
+def parse_cache_stats() -> Dict[str, float]:
+    return _parse_cache.stats()
+
+
+class GoalParse(NamedTuple):
+    """Result of one extraction pass; amount/year are None when not found."""
+    event_name: str
+    amount: Optional[float]
+    year: Optional[int]
+
+
+def parse_goal_fields(text: str) -> GoalParse:
+    """Extract whatever goal fields the text contains, without raising."""
+    event_name = _extract_event_name(text)
+    if _parse_cache.maxsize > 0:
+        amount, year = _parse_cache.get_or_compute(text)
+    else:
+        amount, year = _extract_amount(text), _extract_year(text)
+    return GoalParse(event_name, amount, year)
+
+
 def parse_goal_text(text: str) -> Tuple[str, float, int]:
     """Parse free text and return (event_name, today_cost, target_year)."""
-    event_name = _extract_event_name(text)
-    amount = _extract_amount(text)
-    year = _extract_year(text)
+    parsed = parse_goal_fields(text)
 
-    if amount is None:
+    if parsed.amount is None:
         raise ValueError("Could not detect amount from text")
-    if year is None:
+    if parsed.year is None:
         raise ValueError("Could not detect target year from text")
 
-    return event_name, float(amount), int(year) 
\ No newline at end of file
+    return parsed.event_name, float(parsed.amount), int(parsed.year)
@@ -0,0 +1,86 @@
+# backend/services/nlp_batch.py
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from backend.logging_config import logger
+from backend.services.nlp import parse_goal_text, warm_dateparser
+from backend.settings import settings
+
+# (event_name, today_cost, target_year) on success, else None plus the error message
+BatchItem = Tuple[Optional[Tuple[str, float, int]], Optional[str]]
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+# Workers come from a clean server process rather than a fork of the API
+# process, which runs threads (warm-ups, recompute) that fork would copy
+# mid-flight. spawn where forkserver is unavailable.
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _warm_worker() -> None:
+    """Pool initializer: pay dateparser's import and language loading up front."""
+    warm_dateparser()
+
+
+def _parse_one(text: str) -> BatchItem:
+    try:
+        return parse_goal_text(text), None
+    except ValueError as exc:
+        return None, str(exc)
+    except Exception as exc:  # keep one bad row from failing the batch
+        return None, f"unexpected error: {exc}"
+
+
+def _worker_count() -> int:
+    return settings.nlp_batch_workers or os.cpu_count() or 1
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Return the shared parsing pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = _worker_count()
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(_START_METHOD),
+                initializer=_warm_worker,
+            )
+            logger.info("NLP batch pool started with %d %s workers", workers, _START_METHOD)
+        return _pool
+
+
+def warm_pool() -> None:
+    """Start every worker now so the first batch does not pay for spawning."""
+    try:
+        pool = get_pool()
+        for f in [pool.submit(_warm_worker) for _ in range(_worker_count())]:
+            f.result()
+        logger.info("NLP batch pool warmed")
+    except Exception as exc:  # e.g. shut down while warming
+        logger.warning("NLP batch pool warm-up failed: %s", exc)
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+            _pool = None
+
+
+def parse_goal_texts(texts: List[str]) -> List[BatchItem]:
+    """Parse many texts, returning one (result, error) pair per input, in order.
+
+    Small batches are parsed inline since shipping them to another process
+    costs more than the parsing itself.
+    """
+    if len(texts) < settings.nlp_batch_inline_threshold:
+        return [_parse_one(t) for t in texts]
+
+    pool = get_pool()
+    chunksize = max(1, len(texts) // (_worker_count() * 4))
+    return list(pool.map(_parse_one, texts, chunksize=chunksize))
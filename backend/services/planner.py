@@ -33,16 +33,20 @@
 #         "future_cost": fut,
 #         "monthly_saving_needed": monthly,
 #     }
-from backend.utils.finance import years_until, future_value, monthly_saving_needed
+from backend.utils.finance import (
+    years_until, future_value, monthly_saving_needed, required_monthly_sip, sip_value_factor,
+)
 from backend.settings import settings
-from backend.services.inflation import fetch_worldbank_inflation  # 👈 
-from typing import Optional
+from backend.services.inflation import current_inflation, current_inflation_series
+from backend.utils.inflation_series import InflationSeries
+from datetime import datetime
+from typing import List, Optional
 
 
 def _get_inflation_percent() -> float:
-    """Fetch real inflation if possible, else fallback."""
+    """Real inflation from the in-memory provider, else fallback."""
     try:
-        data = fetch_worldbank_inflation()
+        data = current_inflation()
         pct = float(data.get("inflation_percent"))
         if pct > 0:
             return pct
@@ -51,6 +55,14 @@ def _get_inflation_percent() -> float:
     return float(settings.fallback_inflation)
 
 
+def _rolling_inflation_percent(years: int) -> float:
+    """Annualized inflation over the latest `years` of the series, else the latest value."""
+    series = current_inflation_series()
+    if series is None:
+        return _get_inflation_percent()
+    return round(series.rolling_average(years), 4)
+
+
 def _recommendation_for_horizon(years_to_goal: int) -> str:
     if years_to_goal < 1:
         return "Fixed deposit or ultra-short-term debt instruments"
@@ -59,10 +71,24 @@ def _recommendation_for_horizon(years_to_goal: int) -> str:
     return "Equity-oriented mutual funds (SIP preferred)"
 
 
-def plan_event(event_name: str, today_cost: float, target_year: int, inflation_override_pct: Optional[float] = None) -> dict:
-    inflation_pct = inflation_override_pct if (inflation_override_pct is not None and inflation_override_pct >= 0) else _get_inflation_percent()
+def plan_event(event_name: str, today_cost: float, target_year: int, inflation_override_pct: Optional[float] = None,
+               inflation_avg_years: Optional[int] = None, inflation_curve_pct: Optional[List[float]] = None) -> dict:
+    """Plan a goal. Inflation comes from, in order of precedence: a flat
+    override, a per-year curve (first entry = next year), the rolling
+    average of the last `inflation_avg_years`, or the latest published rate.
+    """
     yrs = years_until(target_year)
-    fut = future_value(today_cost, inflation_pct, yrs)
+    if inflation_override_pct is not None and inflation_override_pct >= 0:
+        inflation_pct = inflation_override_pct
+        fut = future_value(today_cost, inflation_pct, yrs)
+    elif inflation_curve_pct:
+        growth = InflationSeries(datetime.now().year + 1, inflation_curve_pct).growth_over(yrs)
+        fut = round(today_cost * growth, 2)
+        # report the equivalent flat rate
+        inflation_pct = round((growth ** (1 / yrs) - 1) * 100, 4) if yrs else inflation_curve_pct[0]
+    else:
+        inflation_pct = _rolling_inflation_percent(inflation_avg_years) if inflation_avg_years else _get_inflation_percent()
+        fut = future_value(today_cost, inflation_pct, yrs)
     monthly = monthly_saving_needed(fut, yrs * 12)
 
     return {
@@ -75,3 +101,25 @@ def plan_event(event_name: str, today_cost: float, target_year: int, inflation_o
         "monthly_saving_needed": monthly,
         "recommendation": _recommendation_for_horizon(yrs),
     }
+
+
+def plan_sip(event_name: str, today_cost: float, target_year: int, expected_return_pct: float,
+             step_up_pct: float = 0.0, inflation_override_pct: Optional[float] = None,
+             inflation_avg_years: Optional[int] = None, inflation_curve_pct: Optional[List[float]] = None) -> dict:
+    """plan_event plus the SIP that reaches the future cost at an expected
+    return, stepped up by `step_up_pct` each year."""
+    plan = plan_event(event_name, today_cost, target_year, inflation_override_pct,
+                      inflation_avg_years=inflation_avg_years, inflation_curve_pct=inflation_curve_pct)
+    months = plan["years_to_goal"] * 12
+    first_sip = required_monthly_sip(plan["future_cost"], expected_return_pct, months, step_up_pct)
+    last_sip = first_sip * (1 + step_up_pct / 100.0) ** ((months - 1) // 12) if months else first_sip
+    invested = first_sip * sip_value_factor(0.0, months, step_up_pct) if months else first_sip
+    return {
+        **plan,
+        "expected_return_pct": expected_return_pct,
+        "step_up_pct": step_up_pct,
+        "monthly_sip": first_sip,
+        "final_monthly_sip": round(last_sip, 2),
+        "total_invested": round(invested, 2),
+        "returns_earned": round(plan["future_cost"] - invested, 2),
+    }
@@ -0,0 +1,167 @@
+# backend/services/planner_batch.py
+"""Plan many goals at once with NumPy.
+
+Same arithmetic as plan_event (years_until, future_value,
+monthly_saving_needed) but over whole columns, with one inflation lookup per
+batch instead of one per goal.
+"""
+import csv
+import io
+import json
+import math
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+
+from backend.services.planner import _get_inflation_percent
+
+PLAN_FIELDS = (
+    "event_name",
+    "target_year",
+    "today_cost",
+    "inflation_percent_used",
+    "years_to_goal",
+    "future_cost",
+    "monthly_saving_needed",
+    "recommendation",
+)
+CSV_FIELDS = ("index",) + PLAN_FIELDS + ("error",)
+
+# Rows serialized per chunk of the streamed response
+STREAM_CHUNK_ROWS = 1000
+# Reused so each row does not build a new encoder (json.dumps with kwargs does)
+_json_encoder = json.JSONEncoder(ensure_ascii=False)
+
+_RECOMMENDATIONS = np.array([
+    "Fixed deposit or ultra-short-term debt instruments",
+    "Short-duration debt or conservative mutual funds",
+    "Equity-oriented mutual funds (SIP preferred)",
+], dtype=object)
+
+
+class BatchRows(NamedTuple):
+    """Valid input rows as columns; `overrides` is NaN where a row has none."""
+    indices: np.ndarray
+    event_names: List[str]
+    today_costs: np.ndarray
+    target_years: np.ndarray
+    overrides: np.ndarray
+    errors: Dict[int, str]
+    total: int
+
+
+def _build_rows(raw: Iterable[dict]) -> BatchRows:
+    indices, names, costs, years, overrides = [], [], [], [], []
+    errors: Dict[int, str] = {}
+    this_year = datetime.now().year
+    total = 0
+    for i, row in enumerate(raw):
+        total += 1
+        try:
+            name = str(row.get("event_name") or "").strip()
+            cost = float(row.get("today_cost"))
+            year = int(row.get("target_year"))
+            override = row.get("inflation_override_pct")
+            override = float(override) if override not in (None, "") else math.nan
+        except (TypeError, ValueError, AttributeError):
+            errors[i] = "event_name, today_cost and target_year are required and must be numeric"
+            continue
+        if not name:
+            errors[i] = "event_name cannot be empty"
+        elif not (cost > 0 and math.isfinite(cost)):
+            errors[i] = "today_cost must be > 0"
+        elif year < this_year:
+            errors[i] = "target_year cannot be in the past"
+        elif not (math.isnan(override) or 0 <= override <= 50):
+            errors[i] = "inflation_override_pct must be between 0 and 50"
+        else:
+            indices.append(i)
+            names.append(name)
+            costs.append(cost)
+            years.append(year)
+            overrides.append(override)
+    return BatchRows(
+        indices=np.asarray(indices, dtype=np.int64),
+        event_names=names,
+        today_costs=np.asarray(costs, dtype=np.float64),
+        target_years=np.asarray(years, dtype=np.int64),
+        overrides=np.asarray(overrides, dtype=np.float64),
+        errors=errors,
+        total=total,
+    )
+
+
+def rows_from_json(items: list) -> BatchRows:
+    """Rows from a list of PlanRequest-shaped objects."""
+    return _build_rows(item if isinstance(item, dict) else {} for item in items)
+
+
+def rows_from_csv(text: str) -> BatchRows:
+    """Rows from CSV with a header: event_name,today_cost,target_year[,inflation_override_pct]."""
+    return _build_rows(csv.DictReader(io.StringIO(text)))
+
+
+def compute_plans(today_costs: np.ndarray, target_years: np.ndarray, inflation_pct) -> Dict[str, np.ndarray]:
+    """Vectorized plan_event math. Inputs broadcast against each other, so
+    `inflation_pct` can be a scalar, one rate per row, or a grid axis."""
+    yrs = np.maximum(0, np.asarray(target_years, dtype=np.int64) - datetime.now().year)
+    yrs, inflation = np.broadcast_arrays(yrs, np.asarray(inflation_pct, dtype=np.float64))
+    future = np.round(today_costs * (1 + inflation / 100.0) ** yrs, 2)
+    months = yrs * 12
+    monthly = np.round(np.where(months > 0, future / np.maximum(months, 1), future), 2)
+    return {
+        "inflation_percent_used": inflation,
+        "years_to_goal": yrs,
+        "future_cost": future,
+        "monthly_saving_needed": monthly,
+        "recommendation": _RECOMMENDATIONS[np.select([yrs < 1, yrs <= 3], [0, 1], 2)],
+    }
+
+
+def plan_rows(rows: BatchRows, inflation_override_pct: Optional[float] = None) -> Dict[str, np.ndarray]:
+    """Plans for every valid row; per-row overrides beat the batch-wide rate."""
+    if inflation_override_pct is None and np.isnan(rows.overrides).any():
+        base = _get_inflation_percent()  # the single lookup for this batch
+    else:
+        base = inflation_override_pct if inflation_override_pct is not None else 0.0
+    inflation = np.where(np.isnan(rows.overrides), base, rows.overrides)
+    return compute_plans(rows.today_costs, rows.target_years, inflation)
+
+
+def _records(rows: BatchRows, plans: Dict[str, np.ndarray]) -> Iterator[List[dict]]:
+    """Result dicts in input order (errors included), a chunk at a time."""
+    columns = {
+        "event_name": rows.event_names,
+        "target_year": rows.target_years.tolist(),
+        "today_cost": rows.today_costs.tolist(),
+        **{name: col.tolist() for name, col in plans.items()},
+    }
+    position = {int(i): p for p, i in enumerate(rows.indices.tolist())}
+    for start in range(0, rows.total, STREAM_CHUNK_ROWS):
+        chunk = []
+        for i in range(start, min(start + STREAM_CHUNK_ROWS, rows.total)):
+            p = position.get(i)
+            if p is None:
+                chunk.append({"index": i, "error": rows.errors.get(i, "invalid row")})
+            else:
+                chunk.append({"index": i, **{name: columns[name][p] for name in PLAN_FIELDS}})
+        yield chunk
+
+
+def iter_ndjson(rows: BatchRows, plans: Dict[str, np.ndarray]) -> Iterator[str]:
+    for chunk in _records(rows, plans):
+        yield "".join(_json_encoder.encode(record) + "\n" for record in chunk)
+
+
+def iter_csv(rows: BatchRows, plans: Dict[str, np.ndarray]) -> Iterator[str]:
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    for chunk in _records(rows, plans):
+        writer.writerows(chunk)
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+    if buf.tell():
+        yield buf.getvalue()
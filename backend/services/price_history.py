@@ -0,0 +1,200 @@
+# backend/services/price_history.py
+"""Local OHLC history for market indices.
+
+Each symbol gets a directory of raw column files (one per field) that are
+read back through np.memmap, so range queries slice the mapped pages directly
+without copying or touching the network. New bars are appended; a backfill
+that reaches before the last stored bar rewrites the files in sorted order.
+"""
+import re
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from backend.settings import settings
+
+COLUMNS = {
+    "ts": np.dtype("<i8"),  # bar open time, epoch seconds (UTC)
+    "open": np.dtype("<f8"),
+    "high": np.dtype("<f8"),
+    "low": np.dtype("<f8"),
+    "close": np.dtype("<f8"),
+    "volume": np.dtype("<f8"),
+}
+PRICE_FIELDS = [c for c in COLUMNS if c != "ts"]
+INTERVALS = ("daily", "weekly", "monthly")
+
+_SECONDS_PER_DAY = 86_400
+
+
+def _symbol_dir_name(symbol: str) -> str:
+    name = re.sub(r"[^A-Za-z0-9.\-]", "_", symbol)
+    if not name.strip("."):
+        # "", "." and ".." would resolve to the store root or its parent
+        raise ValueError(f"invalid symbol: {symbol!r}")
+    return name
+
+
+def _empty_columns() -> Dict[str, np.ndarray]:
+    return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS.items()}
+
+
+def bars_from_chart(result: dict) -> Dict[str, np.ndarray]:
+    """Columns from one Yahoo chart `result`; bars with no close are dropped."""
+    ts = result.get("timestamp") or []
+    quote = ((result.get("indicators") or {}).get("quote") or [{}])[0]
+    cols = {"ts": np.asarray(ts, dtype=COLUMNS["ts"])}
+    for name in PRICE_FIELDS:
+        values = quote.get(name) or [None] * len(ts)
+        cols[name] = np.array([np.nan if v is None else v for v in values], dtype=COLUMNS[name])
+    keep = ~np.isnan(cols["close"])
+    return {name: col[keep] for name, col in cols.items()}
+
+
+class PriceHistoryStore:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._mapped: Dict[str, Dict[str, np.ndarray]] = {}
+
+    def _dir(self, symbol: str) -> Path:
+        return self.root / _symbol_dir_name(symbol)
+
+    def _load(self, symbol: str) -> Dict[str, np.ndarray]:
+        d = self._dir(symbol)
+        if not (d / "ts.bin").exists():
+            return _empty_columns()
+        sizes = {name: (d / f"{name}.bin").stat().st_size // dtype.itemsize for name, dtype in COLUMNS.items()}
+        # A crash between column writes leaves ragged files; trust the shortest.
+        n = min(sizes.values())
+        if n == 0:
+            return _empty_columns()
+        return {
+            name: np.memmap(d / f"{name}.bin", dtype=dtype, mode="r", shape=(n,))
+            for name, dtype in COLUMNS.items()
+        }
+
+    def columns(self, symbol: str) -> Dict[str, np.ndarray]:
+        """All stored bars for `symbol` as read-only memory-mapped columns."""
+        with self._lock:
+            cols = self._mapped.get(symbol)
+            if cols is None:
+                cols = self._mapped[symbol] = self._load(symbol)
+            return cols
+
+    def append(self, symbol: str, bars: Dict[str, np.ndarray]) -> int:
+        """Store bars not stored yet; returns the number of rows added.
+
+        Bars already stored are kept, except the last one: a bar with its
+        timestamp replaces it, so the still-open daily bar can be updated
+        during the session. Bars newer than the last one are appended; older
+        missing ones (a backfill after live quotes) are merged in by
+        rewriting the files.
+        """
+        ts = np.asarray(bars["ts"], dtype=COLUMNS["ts"])
+        if ts.size == 0:
+            return 0
+        order = np.argsort(ts, kind="stable")
+        sorted_ts = ts[order]
+        with self._lock:
+            self._mapped.pop(symbol, None)
+            current = self._load(symbol)
+            last_ts = int(current["ts"][-1]) if current["ts"].size else None
+            n_stored = current["ts"].size
+            if last_ts is not None and sorted_ts[0] < last_ts:
+                older = sorted_ts[sorted_ts < last_ts]
+                if not np.isin(older, current["ts"]).all():
+                    return self._rewrite(symbol, current, bars, order)
+            del current  # release the maps before writing
+
+            d = self._dir(symbol)
+            d.mkdir(parents=True, exist_ok=True)
+            if last_ts is not None and last_ts in sorted_ts:
+                i = int(np.searchsorted(sorted_ts, last_ts))
+                for name, dtype in COLUMNS.items():
+                    with open(d / f"{name}.bin", "r+b") as f:
+                        f.seek((n_stored - 1) * dtype.itemsize)
+                        f.write(np.asarray(bars[name], dtype=dtype)[order][i:i + 1].tobytes())
+
+            new = order[sorted_ts > last_ts] if last_ts is not None else order
+            if new.size:
+                for name, dtype in COLUMNS.items():
+                    with open(d / f"{name}.bin", "ab") as f:
+                        f.truncate(n_stored * dtype.itemsize)  # drop a ragged tail
+                        f.write(np.asarray(bars[name], dtype=dtype)[new].tobytes())
+            return int(new.size)
+
+    def _rewrite(self, symbol: str, current: Dict[str, np.ndarray], bars: Dict[str, np.ndarray],
+                 order: np.ndarray) -> int:
+        """Merge `bars` into the stored ones and write the result in ts order.
+
+        The files are written to a sibling directory that then takes the
+        symbol's place, so readers never see a half-merged series; a crash
+        between the two renames at worst drops the symbol, which the next
+        backfill restores. Caller holds the lock.
+        """
+        stored_ts = np.array(current["ts"])
+        new_ts = np.asarray(bars["ts"], dtype=COLUMNS["ts"])[order]
+        # one incoming bar per timestamp (the last given), and only where
+        # nothing is stored or it replaces the last stored bar
+        take = np.r_[new_ts[1:] != new_ts[:-1], True] & ~np.isin(new_ts, stored_ts[:-1])
+        new = order[take]
+        keep = ~np.isin(stored_ts, new_ts[take])
+        merged = {
+            name: np.concatenate((np.array(current[name])[keep], np.asarray(bars[name], dtype=dtype)[new]))
+            for name, dtype in COLUMNS.items()
+        }
+        del current
+        by_ts = np.argsort(merged["ts"], kind="stable")
+
+        d = self._dir(symbol)
+        # "~" never occurs in a symbol directory name
+        tmp, old = d.with_name(d.name + "~tmp"), d.with_name(d.name + "~old")
+        for path in (tmp, old):
+            shutil.rmtree(path, ignore_errors=True)  # leftovers of an interrupted rewrite
+        tmp.mkdir(parents=True)
+        for name, col in merged.items():
+            col[by_ts].tofile(tmp / f"{name}.bin")
+        d.rename(old)
+        tmp.rename(d)
+        shutil.rmtree(old, ignore_errors=True)
+        return int(by_ts.size - stored_ts.size)
+
+    def range(self, symbol: str, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Bars with start_ts <= ts < end_ts, as zero-copy slices of the maps."""
+        cols = self.columns(symbol)
+        ts = cols["ts"]
+        lo = 0 if start_ts is None else int(np.searchsorted(ts, start_ts, side="left"))
+        hi = ts.size if end_ts is None else int(np.searchsorted(ts, end_ts, side="left"))
+        return {name: col[lo:hi] for name, col in cols.items()}
+
+    def downsample(self, symbol: str, interval: str, start_ts: Optional[int] = None,
+                   end_ts: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """OHLCV aggregated to daily, weekly (ISO, Monday start) or monthly bars."""
+        if interval not in INTERVALS:
+            raise ValueError(f"interval must be one of {', '.join(INTERVALS)}")
+        cols = self.range(symbol, start_ts, end_ts)
+        if interval == "daily" or cols["ts"].size == 0:
+            return cols
+
+        days = cols["ts"] // _SECONDS_PER_DAY
+        if interval == "weekly":
+            bucket = (days + 3) // 7  # 1970-01-01 was a Thursday
+        else:
+            bucket = days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        ends = np.r_[starts[1:], bucket.size] - 1
+        return {
+            "ts": cols["ts"][starts],
+            "open": cols["open"][starts],
+            "high": np.maximum.reduceat(cols["high"], starts),
+            "low": np.minimum.reduceat(cols["low"], starts),
+            "close": cols["close"][ends],
+            "volume": np.add.reduceat(np.nan_to_num(cols["volume"]), starts),
+        }
+
+
+history_store = PriceHistoryStore(Path(settings.price_history_dir))
@@ -0,0 +1,247 @@
+# backend/services/recompute.py
+"""Keep stored Calculation rows in line with current inflation.
+
+Every calculation is stamped with the inflation version it used and the day
+it was computed. It is stale once the version differs from the current one,
+or once it was computed before this year (years_until moved on). Stale rows
+are found through ix_calculations_stamp.
+
+RecomputeJob refreshes them in the background: a keyset walk over
+calculation ids, one batch per short transaction, planned with NumPy and
+written with an executemany UPDATE. Each UPDATE only applies while the row
+is still stale and its goal's inputs are the ones that were read, so a
+concurrent PATCH /goals/{id} is never overwritten with old numbers. Writes are throttled to
+recompute_rows_per_second so live requests keep getting the database. The
+stamps record progress, so an interrupted pass loses nothing; within a
+process the job also resumes from its id checkpoint.
+"""
+import threading
+import time
+from datetime import date, datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import and_, bindparam, exists, func, or_, select, text, update
+
+from backend import models
+from backend.database import SessionLocal
+from backend.logging_config import logger
+from backend.services.planner import _get_inflation_percent
+from backend.services.planner_batch import compute_plans
+from backend.settings import settings
+
+_calculations = models.Calculation.__table__
+_goals = models.Goal.__table__
+# SQLite: take the write lock before the batch is read, so the read and the
+# UPDATE see one snapshot and no writer can slip in between
+_BEGIN_IMMEDIATE = text("BEGIN IMMEDIATE")
+
+
+def inflation_version(inflation_pct: float) -> str:
+    """Version key of the rate a calculation was computed with."""
+    return f"{float(inflation_pct):.4f}"
+
+
+def calculation_stamp(inflation_pct: float) -> dict:
+    """Stamp columns for a Calculation computed now at `inflation_pct`."""
+    return {"inflation_version": inflation_version(inflation_pct), "computed_on": date.today()}
+
+
+def stale_condition(version: str, as_of: Optional[date] = None):
+    """Rows not computed with `version` during the year of `as_of`.
+
+    Written as ranges rather than `!=` so SQLite can serve each OR branch
+    from ix_calculations_stamp.
+    """
+    year_start = date((as_of or date.today()).year, 1, 1)
+    c = models.Calculation
+    return or_(
+        c.inflation_version.is_(None),
+        c.inflation_version < version,
+        c.inflation_version > version,
+        and_(c.inflation_version == version, c.computed_on < year_start),
+    )
+
+
+def count_stale(db, version: str, as_of: Optional[date] = None) -> int:
+    return db.execute(select(func.count()).select_from(_calculations).where(stale_condition(version, as_of))).scalar_one()
+
+
+def stale_batch_statement(version: str, after_id: int, limit: int, as_of: Optional[date] = None):
+    """Next `limit` stale calculations after `after_id`, with their goal's inputs."""
+    return (
+        select(models.Calculation.id, models.Goal.today_cost, models.Goal.target_year)
+        .join(models.Goal, models.Goal.id == models.Calculation.goal_id)
+        .where(models.Calculation.id > after_id, stale_condition(version, as_of))
+        .order_by(models.Calculation.id)
+        .limit(limit)
+    )
+
+
+def _update_statement(version: str):
+    """UPDATE of one calculation, skipped if it was refreshed or its goal edited since the read."""
+    inputs_unchanged = exists().where(
+        _goals.c.id == _calculations.c.goal_id,
+        _goals.c.today_cost == bindparam("read_today_cost"),
+        _goals.c.target_year == bindparam("read_target_year"),
+    )
+    return (
+        update(_calculations)
+        .where(_calculations.c.id == bindparam("calc_id"), stale_condition(version), inputs_unchanged)
+        .values(
+            future_cost=bindparam("new_future_cost"),
+            monthly_saving=bindparam("new_monthly_saving"),
+            inflation_version=bindparam("new_inflation_version"),
+            computed_on=bindparam("new_computed_on"),
+        )
+    )
+
+
+def recompute_batch(db, inflation_pct: float, after_id: int, limit: int) -> Tuple[int, ...]:
+    """Refresh one batch in its own transaction; returns the ids done (empty when finished)."""
+    version = inflation_version(inflation_pct)
+    if db.bind.dialect.name == "sqlite":
+        db.execute(_BEGIN_IMMEDIATE)
+    rows = db.execute(stale_batch_statement(version, after_id, limit)).all()
+    if not rows:
+        db.rollback()
+        return ()
+    ids, costs, years = zip(*rows)
+    plans = compute_plans(costs, years, inflation_pct)
+    today = date.today()
+    db.execute(_update_statement(version), [
+        {
+            "calc_id": calc_id,
+            "read_today_cost": cost,
+            "read_target_year": year,
+            "new_future_cost": future,
+            "new_monthly_saving": monthly,
+            "new_inflation_version": version,
+            "new_computed_on": today,
+        }
+        for calc_id, cost, year, future, monthly in zip(
+            ids, costs, years, plans["future_cost"].tolist(), plans["monthly_saving_needed"].tolist()
+        )
+    ])
+    db.commit()
+    return ids
+
+
+class RecomputeJob:
+    """Background refresher of stale calculations; one pass runs at a time."""
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory or SessionLocal
+        self._lock = threading.Lock()
+        self._running = False
+        self._stop = threading.Event()  # interrupts the current pass
+        self._shutdown = threading.Event()  # ends the schedule
+        self._checkpoint = None  # (version, year, last id) of an interrupted pass
+        self._scheduler = None
+        self._stats = {
+            "inflation_version": None,
+            "passes": 0,
+            "updated": 0,
+            "last_started": None,
+            "last_finished": None,
+            "last_error": None,
+        }
+
+    def status(self) -> dict:
+        with self._lock:
+            checkpoint = self._checkpoint
+            return {
+                "running": self._running,
+                "scheduled": self._scheduler is not None and self._scheduler.is_alive(),
+                "checkpoint": checkpoint[2] if checkpoint else None,
+                **self._stats,
+            }
+
+    def run_pass(self) -> int:
+        """Refresh every stale row now, in the calling thread; returns rows updated.
+
+        Does nothing (returns 0) if another pass is already running.
+        """
+        with self._lock:
+            if self._running:
+                return 0
+            self._running = True
+            self._stop.clear()
+            self._stats["last_started"] = datetime.now().isoformat(timespec="seconds")
+        updated = 0
+        try:
+            inflation_pct = _get_inflation_percent()
+            key = (inflation_version(inflation_pct), date.today().year)
+            with self._lock:
+                checkpoint = self._checkpoint
+                self._stats["inflation_version"] = key[0]
+            after_id = checkpoint[2] if checkpoint and checkpoint[:2] == key else 0
+            updated = self._run(inflation_pct, key, after_id)
+        except Exception as exc:
+            logger.exception("calculation recompute failed")
+            with self._lock:
+                self._stats["last_error"] = repr(exc)
+        finally:
+            with self._lock:
+                self._running = False
+                self._stats["passes"] += 1
+                self._stats["last_finished"] = datetime.now().isoformat(timespec="seconds")
+        return updated
+
+    def _run(self, inflation_pct: float, key: tuple, after_id: int) -> int:
+        batch_rows = settings.recompute_batch_rows
+        updated = 0
+        db = self._session_factory()
+        try:
+            stale = count_stale(db, key[0])  # index-only; usually 0 between rate changes
+            db.rollback()  # end the read so each batch opens its own write transaction
+            if not stale:
+                with self._lock:
+                    self._checkpoint = None
+                return 0
+            while not self._stop.is_set():
+                started = time.monotonic()
+                ids = recompute_batch(db, inflation_pct, after_id, batch_rows)
+                if not ids:
+                    with self._lock:
+                        self._checkpoint = None
+                        self._stats["last_error"] = None
+                    break
+                after_id = ids[-1]
+                updated += len(ids)
+                with self._lock:
+                    self._checkpoint = key + (after_id,)
+                    self._stats["updated"] += len(ids)
+                # throttle: a batch may not go faster than the configured row rate
+                delay = len(ids) / settings.recompute_rows_per_second - (time.monotonic() - started)
+                if delay > 0:
+                    self._stop.wait(delay)
+        finally:
+            db.close()
+        return updated
+
+    def trigger(self) -> bool:
+        """Start a pass in a background thread; False if one is already running."""
+        with self._lock:
+            if self._running:
+                return False
+        threading.Thread(target=self.run_pass, name="calculation-recompute", daemon=True).start()
+        return True
+
+    def start_schedule(self, interval_seconds: float) -> None:
+        """Run a pass now and then every `interval_seconds` until stop()."""
+        def loop():
+            while not self._shutdown.is_set():
+                self.run_pass()
+                self._shutdown.wait(interval_seconds)
+
+        self._shutdown.clear()
+        self._scheduler = threading.Thread(target=loop, name="calculation-recompute-schedule", daemon=True)
+        self._scheduler.start()
+
+    def stop(self) -> None:
+        """Interrupt the current pass (the next one resumes from its checkpoint) and end the schedule."""
+        self._shutdown.set()
+        self._stop.set()
+
+
+recompute_job = RecomputeJob()
@@ -0,0 +1,59 @@
+# backend/services/scenarios.py
+"""Sensitivity grids for the planner: every inflation rate x target year
+(x expected return) combination in one broadcasted NumPy pass."""
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from backend.services.planner_batch import compute_plans
+
+
+def expand_range(start: float, stop: float, step: float) -> List[float]:
+    """Inclusive arithmetic range, rounded to hide float drift (0.1 + 0.2 ...)."""
+    if step <= 0:
+        raise ValueError("step must be > 0")
+    if stop < start:
+        raise ValueError("stop must be >= start")
+    count = int(np.floor((stop - start) / step + 1e-9)) + 1
+    return np.round(start + step * np.arange(count), 6).tolist()
+
+
+def monthly_sip_for(future_cost: np.ndarray, annual_return_pct: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """SIP invested at the start of each month that grows to `future_cost`
+    at `annual_return_pct` (effective annual) over `months`; broadcasts."""
+    r = (1 + np.asarray(annual_return_pct, dtype=np.float64) / 100.0) ** (1 / 12) - 1
+    months = np.asarray(months)
+    growth = (1 + r) ** months
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sip = np.where(np.abs(r) > 1e-12, future_cost * r / ((growth - 1) * (1 + r)), future_cost / months)
+    return np.round(np.where(months > 0, sip, future_cost), 2)
+
+
+def sweep(
+    today_cost: float,
+    inflation_pcts: Sequence[float],
+    target_years: Sequence[int],
+    expected_return_pcts: Optional[Sequence[float]] = None,
+) -> dict:
+    """Future cost and monthly saving for every (inflation, year) cell, plus
+    the return-aware SIP for every (return, inflation, year) cell if asked."""
+    inflation = np.asarray(inflation_pcts, dtype=np.float64)[:, None]
+    years = np.asarray(target_years, dtype=np.int64)[None, :]
+    plans = compute_plans(np.float64(today_cost), years, inflation)
+
+    result = {
+        "today_cost": today_cost,
+        "inflation_pct": inflation[:, 0].tolist(),
+        "target_years": years[0].tolist(),
+        "years_to_goal": plans["years_to_goal"][0].tolist(),
+        "future_cost": plans["future_cost"].tolist(),
+        "monthly_saving_needed": plans["monthly_saving_needed"].tolist(),
+        "expected_return_pct": None,
+        "monthly_sip": None,
+    }
+    if expected_return_pcts:
+        returns = np.asarray(expected_return_pcts, dtype=np.float64)[:, None, None]
+        sip = monthly_sip_for(plans["future_cost"][None], returns, plans["years_to_goal"][None] * 12)
+        result["expected_return_pct"] = returns[:, 0, 0].tolist()
+        result["monthly_sip"] = sip.tolist()
+    return result
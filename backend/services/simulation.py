@@ -0,0 +1,155 @@
+# backend/services/simulation.py
+"""Monte Carlo goal projection.
+
+Draws inflation paths (paths x years) and monthly investment return paths
+(paths x months), either bootstrapped from history or from a parametric
+model, and reports the spread of future costs and how often a monthly SIP
+reaches the goal. Everything is whole-array NumPy; there is no per-path loop.
+"""
+import time
+from typing import Optional
+
+import numpy as np
+
+from backend.logging_config import logger
+from backend.services.inflation import current_inflation_series
+from backend.services.planner import _get_inflation_percent, plan_event
+from backend.services.price_history import history_store
+from backend.settings import settings
+from backend.utils.finance import years_until
+
+MODELS = ("bootstrap", "parametric")
+PERCENTILES = (5, 25, 50, 75, 95)
+# Bootstrapping needs at least this many monthly returns, else parametric
+MIN_HISTORY_MONTHS = 24
+
+
+def _percentiles(values: np.ndarray) -> dict:
+    return {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
+
+
+def historical_monthly_log_returns(symbol: str) -> np.ndarray:
+    """Month-over-month log returns of `symbol` from the local price history."""
+    closes = np.asarray(history_store.downsample(symbol, "monthly")["close"], dtype=np.float64)
+    closes = closes[closes > 0]
+    return np.diff(np.log(closes))
+
+
+def _inflation_paths(rng: np.random.Generator, model: str, n_paths: int, years: int) -> tuple:
+    """Annual inflation growth factors (paths x years) and the model actually used."""
+    series = current_inflation_series()
+    if model == "bootstrap" and series is not None:
+        rates = series.rates
+        draws = rates[rng.integers(0, rates.size, size=(n_paths, years))]
+        return 1.0 + draws / 100.0, "bootstrap"
+
+    if series is not None and series.rates.size > 1:
+        mean, std = float(series.rates.mean()), float(series.rates.std())
+    else:
+        mean, std = _get_inflation_percent(), settings.simulation_inflation_volatility_pct
+    draws = rng.normal(mean, std, size=(n_paths, years))
+    return 1.0 + np.maximum(draws, -99.0) / 100.0, "parametric"
+
+
+def _cumulative_returns(rng: np.random.Generator, model: str, n_paths: int, months: int,
+                        expected_return_pct: float, volatility_pct: float) -> tuple:
+    """Cumulative monthly log returns (paths x months, float32) and the model
+    actually used.
+
+    Parametric paths come in antithetic pairs (z, -z): half the random draws,
+    which dominate the run time, and one cumsum serves both halves since
+    cumsum(mu + s*z) = mu*m + s*cumsum(z).
+    """
+    if model == "bootstrap":
+        history = historical_monthly_log_returns(settings.simulation_return_symbol).astype(np.float32)
+        if history.size >= MIN_HISTORY_MONTHS:
+            index_dtype = np.int16 if history.size <= np.iinfo(np.int16).max else np.int32
+            draws = history[rng.integers(0, history.size, size=(n_paths, months), dtype=index_dtype)]
+            return np.cumsum(draws, axis=1, out=draws), "bootstrap"
+        logger.info("Not enough %s history to bootstrap returns; using parametric",
+                    settings.simulation_return_symbol)
+
+    sigma = volatility_pct / 100.0 / np.sqrt(12)
+    mu = np.log1p(expected_return_pct / 100.0) / 12 - sigma ** 2 / 2
+    half = (n_paths + 1) // 2
+    z = rng.standard_normal(size=(half, months), dtype=np.float32)
+    np.cumsum(z, axis=1, out=z)
+    z *= np.float32(sigma)
+    drift = (mu * np.arange(1, months + 1)).astype(np.float32)
+    cum = np.empty((n_paths, months), dtype=np.float32)
+    np.add(drift, z, out=cum[:half])
+    np.subtract(drift, z[: n_paths - half], out=cum[half:])
+    return cum, "parametric"
+
+
+def sip_corpus(cum_log_returns: np.ndarray, monthly_sip: float) -> np.ndarray:
+    """Value at the goal date of `monthly_sip` invested at the start of each
+    month, per path: sip * sum_m exp(C[M-1] - C[m-1]), C = cumulative log return."""
+    # contributions made after month j's return are discounted by exp(-C[j])
+    later = np.exp(-cum_log_returns[:, :-1]).sum(axis=1, dtype=np.float64)
+    return monthly_sip * np.exp(cum_log_returns[:, -1].astype(np.float64)) * (1.0 + later)
+
+
+def simulate_goal(
+    today_cost: float,
+    target_year: int,
+    monthly_sip: Optional[float] = None,
+    n_paths: Optional[int] = None,
+    seed: Optional[int] = None,
+    inflation_model: str = "bootstrap",
+    return_model: str = "parametric",
+    expected_return_pct: Optional[float] = None,
+    return_volatility_pct: Optional[float] = None,
+) -> dict:
+    """Percentile future costs and P(SIP corpus >= cost) over simulated paths.
+
+    `monthly_sip` defaults to the deterministic plan's monthly saving. The
+    seed used is always returned so any run can be reproduced.
+    """
+    if inflation_model not in MODELS or return_model not in MODELS:
+        raise ValueError(f"models must be one of {', '.join(MODELS)}")
+    started = time.perf_counter()
+    n_paths = n_paths or settings.simulation_default_paths
+    expected_return_pct = settings.simulation_expected_return_pct if expected_return_pct is None else expected_return_pct
+    return_volatility_pct = (
+        settings.simulation_return_volatility_pct if return_volatility_pct is None else return_volatility_pct
+    )
+    if seed is None:
+        seed = settings.simulation_seed
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy % 2**63)
+    rng = np.random.default_rng(seed)
+
+    years = years_until(target_year)
+    months = years * 12
+    baseline = plan_event("simulation", today_cost, target_year)
+    if monthly_sip is None:
+        monthly_sip = baseline["monthly_saving_needed"]
+
+    if years == 0:
+        costs = np.full(n_paths, float(today_cost))
+        corpus = np.zeros(n_paths)
+        used_inflation = used_return = "none"
+    else:
+        growth, used_inflation = _inflation_paths(rng, inflation_model, n_paths, years)
+        costs = today_cost * growth.prod(axis=1)
+        cum_returns, used_return = _cumulative_returns(
+            rng, return_model, n_paths, months, expected_return_pct, return_volatility_pct
+        )
+        corpus = sip_corpus(cum_returns, monthly_sip)
+
+    return {
+        "today_cost": today_cost,
+        "target_year": target_year,
+        "years_to_goal": years,
+        "paths": n_paths,
+        "seed": seed,
+        "inflation_model": used_inflation,
+        "return_model": used_return,
+        "monthly_sip": round(float(monthly_sip), 2),
+        "deterministic_future_cost": baseline["future_cost"],
+        "future_cost_percentiles": _percentiles(costs),
+        "corpus_percentiles": _percentiles(corpus),
+        "probability_of_reaching_goal": round(float(np.mean(corpus >= costs)), 4),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -5,8 +7,25 @@ class Settings(BaseSettings):
     world_bank_base_url: str = (
         "https://api.worldbank.org/v2/country/IND/indicator/FP.CPI.TOTL.ZG?format=json"
     )
+    world_bank_per_page: int = 200  # enough to get the whole series in one page
     fallback_inflation: float = 6.0
     cache_ttl_inflation_seconds: int = 86400
+    inflation_retry_seconds: int = 300  # refresh sooner while serving the fallback
+
+    # Database
+    database_url: str = "sqlite:///./sql_app.db"
+    db_async: bool = False  # serve /goals with async routes on aiosqlite
+    db_async_pool_size: int = 5
+    # "tuned" applies the SQLite pragmas below and a connection pool;
+    # "default" is SQLAlchemy's stock engine
+    db_profile: str = "tuned"
+    db_pool_size: int = 8
+    db_max_overflow: int = 8
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size: int = -64000  # negative = KiB, so ~64 MB
+    sqlite_busy_timeout_ms: int = 10000
 
     # Yahoo Finance
     # These endpoints are the JSON chart endpoints commonly used for quick pulls
@@ -16,11 +35,73 @@ class Settings(BaseSettings):
     yf_sensex_url: str = (
         "https://query1.finance.yahoo.com/v8/finance/chart/%5EBSESN?range=1d&interval=1d"
     )
+    # Any symbol, for /market/quotes
+    yf_chart_url_template: str = (
+        "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?range=1d&interval=1d"
+    )
+    market_max_symbols: int = 50
+    # Long-range daily bars, used to backfill the local price history
+    yf_history_url_template: str = (
+        "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?range={range}&interval=1d"
+    )
+    price_history_dir: str = ".cache/price_history"
     cache_ttl_market_seconds: int = 900
+    market_not_found_ttl_seconds: float = 3600.0  # reuse Yahoo's "unknown symbol" answer
+    market_poll_interval_seconds: float = 15.0  # shared pollers behind /market/stream
+    market_timeout_seconds: float = 10.0
+    market_max_workers: int = 8  # concurrent Yahoo requests / pooled connections
+    # Circuit breaker: open after N consecutive failures, probe again after cooldown
+    yahoo_breaker_failure_threshold: int = 3
+    yahoo_breaker_cooldown_seconds: float = 30.0
     
     # Mock toggle - set to False to enable live market data
     use_mock_market: bool = False
 
+    # Agent chat: overall per-request deadline for planning + market lookups
+    agent_deadline_seconds: float = 4.0
+    agent_max_workers: int = 16
+
+    # Import dateparser and start the NLP batch pool in the background right after startup
+    nlp_warm_on_startup: bool = True
+
+    # NLP parse cache (0 disables it)
+    nlp_cache_size: int = 4096
+
+    # NLP batch parsing
+    nlp_batch_workers: int = 0  # 0 = one worker per CPU core
+    nlp_batch_max_items: int = 10000
+    nlp_batch_inline_threshold: int = 32  # smaller batches skip the process pool
+
+    # Planner batch endpoint
+    planner_batch_max_rows: int = 200000
+
+    # Bulk goal import (POST /goals/import)
+    goal_import_chunk_rows: int = 5000  # rows per INSERT batch and transaction
+    goal_import_max_errors: int = 1000  # row errors listed in the response
+
+    # Background recompute of stored calculations (backend.services.recompute)
+    recompute_interval_seconds: float = 3600.0  # 0 = only when triggered
+    recompute_batch_rows: int = 500
+    recompute_rows_per_second: float = 5000.0  # throttle so live requests keep the DB
+
+    # Goals per /planner/sip/schedule request
+    sip_schedule_max_goals: int = 1000
+
+    # Planner scenario sweep: max cells (returns x inflation x years) per request
+    scenario_max_cells: int = 250000
+
+    # Monte Carlo goal simulation
+    simulation_default_paths: int = 10000
+    simulation_max_paths: int = 100000
+    simulation_max_years: int = 100
+    # paths x months per request; the path arrays scale with this product
+    simulation_max_path_months: int = 36_000_000
+    simulation_seed: Optional[int] = None  # fixed seed for reproducible runs
+    simulation_expected_return_pct: float = 12.0
+    simulation_return_volatility_pct: float = 15.0
+    simulation_inflation_volatility_pct: float = 2.0  # when there is no series
+    simulation_return_symbol: str = "^NSEI"  # bootstrapped from local history
+
     class Config:
         env_file = ".env"
 
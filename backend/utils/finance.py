@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime
+from typing import Iterator, Optional
 
 def years_until(target_year: int) -> int:
     """How many whole years from now until the target_year (min 0)."""
@@ -15,3 +16,48 @@ def monthly_saving_needed(future_cost: float, months: int) -> float:
     if months <= 0:
         return round(future_cost, 2)
     return round(future_cost / months, 2)
+
+def monthly_return_rate(annual_return_pct: float) -> float:
+    """Monthly rate equivalent to an effective annual return."""
+    return (1 + annual_return_pct / 100.0) ** (1 / 12) - 1
+
+def sip_value_factor(annual_return_pct: float, months: int, step_up_pct: float = 0.0) -> float:
+    """Value after 'months' of investing 1/month at the start of each month,
+    raising the instalment by step_up_pct every 12 months."""
+    growth = 1 + monthly_return_rate(annual_return_pct)
+    step = 1 + step_up_pct / 100.0
+    value = 0.0
+    for m in range(months):
+        value = (value + step ** (m // 12)) * growth
+    return value
+
+def required_monthly_sip(future_cost: float, annual_return_pct: float, months: int, step_up_pct: float = 0.0) -> float:
+    """First-year monthly SIP that grows to future_cost at the expected return."""
+    if months <= 0:
+        return round(future_cost, 2)
+    return round(future_cost / sip_value_factor(annual_return_pct, months, step_up_pct), 2)
+
+def sip_schedule(first_sip: float, annual_return_pct: float, months: int, step_up_pct: float = 0.0,
+                 start: Optional[date] = None) -> Iterator[dict]:
+    """Yield one row per month: contribution, running totals and end-of-month balance.
+
+    A generator, so a 40-year schedule never sits in memory as a list.
+    """
+    r = monthly_return_rate(annual_return_pct)
+    step = 1 + step_up_pct / 100.0
+    start = start or date.today()
+    balance = invested = 0.0
+    for m in range(months):
+        contribution = first_sip * step ** (m // 12)
+        invested += contribution
+        growth = (balance + contribution) * r
+        balance += contribution + growth
+        month_index = start.month - 1 + m + 1  # first instalment next month
+        yield {
+            "month": m + 1,
+            "date": f"{start.year + month_index // 12}-{month_index % 12 + 1:02d}",
+            "contribution": round(contribution, 2),
+            "growth": round(growth, 2),
+            "total_invested": round(invested, 2),
+            "balance": round(balance, 2),
+        }
@@ -0,0 +1,78 @@
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+# On-disk row format: 10 bytes per year.
+RECORD_DTYPE = np.dtype([("year", "<i2"), ("rate", "<f8")])
+
+
+class InflationSeries:
+    """Annual inflation rates (%) for consecutive years plus a precomputed
+    cumulative price index, so every lookup below is O(1).
+
+    `index[k]` is the price level at the end of year `first_year + k - 1`
+    relative to the start of `first_year` (so `index[0] == 1`). Missing years
+    reuse the previous year's rate; trailing years with no data are dropped.
+    """
+
+    def __init__(self, first_year: int, rates: np.ndarray):
+        rates = np.asarray(rates, dtype=np.float64)
+        valid = np.flatnonzero(~np.isnan(rates))
+        if valid.size == 0:
+            raise ValueError("inflation series has no values")
+        rates = rates[: valid[-1] + 1]
+        self.raw_rates = rates
+
+        filled = rates.copy()
+        filled[: valid[0]] = rates[valid[0]]
+        # forward-fill gaps
+        last_valid = np.maximum.accumulate(np.where(np.isnan(filled), 0, np.arange(filled.size)))
+        self.rates = filled[last_valid]
+
+        self.first_year = int(first_year)
+        self.last_year = self.first_year + self.rates.size - 1
+        self.index = np.concatenate(([1.0], np.cumprod(1.0 + self.rates / 100.0)))
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "InflationSeries":
+        """Build from World Bank rows like {"date": "2023", "value": 5.65}."""
+        pairs = [(int(r["date"]), r.get("value")) for r in records if str(r.get("date", "")).isdigit()]
+        if not pairs:
+            raise ValueError("no inflation records")
+        first = min(y for y, _ in pairs)
+        rates = np.full(max(y for y, _ in pairs) - first + 1, np.nan)
+        for year, value in pairs:
+            if value is not None:
+                rates[year - first] = float(value)
+        return cls(first, rates)
+
+    @property
+    def latest_rate(self) -> float:
+        return float(self.rates[-1])
+
+    def growth_over(self, years: int) -> float:
+        """Price growth factor over the first `years` years of the series; the
+        latest rate repeats past its end."""
+        years = max(0, int(years))
+        covered = min(years, self.rates.size)
+        return float(self.index[covered] * (1.0 + self.rates[-1] / 100.0) ** (years - covered))
+
+    def rolling_average(self, years: int) -> float:
+        """Annualized (geometric) inflation % over the latest `years` years."""
+        years = max(1, min(int(years), self.rates.size))
+        return float(((self.index[-1] / self.index[-1 - years]) ** (1.0 / years) - 1.0) * 100.0)
+
+    def save(self, path: Path) -> None:
+        records = np.empty(self.raw_rates.size, dtype=RECORD_DTYPE)
+        records["year"] = np.arange(self.first_year, self.first_year + self.raw_rates.size)
+        records["rate"] = self.raw_rates
+        with open(path, "wb") as f:
+            np.save(f, records, allow_pickle=False)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["InflationSeries"]:
+        records = np.load(path, allow_pickle=False)
+        if records.dtype != RECORD_DTYPE or records.size == 0:
+            return None
+        return cls(int(records["year"][0]), records["rate"])
@@ -1,10 +1,22 @@
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
-import { get, post, del } from './client'
+import { api, get, post, del } from './client'
 
 export const useMarketSummary = () => useQuery({ queryKey: ['market'], queryFn: () => get('/market/summary'), refetchInterval: 60_000 })
 export const useAdvice = () => useQuery({ queryKey: ['advice'], queryFn: () => get('/advice'), refetchInterval: 30_000 })
 
-export const useGoals = () => useQuery({ queryKey: ['goals'], queryFn: () => get('/goals/') })
+// GET /goals/ is paged; follow X-Next-Cursor until the last page
+const getAllGoals = async () => {
+  const goals = []
+  let cursor
+  do {
+    const r = await api.get('/goals/', { params: { limit: 1000, after_id: cursor } })
+    goals.push(...r.data)
+    cursor = r.headers['x-next-cursor']
+  } while (cursor)
+  return goals
+}
+
+export const useGoals = () => useQuery({ queryKey: ['goals'], queryFn: getAllGoals })
 export const useCreateGoal = () => {
   const qc = useQueryClient()
   return useMutation({ mutationFn: (data) => post('/goals/', data), onSuccess: () => qc.invalidateQueries({ queryKey: ['goals'] }) })
@@ -0,0 +1,29 @@
+"""Backfill the local index price history from Yahoo Finance.
+
+Run from the repo root:  python -m scripts.backfill_index_history [SYMBOL ...] [--range 10y]
+Defaults to the configured NIFTY 50 and SENSEX symbols.
+"""
+import argparse
+
+from backend.logging_config import logger
+from backend.services.market import backfill_history
+
+DEFAULT_SYMBOLS = ["^NSEI", "^BSESN"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill local index price history")
+    parser.add_argument("symbols", nargs="*", default=DEFAULT_SYMBOLS)
+    parser.add_argument("--range", default="max", help="Yahoo range, e.g. 1y, 10y, max")
+    args = parser.parse_args()
+
+    for symbol in args.symbols:
+        try:
+            added = backfill_history(symbol, args.range)
+            logger.info(f"{symbol}: appended {added} bars")
+        except Exception as exc:
+            logger.error(f"{symbol}: backfill failed: {exc}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Bulk goal import vs. POST /goals/ one goal at a time.
+
+Run from the repo root:  python -m scripts.bench_goal_import [rows]
+"""
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from backend import models
+from backend.database import make_engine
+from backend.routers import goals
+from backend.services.planner import plan_event
+
+
+def make_goals(n: int) -> list:
+    this_year = datetime.now().year
+    return [
+        {"event_name": f"Goal {i}", "today_cost": 50_000 + (i * 7919) % 5_000_000, "target_year": this_year + i % 40}
+        for i in range(n)
+    ]
+
+
+def _client(path: Path) -> TestClient:
+    engine = make_engine(f"sqlite:///{path}")
+    models.Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(goals.router)
+    app.dependency_overrides[goals.get_db] = get_db
+    return TestClient(app)
+
+
+def main(n: int = 50000, single: int = 1000) -> None:
+    rows = make_goals(n)
+    plan_event("warm-up", 1000, datetime.now().year + 1)  # load inflation once
+
+    with tempfile.TemporaryDirectory() as tmp:
+        client = _client(Path(tmp) / "single.db")
+        start = time.perf_counter()
+        for row in rows[:single]:
+            client.post("/goals/", json=row).raise_for_status()
+        single_s = time.perf_counter() - start
+
+        client = _client(Path(tmp) / "bulk.db")
+        body = "\n".join(json.dumps(row) for row in rows).encode()
+        start = time.perf_counter()
+        report = client.post("/goals/import", content=body).json()
+        bulk_s = time.perf_counter() - start
+        assert report["imported"] == n, report
+
+    per_goal = single_s / single
+    print(f"rows: {n}")
+    print(f"POST /goals/ x{single:<6}   {single_s:7.2f} s  ({single / single_s:8.0f} goals/s, ~{per_goal * n:.0f} s for {n})")
+    print(f"POST /goals/import     {bulk_s:7.2f} s  ({n / bulk_s:8.0f} goals/s, {per_goal * n / bulk_s:.0f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,112 @@
+"""Goal CRUD under concurrent clients: sync routes vs. the DB_ASYNC routes.
+
+Each client creates one goal and then reads it back `reads` times. Requests
+go through httpx's in-process ASGI transport, so the sync routes are bound by
+Starlette's threadpool exactly as under uvicorn.
+
+Run from the repo root:  python -m scripts.bench_goals_db [clients ...]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend import models
+from backend.database import make_async_engine, make_async_sessionmaker
+from backend.routers import goals, goals_async
+from backend.services.planner import plan_event
+
+
+def sync_app(url: str) -> FastAPI:
+    SessionLocal = sessionmaker(bind=create_engine(url, connect_args={"check_same_thread": False}))
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(goals.router)
+    app.dependency_overrides[goals.get_db] = get_db
+    return app
+
+
+def async_app(url: str, async_engine) -> FastAPI:
+    AsyncSessionLocal = make_async_sessionmaker(async_engine)
+
+    async def get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(goals_async.router)
+    app.dependency_overrides[goals_async.get_async_db] = get_async_db
+    return app
+
+
+async def run_clients(app: FastAPI, clients: int, reads: int) -> tuple:
+    latencies = []
+    errors = 0
+    year = datetime.now().year + 5
+
+    async def timed(call):
+        nonlocal errors
+        start = time.perf_counter()
+        resp = await call
+        latencies.append(time.perf_counter() - start)
+        if resp.status_code >= 400:  # e.g. "database is locked" under write contention
+            errors += 1
+            return None
+        return resp
+
+    async def client(i: int, http: httpx.AsyncClient):
+        resp = await timed(http.post("/goals/", json={"event_name": f"g{i}", "today_cost": 1000 + i, "target_year": year}))
+        if resp is None:
+            return
+        goal_id = resp.json()["id"]
+        for _ in range(reads):
+            await timed(http.get(f"/goals/{goal_id}"))
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as http:
+        start = time.perf_counter()
+        await asyncio.gather(*(client(i, http) for i in range(clients)))
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    return elapsed, len(latencies), errors, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.95)]
+
+
+async def bench(mode: str, url: str, clients: int, reads: int) -> tuple:
+    if mode == "sync":
+        return await run_clients(sync_app(url), clients, reads)
+    async_engine = make_async_engine(url)
+    try:
+        return await run_clients(async_app(url, async_engine), clients, reads)
+    finally:
+        await async_engine.dispose()  # aiosqlite threads would keep the process alive
+
+
+def main(levels=(100, 300, 1000), reads: int = 4) -> None:
+    plan_event("warm-up", 1000, datetime.now().year + 1)  # load inflation once
+    with tempfile.TemporaryDirectory() as tmp:
+        for clients in levels:
+            for mode in ("sync", "async"):
+                url = f"sqlite:///{Path(tmp) / f'{mode}_{clients}.db'}"
+                models.Base.metadata.create_all(bind=create_engine(url))
+                elapsed, n, errors, p50, p95 = asyncio.run(bench(mode, url, clients, reads))
+                print(f"{clients:5d} clients  {mode:<5}  {n / elapsed:7.0f} req/s  "
+                      f"p50 {p50 * 1000:7.1f} ms  p95 {p95 * 1000:7.1f} ms  errors {errors}")
+
+
+if __name__ == "__main__":
+    levels = tuple(int(a) for a in sys.argv[1:]) or (100, 300, 1000)
+    main(levels)
@@ -0,0 +1,81 @@
+"""GET /goals page latency against a large goals table.
+
+Seeds `rows` goals (each with a calculation) into a temporary SQLite file and
+times keyset pages at the start, middle and end of the table, with filters
+and with the slim projection. Every page should take about the same time.
+
+Run from the repo root:  python -m scripts.bench_goals_pagination [rows]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from backend import models
+from backend.database import make_engine
+from backend.routers import goals
+
+CHUNK = 50_000
+
+
+def seed(engine, rows: int) -> None:
+    with engine.begin() as conn:
+        for start in range(1, rows + 1, CHUNK):
+            ids = range(start, min(start + CHUNK, rows + 1))
+            conn.exec_driver_sql(
+                "INSERT INTO goals (id, event_name, today_cost, target_year) VALUES (?, ?, ?, ?)",
+                [(i, f"Goal {i % 1000:03d}", 1000.0 + i, 2030 + i % 30) for i in ids],
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO calculations (id, future_cost, monthly_saving, goal_id) VALUES (?, ?, ?, ?)",
+                [(i, 2000.0 + i, 10.0, i) for i in ids],
+            )
+
+
+def main(rows: int = 1_000_000, repeat: int = 20) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(f"sqlite:///{Path(tmp) / 'goals.db'}")
+        models.Base.metadata.create_all(bind=engine)
+        start = time.perf_counter()
+        seed(engine, rows)
+        print(f"seeded {rows} goals in {time.perf_counter() - start:.1f}s")
+
+        SessionLocal = sessionmaker(bind=engine)
+
+        def get_db():
+            db = SessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app = FastAPI()
+        app.include_router(goals.router)
+        app.dependency_overrides[goals.get_db] = get_db
+        client = TestClient(app)
+
+        cases = {
+            "first page": "/goals/?limit=100",
+            "middle page": f"/goals/?limit=100&after_id={rows // 2}",
+            "last page": f"/goals/?limit=100&after_id={rows - 100}",
+            "year filter, deep": f"/goals/?limit=100&target_year=2045&after_id={rows - 100_000}",
+            "name prefix, deep": f"/goals/?limit=100&event_name_prefix=Goal 99&after_id={rows - 100_000}",
+            "slim fields, deep": f"/goals/?limit=100&fields=event_name,target_year&after_id={rows // 2}",
+        }
+        for name, url in cases.items():
+            timings = []
+            for _ in range(repeat):
+                t = time.perf_counter()
+                resp = client.get(url)
+                timings.append(time.perf_counter() - t)
+                resp.raise_for_status()
+            print(f"{name:<18} {sorted(timings)[repeat // 2] * 1000:7.2f} ms  ({len(resp.json())} goals)")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,107 @@
+"""Benchmark the market summary against a local stub Yahoo server.
+
+Run from the repo root:  python -m scripts.bench_market_fetch [delay_seconds]
+
+Compares the old sequential fetch (a fresh connection per index) with the
+pooled, concurrent fetch in backend.services.market, and with the cached
+summary served by fetch_index_summary.
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+import requests
+
+from backend.services import market
+from backend.settings import settings
+
+
+def start_stub_yahoo(delay: float = 0.2) -> ThreadingHTTPServer:
+    """Serve Yahoo-shaped chart JSON on 127.0.0.1 after `delay` seconds.
+
+    `server.hits` counts requests; set `server.fail = True` to answer 503.
+    Symbols in `server.unknown` get Yahoo's 404 "Not Found" chart.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like the real endpoint
+
+        def do_GET(self):
+            self.server.hits += 1
+            time.sleep(delay)
+            if self.server.fail:
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            symbol = unquote(self.path.split("/chart/", 1)[-1].split("?", 1)[0])
+            if symbol in self.server.unknown:
+                status = 404
+                body = json.dumps({"chart": {"result": None, "error": {"code": "Not Found"}}}).encode()
+            else:
+                status = 200
+                body = json.dumps({"chart": {"result": [{"meta": {
+                    "symbol": symbol, "regularMarketPrice": 22400.5, "currency": "INR",
+                }}]}}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.hits = 0
+    server.fail = False
+    server.unknown = set()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def point_settings_at(server: ThreadingHTTPServer) -> None:
+    base = f"http://127.0.0.1:{server.server_address[1]}/v8/finance/chart"
+    settings.yf_nifty_url = f"{base}/%5ENSEI?range=1d&interval=1d"
+    settings.yf_sensex_url = f"{base}/%5EBSESN?range=1d&interval=1d"
+    settings.yf_chart_url_template = base + "/{symbol}?range=1d&interval=1d"
+    settings.use_mock_market = False
+
+
+def _sequential_summary() -> dict:
+    out = {}
+    for name, url in market.index_urls().items():
+        meta = requests.get(url, timeout=10).json()["chart"]["result"][0]["meta"]
+        out[name] = {"symbol": meta["symbol"], "last_price": meta["regularMarketPrice"]}
+    return out
+
+
+def _time(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1000.0
+
+
+def main(delay: float = 0.2, rounds: int = 10) -> None:
+    server = start_stub_yahoo(delay)
+    point_settings_at(server)
+    try:
+        sequential = _time(_sequential_summary, rounds)
+        concurrent = _time(lambda: market.fetch_indices(market.index_urls()), rounds)
+        market.clear_market_cache()
+        cached = _time(market.fetch_index_summary, rounds)
+    finally:
+        server.shutdown()
+    print(f"stub delay {delay * 1000:.0f} ms per symbol, {len(market.index_urls())} symbols, {rounds} rounds")
+    print(f"sequential {sequential:8.1f} ms/summary")
+    print(f"concurrent {concurrent:8.1f} ms/summary")
+    print(f"cached     {cached:8.1f} ms/summary (TTL {settings.cache_ttl_market_seconds}s)")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.2)
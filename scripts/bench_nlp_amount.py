@@ -0,0 +1,96 @@
+"""Micro-benchmark amount extraction: compiled priority pattern vs. the old regex cascade.
+
+Run from the repo root:  python -m scripts.bench_nlp_amount
+"""
+import re
+import timeit
+from typing import Optional
+
+from backend.services.nlp import _extract_amount
+
+# Sentences on which the scanner must agree with the old cascade.
+PARITY_CORPUS = [
+    "Plan Goa trip Dec 2026 for ₹50000",
+    "Wedding in December 2026 for 8 lakhs",
+    "Buy a car in 2028 for 6.5 lakh",
+    "Save for a house down payment by 2031, budget 25 lakhs",
+    "Kids college fund 2035 for 20L",
+    "Europe vacation next year for ₹3,00,000",
+    "Retirement corpus in 20 years for 2 crore",
+    "Plan my sister's wedding in Nov 2026 for Rs. 12 lakhs",
+    "Home renovation in March, ₹4,50,000",
+    "MBA fees 2029 cost is 18 lakhs",
+    "Buy a flat 5 years from now, INR 80 lakhs",
+    "Bike 2027 rs 95000",
+    "Amount: 1.5 crores for a villa in 2040",
+    "Trip to Ladakh in 2027 with ₹ 1.2 lakh",
+    "Wedding 2026 8 lakhs",
+    "Plan a trip to Ladakh in 2027",
+    "Budget of ₹75,000 for a laptop in 2026",
+]
+
+# Forms the old cascade did not understand.
+EXTENDED_CORPUS = [
+    ("Plan Goa trip Dec 2026 for 50k", 50_000.0),
+    ("Villa in 2040, 1.2 cr", 12_000_000.0),
+    ("Wedding 2027 ₹8,00,000", 800_000.0),
+    ("Phone next year 45 thousand", 45_000.0),
+]
+
+
+def _legacy_extract_amount(text: str) -> Optional[float]:
+    """The pre-scanner cascade, kept verbatim as the parity reference."""
+    def to_amount(number_str, unit):
+        try:
+            number = float(number_str.replace(",", ""))
+        except Exception:
+            return None
+        unit_norm = (unit or "").lower()
+        if unit_norm in {"lakh", "lakhs", "lac", "lacs", "l"}:
+            return number * 100_000
+        if unit_norm in {"crore", "crores", "cr"}:
+            return number * 10_000_000
+        return number
+
+    t = text.strip()
+    t = t.replace("Rs.", "Rs").replace("rs.", "rs")
+    ctx_pattern = r"(?:for|budget|cost|amount)\s*(?:of|is|=|:)?\s*(₹|rs|inr)?\s*([0-9][0-9,]*\.?[0-9]*)\s*(lakh|lakhs|lac|lacs|l|crore|crores|cr)?"
+    m = re.search(ctx_pattern, t, flags=re.IGNORECASE)
+    if m:
+        amt = to_amount(m.group(2), m.group(3))
+        if amt is not None:
+            return amt
+    currency_patterns = [
+        r"₹\s*([0-9][0-9,]*\.?[0-9]*)\s*(lakh|lakhs|lac|lacs|l|crore|crores|cr)?",
+        r"(?:rs|inr)\s*([0-9][0-9,]*\.?[0-9]*)\s*(lakh|lakhs|lac|lacs|l|crore|crores|cr)?",
+    ]
+    for pat in currency_patterns:
+        m = re.search(pat, t, flags=re.IGNORECASE)
+        if m:
+            amt = to_amount(m.group(1), m.group(2) if len(m.groups()) >= 2 else None)
+            if amt is not None:
+                return amt
+    unit_pattern = r"([0-9][0-9,]*\.?[0-9]*)\s*(lakh|lakhs|lac|lacs|l|crore|crores|cr)\b"
+    m = re.search(unit_pattern, t, flags=re.IGNORECASE)
+    if m:
+        amt = to_amount(m.group(1), m.group(2))
+        if amt is not None:
+            return amt
+    return None
+
+
+def _per_call_us(fn, number: int) -> float:
+    total = timeit.timeit(lambda: [fn(t) for t in PARITY_CORPUS], number=number)
+    return total / (number * len(PARITY_CORPUS)) * 1e6
+
+
+def main(number: int = 2000) -> None:
+    legacy = _per_call_us(_legacy_extract_amount, number)
+    compiled = _per_call_us(_extract_amount, number)
+    print(f"corpus: {len(PARITY_CORPUS)} sentences x {number} rounds")
+    print(f"legacy   {legacy:.2f} us/call")
+    print(f"compiled {compiled:.2f} us/call  ({legacy / compiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Throughput of batch goal parsing: serial loop vs. the NLP process pool.
+
+Run from the repo root:  python -m scripts.bench_nlp_batch [batch_size]
+Set NLP_BATCH_WORKERS to pin the pool size (default: one per core).
+"""
+import os
+import sys
+import time
+
+from backend.services import nlp_batch
+from backend.services.nlp import parse_goal_text
+from backend.settings import settings
+from scripts.bench_nlp_year import CORPUS
+
+
+def _serial(texts):
+    out = []
+    for t in texts:
+        try:
+            out.append(parse_goal_text(t))
+        except ValueError as exc:
+            out.append(str(exc))
+    return out
+
+
+def main(batch_size: int = 2000) -> None:
+    texts = [CORPUS[i % len(CORPUS)] + f" #{i}" for i in range(batch_size)]
+
+    _serial(CORPUS)  # warm dateparser in this process too
+    start = time.perf_counter()
+    _serial(texts)
+    serial_s = time.perf_counter() - start
+
+    nlp_batch.warm_pool()
+    start = time.perf_counter()
+    nlp_batch.parse_goal_texts(texts)
+    pool_s = time.perf_counter() - start
+    nlp_batch.shutdown_pool()
+
+    workers = settings.nlp_batch_workers or os.cpu_count()
+    print(f"batch: {batch_size} texts, {workers} workers")
+    print(f"serial {batch_size / serial_s:8.0f} texts/s")
+    print(f"pool   {batch_size / pool_s:8.0f} texts/s  ({serial_s / pool_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
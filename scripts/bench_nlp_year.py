@@ -0,0 +1,95 @@
+"""Benchmark year extraction: tiered lexer vs. the old dateparser-first path.
+
+Run from the repo root:  python -m scripts.bench_nlp_year
+"""
+import re
+import statistics
+import time
+from collections import Counter
+from datetime import datetime
+
+from dateparser.search import search_dates
+
+from backend.services.nlp import _extract_year_tiered
+
+CORPUS = [
+    "Plan Goa trip Dec 2026 for ₹50000",
+    "Wedding in December 2027 for 8 lakhs",
+    "Buy a car in 2028 for 6.5 lakh",
+    "Save for a house down payment by 2031, budget 25 lakhs",
+    "Kids college fund 2035 for 20L",
+    "Europe vacation next year for ₹3,00,000",
+    "Retirement corpus in 20 years for 2 crore",
+    "New laptop in 6 months for 90000",
+    "Plan my sister's wedding in Nov 2026 for Rs. 12 lakhs",
+    "Home renovation in March for ₹4,50,000",
+    "I want a bike in two years for 1.2 lakh",
+    "Emergency fund of 5 lakhs this year",
+    "Plan Bali honeymoon Feb '27 for 2.5L",
+    "MBA fees 2029 cost is 18 lakhs",
+    "Buy a flat 5 years from now for 80 lakhs",
+    "Plan a trip to Ladakh sometime soon for 60k",
+    "Christmas trip Dec-25 for 50k",  # legacy (Oct 2026): 2026
+    "Goa trip Jun-15 to Jun-20",  # legacy (Oct 2026): 2027
+    "Save 2000 monthly, car in 3 years for 5 lakh",  # legacy: 2003
+]
+
+# Sentences the tiered path deliberately resolves differently: dateparser
+# reads "fees 2029" and "2000 monthly, ... 3 years" as other dates.
+LEGACY_MISREADS = {
+    "MBA fees 2029 cost is 18 lakhs",
+    "Save 2000 monthly, car in 3 years for 5 lakh",
+}
+
+
+def _legacy_extract_year(text: str):
+    """The pre-tiering implementation: search_dates first, regex second."""
+    now_year = datetime.now().year
+    try:
+        results = search_dates(text, settings={"PREFER_DATES_FROM": "future"})
+        if results:
+            for _, dt in results:
+                if dt.year >= now_year:
+                    return dt.year
+            return results[-1][1].year
+    except Exception:
+        pass
+    for c in re.findall(r"(?<![0-9])20[2-9][0-9](?![0-9])", text):
+        if int(c) >= now_year:
+            return int(c)
+    return None
+
+
+def _time_calls(fn, rounds: int) -> list:
+    samples = []
+    for _ in range(rounds):
+        for text in CORPUS:
+            start = time.perf_counter()
+            fn(text)
+            samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def _summary(samples: list) -> str:
+    qs = statistics.quantiles(samples, n=100)
+    return f"p50={qs[49]:.3f}ms p99={qs[98]:.3f}ms mean={statistics.mean(samples):.3f}ms"
+
+
+def main(rounds: int = 20) -> None:
+    # Warm both paths so dateparser's lazy language loading is not measured.
+    for text in CORPUS:
+        _legacy_extract_year(text)
+        _extract_year_tiered(text)
+
+    legacy = _time_calls(_legacy_extract_year, rounds)
+    tiered = _time_calls(lambda t: _extract_year_tiered(t)[0], rounds)
+
+    tiers = Counter(_extract_year_tiered(t)[1] for t in CORPUS)
+    print(f"corpus: {len(CORPUS)} sentences x {rounds} rounds")
+    print(f"legacy  {_summary(legacy)}")
+    print(f"tiered  {_summary(tiered)}")
+    print(f"tiers   {dict(tiers)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Batch planning throughput: looping plan_event vs. the vectorized planner.
+
+Run from the repo root:  python -m scripts.bench_planner_batch [rows]
+"""
+import sys
+import time
+from datetime import datetime
+
+from backend.services import planner_batch
+from backend.services.planner import plan_event
+
+
+def make_rows(n: int) -> list:
+    this_year = datetime.now().year
+    return [
+        {"event_name": f"Goal {i}", "today_cost": 50_000 + (i * 7919) % 5_000_000, "target_year": this_year + i % 40}
+        for i in range(n)
+    ]
+
+
+def main(n: int = 20000) -> None:
+    rows = make_rows(n)
+    plan_event("warm-up", 1000, datetime.now().year + 1)  # load inflation once
+
+    start = time.perf_counter()
+    looped = [plan_event(r["event_name"], r["today_cost"], r["target_year"]) for r in rows]
+    loop_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = planner_batch.rows_from_json(rows)
+    plans = planner_batch.plan_rows(batch)
+    compute_s = time.perf_counter() - start
+    body = "".join(planner_batch.iter_ndjson(batch, plans))
+    total_s = time.perf_counter() - start
+
+    assert plans["future_cost"].tolist() == [p["future_cost"] for p in looped]
+    print(f"rows: {n}")
+    print(f"plan_event loop        {loop_s * 1000:8.1f} ms")
+    print(f"vectorized (parse+calc) {compute_s * 1000:7.1f} ms  ({loop_s / compute_s:.0f}x)")
+    print(f"vectorized + NDJSON    {total_s * 1000:8.1f} ms  ({len(body) / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,48 @@
+"""Query latency of the memory-mapped price history store.
+
+Run from the repo root:  python -m scripts.bench_price_history [years]
+
+Writes synthetic daily bars to a temporary store, then times a cold load,
+a 10-year range slice and weekly/monthly downsampling.
+"""
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from backend.services.price_history import PriceHistoryStore
+
+DAY = 86_400
+
+
+def _synthetic_bars(n: int) -> dict:
+    rng = np.random.default_rng(7)
+    ts = np.arange(n, dtype=np.int64) * DAY + 1_000_000_000
+    close = 5000 * np.exp(np.cumsum(rng.normal(0.0004, 0.01, n)))
+    return {"ts": ts, "open": close, "high": close * 1.01, "low": close * 0.99, "close": close, "volume": np.ones(n)}
+
+
+def _ms(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main(years: int = 100) -> None:
+    n = years * 365
+    with tempfile.TemporaryDirectory() as root:
+        store = PriceHistoryStore(root)
+        store.append("^NSEI", _synthetic_bars(n))
+
+        cold = PriceHistoryStore(root)
+        print(f"{n} daily bars")
+        print(f"cold load          {_ms(lambda: cold.columns('^NSEI')):7.3f} ms")
+        lo, hi = 1_000_000_000 + 365 * DAY * 10, 1_000_000_000 + 365 * DAY * 20
+        print(f"10y range slice    {_ms(lambda: cold.range('^NSEI', lo, hi)):7.3f} ms")
+        print(f"10y weekly         {_ms(lambda: cold.downsample('^NSEI', 'weekly', lo, hi)):7.3f} ms")
+        print(f"all-time monthly   {_ms(lambda: cold.downsample('^NSEI', 'monthly')):7.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
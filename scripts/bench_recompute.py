@@ -0,0 +1,78 @@
+"""Recompute of stale calculations: batched job vs. refreshing rows one at a time.
+
+Run from the repo root:  python -m scripts.bench_recompute [rows]
+"""
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+from sqlalchemy.orm import joinedload, sessionmaker
+
+from backend import models
+from backend.database import make_engine
+from backend.services import recompute
+from backend.services.planner import _get_inflation_percent, plan_event
+from backend.settings import settings
+
+CHUNK = 50_000
+
+
+def seed(engine, rows: int) -> None:
+    this_year = datetime.now().year
+    with engine.begin() as conn:
+        for start in range(1, rows + 1, CHUNK):
+            ids = range(start, min(start + CHUNK, rows + 1))
+            conn.exec_driver_sql(
+                "INSERT INTO goals (id, event_name, today_cost, target_year) VALUES (?, ?, ?, ?)",
+                [(i, f"Goal {i}", 1000.0 + i, this_year + i % 30) for i in ids],
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO calculations (id, future_cost, monthly_saving, goal_id, inflation_version, computed_on) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(i, 0.0, 0.0, i, "0.0000", date.today().isoformat()) for i in ids],
+            )
+
+
+def main(rows: int = 200_000, single: int = 500) -> None:
+    pct = _get_inflation_percent()
+    version = recompute.inflation_version(pct)
+    settings.recompute_rows_per_second = float("inf")  # measure the unthrottled cost
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_engine(f"sqlite:///{Path(tmp) / 'recompute.db'}")
+        models.Base.metadata.create_all(bind=engine)
+        seed(engine, rows)
+        SessionLocal = sessionmaker(bind=engine)
+
+        with SessionLocal() as db:
+            start = time.perf_counter()
+            stale = recompute.count_stale(db, version)
+            count_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for goal in db.query(models.Goal).options(joinedload(models.Goal.calculation)).limit(single):
+                plan = plan_event(goal.event_name, goal.today_cost, goal.target_year)
+                goal.calculation.future_cost = plan["future_cost"]
+                goal.calculation.monthly_saving = plan["monthly_saving_needed"]
+                for column, value in recompute.calculation_stamp(plan["inflation_percent_used"]).items():
+                    setattr(goal.calculation, column, value)
+                db.commit()
+            single_s = time.perf_counter() - start
+
+        job = recompute.RecomputeJob(SessionLocal)
+        start = time.perf_counter()
+        updated = job.run_pass()
+        job_s = time.perf_counter() - start
+        with SessionLocal() as db:
+            assert recompute.count_stale(db, version) == 0
+        engine.dispose()
+
+    print(f"rows: {rows}, stale count via index: {stale} in {count_s * 1000:.1f} ms")
+    print(f"per-row ORM refresh x{single:<5} {single_s:6.2f} s  ({single / single_s:8.0f} rows/s)")
+    print(f"RecomputeJob pass       {job_s:6.2f} s  ({updated / job_s:8.0f} rows/s, "
+          f"batches of {settings.recompute_batch_rows})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
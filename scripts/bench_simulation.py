@@ -0,0 +1,30 @@
+"""Monte Carlo goal simulation latency (target: 10k paths x 30 years < 100 ms).
+
+Run from the repo root:  python -m scripts.bench_simulation [paths] [years]
+"""
+import sys
+import time
+from datetime import datetime
+
+from backend.services.simulation import MODELS, simulate_goal
+
+
+def main(paths: int = 10000, years: int = 30, repeat: int = 5) -> None:
+    target_year = datetime.now().year + years
+    simulate_goal(1_000_000, target_year, n_paths=paths, seed=1)  # load inflation, warm numpy
+    print(f"{paths} paths x {years * 12} months")
+    for inflation_model in MODELS:
+        for return_model in MODELS:
+            timings = []
+            for i in range(repeat):
+                start = time.perf_counter()
+                result = simulate_goal(1_000_000, target_year, n_paths=paths, seed=i,
+                                       inflation_model=inflation_model, return_model=return_model)
+                timings.append(time.perf_counter() - start)
+            print(f"inflation={inflation_model:<10} returns={result['return_model']:<10} "
+                  f"best {min(timings) * 1000:6.1f} ms  median {sorted(timings)[repeat // 2] * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,97 @@
+"""Mixed read/write goal load: stock SQLite engine vs. the tuned profile.
+
+Worker threads each loop for `seconds`: mostly reads of a random goal with
+its calculation, plus a share of goal + calculation inserts, each in its own
+transaction. Reports throughput, latency and "database is locked" errors.
+
+Run from the repo root:  python -m scripts.bench_sqlite_profile [threads] [seconds] [write_share]
+"""
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import joinedload, sessionmaker
+
+from backend import models
+from backend.database import PROFILES, active_pragmas, make_engine
+
+SEED_GOALS = 5000
+
+
+def _insert(session, i: int) -> None:
+    goal = models.Goal(event_name=f"goal {i}", today_cost=1000.0 + i, target_year=2030 + i % 20)
+    goal.calculation = models.Calculation(future_cost=2000.0 + i, monthly_saving=10.0 + i % 100)
+    session.add(goal)
+    session.commit()
+
+
+def run(profile: str, path: Path, threads: int, seconds: float, write_share: float) -> dict:
+    url = f"sqlite:///{path}"
+    engine = make_engine(url, profile)
+    models.Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    with Session() as s:
+        s.bulk_save_objects([models.Goal(event_name=f"seed {i}", today_cost=1.0, target_year=2030)
+                             for i in range(SEED_GOALS)])
+        s.commit()
+
+    stop = time.monotonic() + seconds
+    lock = threading.Lock()
+    stats = {"reads": 0, "writes": 0, "errors": 0, "latencies": []}
+
+    def worker(n: int) -> None:
+        rng = random.Random(n)
+        local, reads, writes, errors = [], 0, 0, 0
+        i = n * 10_000_000
+        while time.monotonic() < stop:
+            start = time.perf_counter()
+            try:
+                with Session() as s:
+                    if rng.random() < write_share:
+                        i += 1
+                        _insert(s, i)
+                        writes += 1
+                    else:
+                        s.query(models.Goal).options(joinedload(models.Goal.calculation)).get(
+                            rng.randint(1, SEED_GOALS))
+                        reads += 1
+            except OperationalError:
+                errors += 1
+            local.append(time.perf_counter() - start)
+        with lock:
+            stats["reads"] += reads
+            stats["writes"] += writes
+            stats["errors"] += errors
+            stats["latencies"].extend(local)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    stats["pragmas"] = active_pragmas(engine)
+    engine.dispose()
+    return stats
+
+
+def main(threads: int = 16, seconds: float = 5.0, write_share: float = 0.2) -> None:
+    print(f"{threads} threads, {seconds:.0f}s, {write_share:.0%} writes")
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in PROFILES:
+            stats = run(profile, Path(tmp) / f"{profile}.db", threads, seconds, write_share)
+            lat = sorted(stats["latencies"])
+            p = stats["pragmas"]
+            print(f"{profile:<8} {(stats['reads'] + stats['writes']) / seconds:7.0f} ops/s  "
+                  f"writes {stats['writes'] / seconds:6.0f}/s  p50 {lat[len(lat) // 2] * 1000:6.2f} ms  "
+                  f"p99 {lat[int(len(lat) * 0.99)] * 1000:7.2f} ms  locked {stats['errors']}  "
+                  f"(journal={p['journal_mode']} sync={p['synchronous']})")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 16, float(args[1]) if len(args) > 1 else 5.0,
+         float(args[2]) if len(args) > 2 else 0.2)
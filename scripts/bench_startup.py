@@ -0,0 +1,70 @@
+"""Import-time report for the API process (like `python -X importtime`).
+
+Run from the repo root:  python -m scripts.bench_startup [--top N] [--max-ms MS]
+
+Imports `backend.main` in a fresh interpreter, prints the slowest modules by
+cumulative import time and fails if any module listed in LAZY_MODULES was
+imported eagerly or if the total exceeds --max-ms.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Heavy dependencies that must only load on first use / background warm-up.
+LAZY_MODULES = ("dateparser", "spacy")
+
+
+def import_times(module: str = "backend.main") -> list:
+    """Return [(module, self_us, cumulative_us)] for a cold import of `module`."""
+    # importing backend.main creates/migrates its database; keep that off sql_app.db
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {**os.environ, "DATABASE_URL": f"sqlite:///{Path(tmp) / 'startup.db'}"}
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    rows = import_times()
+    total_ms = next(c for n, _, c in rows if n == "backend.main") / 1000.0
+
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, self_us, cum_us in sorted(rows, key=lambda r: r[2], reverse=True)[: args.top]:
+        print(f"{cum_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+    print(f"\nimport backend.main: {total_ms:.1f} ms")
+
+    failed = False
+    eager = sorted({n.split(".")[0] for n, _, _ in rows} & set(LAZY_MODULES))
+    if eager:
+        print(f"FAIL: imported eagerly: {', '.join(eager)}")
+        failed = True
+    if args.max_ms is not None and total_ms > args.max_ms:
+        print(f"FAIL: {total_ms:.1f} ms exceeds budget of {args.max_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import agent
+from backend.settings import settings
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.include_router(agent.router)
+    return TestClient(app)
+
+
+def test_chat_returns_partial_answer_at_deadline(monkeypatch):
+    monkeypatch.setattr(settings, "agent_deadline_seconds", 0.3)
+    monkeypatch.setattr(agent, "plan_event", lambda *a, **k: (_ for _ in ()).throw(RuntimeError("no plan")))
+    monkeypatch.setattr(agent, "fetch_index_summary", lambda: (time.sleep(2), {})[1])
+
+    started = time.monotonic()
+    body = _client().post("/agent/chat", json={"message": "Trip Dec 2030 for 50k, how is the market?"}).json()
+
+    assert time.monotonic() - started < 1.5
+    assert body["market_summary"] is None
+    assert agent.TIMEOUT_REPLIES["market"] in body["reply"]
+
+
+def test_chat_stream_emits_parts_then_final(monkeypatch):
+    monkeypatch.setattr(agent, "fetch_index_summary", lambda: {"NIFTY_50": {"last_price": 1}, "SENSEX": {}})
+
+    with _client().stream("POST", "/agent/chat/stream", json={"message": "Trip Dec 2030 for 50k, market?"}) as resp:
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = [line.split(": ", 1)[1] for line in resp.iter_lines() if line.startswith("event:")]
+
+    assert sorted(events[:-1]) == ["market", "plan"]
+    assert events[-1] == "final"
@@ -0,0 +1,30 @@
+import time
+
+from backend.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+def test_breaker_opens_after_threshold_and_fails_fast():
+    breaker = CircuitBreaker("test", failure_threshold=2, cooldown_seconds=60)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.snapshot()["rejected_calls"] == 1
+
+
+def test_breaker_half_open_allows_single_probe():
+    breaker = CircuitBreaker("test", failure_threshold=1, cooldown_seconds=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()  # only one probe in flight
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
@@ -0,0 +1,42 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import QueuePool
+
+from backend import database
+from backend.routers import diagnostics
+
+
+def test_tuned_profile_sets_pragmas_and_pools(tmp_path):
+    tuned = database.make_engine(f"sqlite:///{tmp_path / 'tuned.db'}", "tuned")
+    stock = database.make_engine(f"sqlite:///{tmp_path / 'stock.db'}", "default")
+    try:
+        assert isinstance(tuned.pool, QueuePool)
+        pragmas = database.active_pragmas(tuned)
+        assert pragmas["journal_mode"] == "wal"
+        assert pragmas["synchronous"] == 1  # NORMAL
+        assert pragmas["busy_timeout"] == database.settings.sqlite_busy_timeout_ms
+        assert pragmas["cache_size"] == database.settings.sqlite_cache_size
+        assert database.active_pragmas(stock)["journal_mode"] == "delete"
+    finally:
+        tuned.dispose()
+        stock.dispose()
+
+
+def test_diagnostics_reports_active_pragmas(tmp_path, monkeypatch):
+    tuned = database.make_engine(f"sqlite:///{tmp_path / 'diag.db'}", "tuned")
+    monkeypatch.setattr(database, "engine", tuned)
+    app = FastAPI()
+    app.include_router(diagnostics.router)
+    body = TestClient(app).get("/diagnostics/database").json()
+    tuned.dispose()
+    assert body["pragmas"]["journal_mode"] == "wal"
+    assert "Pool size" in body["pool"]
+
+
+def test_check_same_thread_is_only_passed_to_sqlite(monkeypatch):
+    calls = []
+    monkeypatch.setattr(database, "create_engine", lambda url, **kwargs: calls.append(kwargs) or None)
+    database.make_engine("postgresql://user@localhost/app", "tuned")
+    database.make_engine("sqlite://", "tuned")
+    assert calls[0]["connect_args"] == {}
+    assert calls[1]["connect_args"] == {"check_same_thread": False}
@@ -0,0 +1,149 @@
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend import models
+from backend.database import make_async_engine, make_async_sessionmaker
+from backend.routers import goals, goals_async
+from backend.services import goal_import, inflation
+from backend.settings import settings
+
+
+@pytest.fixture
+def db_url(tmp_path, monkeypatch):
+    monkeypatch.setattr(inflation, "fetch_worldbank_inflation",
+                        lambda: {"inflation_percent": 10.0, "source": "worldbank", "series": None})
+    inflation.reset_inflation_provider()
+    url = f"sqlite:///{tmp_path / 'goals.db'}"
+    models.Base.metadata.create_all(bind=create_engine(url))
+    yield url
+    inflation.reset_inflation_provider()
+
+
+def _sync_client(url: str) -> TestClient:
+    SessionLocal = sessionmaker(bind=create_engine(url, connect_args={"check_same_thread": False}))
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(goals.router)
+    app.dependency_overrides[goals.get_db] = get_db
+    return TestClient(app)
+
+
+def _async_client(url: str) -> TestClient:
+    async_engine = make_async_engine(url)
+    AsyncSessionLocal = make_async_sessionmaker(async_engine)
+
+    async def get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        await async_engine.dispose()  # like main's lifespan; pooled aiosqlite threads block exit
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(goals_async.router)
+    app.dependency_overrides[goals_async.get_async_db] = get_async_db
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("make_client", [_sync_client, _async_client], ids=["sync", "async"])
+def test_goal_crud(db_url, make_client):
+    with make_client(db_url) as client:
+        _exercise_crud(client)
+
+
+def _exercise_crud(client: TestClient):
+    year = datetime.now().year + 1
+
+    created = client.post("/goals/", json={"event_name": "Bike", "today_cost": 100000, "target_year": year}).json()
+    assert created["calculation"]["future_cost"] == 110000.0
+
+    updated = client.patch(f"/goals/{created['id']}", json={"today_cost": 200000}).json()
+    assert updated["calculation"]["future_cost"] == 220000.0
+    assert [g["id"] for g in client.get("/goals/").json()] == [created["id"]]
+    assert client.get(f"/goals/{created['id']}").json()["event_name"] == "Bike"
+
+    assert client.delete(f"/goals/{created['id']}").status_code == 204
+    assert client.get(f"/goals/{created['id']}").status_code == 404
+    assert client.get("/goals/").json() == []
+
+
+@pytest.mark.parametrize("make_client", [_sync_client, _async_client], ids=["sync", "async"])
+def test_goal_list_keyset_pages_filters_and_fields(db_url, make_client):
+    year = datetime.now().year + 1
+    with make_client(db_url) as client:
+        for i in range(5):
+            client.post("/goals/", json={"event_name": f"Trip {i}", "today_cost": 1000, "target_year": year + i % 2})
+        client.post("/goals/", json={"event_name": "Car", "today_cost": 5000, "target_year": year})
+
+        first = client.get("/goals/?limit=4")
+        assert [g["id"] for g in first.json()] == [1, 2, 3, 4]
+        assert first.json()[0]["calculation"]["future_cost"] == 1100.0
+        cursor = first.headers["X-Next-Cursor"]
+        last = client.get(f"/goals/?limit=4&after_id={cursor}")
+        assert [g["id"] for g in last.json()] == [5, 6]
+        assert "X-Next-Cursor" not in last.headers
+
+        slim = client.get(f"/goals/?target_year={year}&event_name_prefix=Trip&fields=event_name,target_year").json()
+        assert slim == [{"id": 1, "event_name": "Trip 0", "target_year": year},
+                        {"id": 3, "event_name": "Trip 2", "target_year": year},
+                        {"id": 5, "event_name": "Trip 4", "target_year": year}]
+        assert [g["id"] for g in client.get("/goals/?event_name=Car").json()] == [6]
+        assert client.get("/goals/?fields=nope").status_code == 400
+
+
+@pytest.mark.parametrize("make_client", [_sync_client, _async_client], ids=["sync", "async"])
+def test_goal_import_streams_chunks_and_reports_row_errors(db_url, make_client, monkeypatch):
+    monkeypatch.setattr(settings, "goal_import_chunk_rows", 2)
+    year = datetime.now().year + 1
+    lines = [
+        json.dumps({"event_name": "Car", "today_cost": 100000, "target_year": year}),
+        "{not json",
+        json.dumps({"event_name": "Trip", "today_cost": -5, "target_year": year}),
+        "",
+        json.dumps({"event_name": "Phone", "today_cost": 1000, "target_year": year, "inflation_override_pct": 99}),
+        "[1]",
+    ]
+    with make_client(db_url) as client:
+        report = client.post("/goals/import", content="\n".join(lines)).json()
+        assert report == {"received": 5, "imported": 2, "failed": 3, "errors": [
+            {"line": 2, "error": "invalid JSON"},
+            {"line": 3, "error": "today_cost must be > 0"},
+            {"line": 6, "error": "each line must be a JSON object"},
+        ]}
+
+        csv_body = f"event_name,today_cost,target_year\nBike,2000,{year}\nTV,3000,{year - 5}\n"
+        report = client.post("/goals/import", content=csv_body, headers={"Content-Type": "text/csv"}).json()
+        assert (report["imported"], report["errors"]) == (1, [{"line": 3, "error": "target_year cannot be in the past"}])
+        assert client.post("/goals/import", content="name,cost\nx,1\n",
+                           headers={"Content-Type": "text/csv"}).status_code == 400
+
+        goals = client.get("/goals/").json()
+        assert [(g["id"], g["event_name"]) for g in goals] == [(1, "Car"), (2, "Phone"), (3, "Bike")]
+        assert goals[0]["calculation"]["future_cost"] == 110000.0
+        # imported goals behave like ones created one at a time
+        assert client.patch("/goals/3", json={"today_cost": 4000}).json()["calculation"]["future_cost"] == 4400.0
+
+
+def test_import_matches_returned_ids_to_input_rows():
+    goals = [{"event_name": "A", "today_cost": 1.0, "target_year": 2030},
+             {"event_name": "B", "today_cost": 2.0, "target_year": 2031},
+             {"event_name": "A", "today_cost": 1.0, "target_year": 2030}]
+    returned = [(12, "B", 2.0, 2031), (11, "A", 1.0, 2030), (13, "A", 1.0, 2030)]
+    ids = goal_import._ids_in_input_order(returned, goals)
+    assert ids[1] == 12 and sorted(ids[::2]) == [11, 13]
@@ -0,0 +1,86 @@
+import threading
+import time
+
+from backend.services import inflation
+from backend.settings import settings
+
+
+def test_inflation_loads_once_and_refreshes_in_background(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def fake_fetch():
+        calls.append(1)
+        if len(calls) > 1:
+            release.wait(1)  # a slow World Bank refresh
+        return {"inflation_percent": 5.0 + len(calls), "source": "worldbank"}
+
+    monkeypatch.setattr(inflation, "fetch_worldbank_inflation", fake_fetch)
+    inflation.reset_inflation_provider()
+    try:
+        assert inflation.current_inflation()["inflation_percent"] == 6.0
+        assert inflation.current_inflation()["inflation_percent"] == 6.0
+        assert len(calls) == 1
+
+        monkeypatch.setattr(settings, "cache_ttl_inflation_seconds", 0)
+        started = time.monotonic()
+        values = [inflation.current_inflation()["inflation_percent"] for _ in range(20)]
+        assert time.monotonic() - started < 0.5  # never waits on the refresh
+        assert set(values) == {6.0}
+        assert len(calls) == 2  # expired reads collapse into one refresh
+
+        release.set()
+        time.sleep(0.1)
+        assert inflation.current_inflation()["inflation_percent"] == 7.0
+    finally:
+        release.set()
+        inflation.reset_inflation_provider()
+
+
+def test_inflation_series_lookups_and_binary_roundtrip(tmp_path):
+    from backend.utils.inflation_series import InflationSeries
+
+    records = [
+        {"date": "2024", "value": None},  # not published yet
+        {"date": "2023", "value": 10.0},
+        {"date": "2022", "value": None},  # gap reuses 2021
+        {"date": "2021", "value": 5.0},
+        {"date": "2020", "value": 0.0},
+    ]
+    series = InflationSeries.from_records(records)
+    assert (series.first_year, series.last_year) == (2020, 2023)
+    assert series.latest_rate == 10.0
+    assert abs(series.growth_over(4) - 1.0 * 1.05 * 1.05 * 1.10) < 1e-12
+    assert abs(series.growth_over(6) - 1.05 * 1.05 * 1.10 ** 3) < 1e-12  # latest rate repeats
+    assert abs(series.rolling_average(1) - 10.0) < 1e-9
+    expected = ((1.05 * 1.10) ** 0.5 - 1) * 100
+    assert abs(series.rolling_average(2) - expected) < 1e-9
+
+    path = tmp_path / "series.npy"
+    series.save(path)
+    assert path.stat().st_size < 256
+    loaded = InflationSeries.load(path)
+    assert loaded.first_year == 2020 and loaded.latest_rate == 10.0
+    assert abs(loaded.rolling_average(2) - expected) < 1e-9
+
+
+def test_plan_event_with_inflation_curve():
+    from datetime import datetime
+    from backend.services.planner import plan_event
+
+    target = datetime.now().year + 3
+    plan = plan_event("Car", 100000, target, inflation_curve_pct=[10, 0])
+    assert plan["future_cost"] == 110000.0
+    assert abs(plan["inflation_percent_used"] - (1.1 ** (1 / 3) - 1) * 100) < 1e-3
+
+
+def test_inflation_curve_rates_are_bounded():
+    import pytest
+    from pydantic import ValidationError
+    from backend.schemas import PlanRequest
+
+    base = {"event_name": "Car", "today_cost": 100000, "target_year": 2030}
+    for curve in ([-150], [5, 101]):
+        with pytest.raises(ValidationError):
+            PlanRequest(**base, inflation_curve_pct=curve)
+    assert PlanRequest(**base, inflation_curve_pct=[-50, 100]).inflation_curve_pct == [-50, 100]
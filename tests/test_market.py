@@ -0,0 +1,124 @@
+import time
+
+from backend.services import market
+from backend.settings import settings
+from scripts.bench_market_fetch import point_settings_at, start_stub_yahoo
+
+
+SETTINGS_TOUCHED = ("yf_nifty_url", "yf_sensex_url", "yf_chart_url_template", "use_mock_market", "cache_ttl_market_seconds")
+
+
+def test_index_summary_fetches_symbols_concurrently(monkeypatch):
+    for name in SETTINGS_TOUCHED:
+        monkeypatch.setattr(settings, name, getattr(settings, name))
+    server = start_stub_yahoo(delay=0.4)
+    point_settings_at(server)
+    try:
+        started = time.monotonic()
+        summary = market.fetch_index_summary()
+        elapsed = time.monotonic() - started
+    finally:
+        server.shutdown()
+
+    assert summary["NIFTY_50"]["symbol"] == "^NSEI"
+    assert summary["SENSEX"]["symbol"] == "^BSESN"
+    assert elapsed < 0.75  # one stub delay, not two
+
+
+def test_summary_is_cached_and_keeps_last_good_quote(monkeypatch):
+    for name in SETTINGS_TOUCHED:
+        monkeypatch.setattr(settings, name, getattr(settings, name))
+    server = start_stub_yahoo(delay=0)
+    point_settings_at(server)
+    market.clear_market_cache()
+    try:
+        first = market.fetch_index_summary()
+        market.fetch_index_summary()
+        assert server.hits == 2  # second call served from cache
+        assert first["NIFTY_50"]["age_seconds"] is not None
+
+        # Expired + upstream failing: stale quote served, one background refresh.
+        settings.cache_ttl_market_seconds = 0
+        server.fail = True
+        stale = market.fetch_index_summary()
+        time.sleep(0.3)
+        assert stale["NIFTY_50"]["last_price"] == first["NIFTY_50"]["last_price"]
+        assert server.hits == 4
+        assert market.fetch_index_summary()["SENSEX"]["last_price"] == first["SENSEX"]["last_price"]
+    finally:
+        server.shutdown()
+        market.clear_market_cache()
+        market.yahoo_breaker().record_success()
+
+
+def test_concurrent_quote_requests_share_one_upstream_call(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    for name in SETTINGS_TOUCHED:
+        monkeypatch.setattr(settings, name, getattr(settings, name))
+    server = start_stub_yahoo(delay=0.3)
+    point_settings_at(server)
+    market.clear_market_cache()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: market.fetch_quotes(["RELIANCE.NS"]), range(8)))
+    finally:
+        server.shutdown()
+        market.clear_market_cache()
+
+    assert server.hits == 1
+    assert all(r["RELIANCE.NS"]["symbol"] == "RELIANCE.NS" for r in results)
+
+
+def test_stream_pollers_are_shared_and_stop_without_subscribers(monkeypatch):
+    import asyncio
+
+    from backend.services import market_stream
+
+    for name in SETTINGS_TOUCHED + ("market_poll_interval_seconds",):
+        monkeypatch.setattr(settings, name, getattr(settings, name))
+    settings.market_poll_interval_seconds = 0.05
+    server = start_stub_yahoo(delay=0)
+    point_settings_at(server)
+
+    async def scenario():
+        queues = [market_stream.subscribe(["^NSEI"]) for _ in range(5)]
+        updates = await asyncio.gather(*(q.get() for q in queues))
+        assert {u["quote"]["symbol"] for u in updates} == {"^NSEI"}
+        await asyncio.sleep(0.2)
+        assert market_stream.poller_stats()["^NSEI"]["subscribers"] == 5
+        for q in queues:
+            market_stream.unsubscribe(["^NSEI"], q)
+        await asyncio.sleep(0.2)
+        assert "^NSEI" not in market_stream.poller_stats()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        server.shutdown()
+        market.clear_market_cache()
+
+    assert server.hits < 10  # ~one poll per interval, not one per subscriber
+
+
+def test_unknown_symbols_are_negatively_cached_and_do_not_open_the_circuit(monkeypatch):
+    for name in SETTINGS_TOUCHED:
+        monkeypatch.setattr(settings, name, getattr(settings, name))
+    server = start_stub_yahoo(delay=0)
+    server.unknown = {"BOGUS1", "BOGUS2", "BOGUS3", "BOGUS4"}
+    point_settings_at(server)
+    market.clear_market_cache()
+    market.yahoo_breaker().record_success()
+    try:
+        quotes = market.fetch_quotes(sorted(server.unknown))
+        assert all(q["error"] == "symbol not found" for q in quotes.values())
+        assert market.yahoo_breaker().state == "closed"
+
+        hits = server.hits
+        assert market.fetch_quotes(["BOGUS1"])["BOGUS1"]["error"] == "symbol not found"
+        assert server.hits == hits  # answered from the negative cache
+
+        assert market.fetch_index_summary()["NIFTY_50"]["last_price"] == 22400.5
+    finally:
+        server.shutdown()
+        market.clear_market_cache()
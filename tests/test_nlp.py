@@ -13,4 +13,102 @@ def test_parse_amount_in_lakhs():
     event, amount, year = parse_goal_text("Wedding in December 2026 for 8 lakhs")
     assert "wedding" in event.lower()
     assert amount == 800000.0
-    assert year >= 2026 
\ No newline at end of file
+    assert year >= 2026 
+
+def test_year_fast_path_skips_dateparser():
+    from datetime import datetime
+    from backend.services.nlp import _extract_year_tiered
+
+    now = datetime.now().year
+    assert _extract_year_tiered("Buy a car by 2030 for 6 lakh") == (2030, "explicit")
+    assert _extract_year_tiered("Bali trip Feb '29 for 2L") == (2029, "explicit")
+    assert _extract_year_tiered("Europe trip next year for 3L") == (now + 1, "relative")
+    assert _extract_year_tiered("House in 5 years for 50L") == (now + 5, "relative")
+    assert _extract_year_tiered("Flat two years from now for 40L") == (now + 2, "relative")
+
+
+def test_amount_pattern_matches_legacy_cascade():
+    from backend.services.nlp import _extract_amount
+    from scripts.bench_nlp_amount import EXTENDED_CORPUS, PARITY_CORPUS, _legacy_extract_amount
+
+    for text in PARITY_CORPUS:
+        assert _extract_amount(text) == _legacy_extract_amount(text), text
+    for text, expected in EXTENDED_CORPUS:
+        assert _extract_amount(text) == expected, text
+
+
+def test_parse_batch_keeps_order_and_reports_errors(monkeypatch):
+    from backend.services import nlp_batch
+    from backend.settings import settings
+
+    texts = ["Car in 2030 for 6 lakh", "no amount or year here", "Trip Dec 2031 for ₹50000"]
+    monkeypatch.setattr(settings, "nlp_batch_workers", 1)
+    for threshold in (100, 0):  # inline, then through the pool
+        monkeypatch.setattr(settings, "nlp_batch_inline_threshold", threshold)
+        results = nlp_batch.parse_goal_texts(texts)
+        assert [r[0][2] if r[0] else None for r in results] == [2030, None, 2031]
+        assert results[1][1] == "Could not detect amount from text"
+    assert nlp_batch.get_pool()._mp_context.get_start_method() in ("forkserver", "spawn")
+    nlp_batch.shutdown_pool()
+
+
+def test_parse_cache_normalizes_keys_and_evicts():
+    from backend.services.nlp import _ParseCache
+
+    cache = _ParseCache(maxsize=1)
+    assert cache.get_or_compute("Trip Dec 2030 for 50k") == (50000.0, 2030)
+    assert cache.get_or_compute("  trip   DEC 2030 for 50K ") == (50000.0, 2030)
+    cache.get_or_compute("Car in 2031 for 6 lakh")
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 2, 1)
+
+    cache._epoch = (1999, 1)  # pretend the cache was filled in another month
+    cache.get_or_compute("Car in 2031 for 6 lakh")
+    assert cache.stats()["misses"] == 3
+
+
+def test_nlp_routers_do_not_import_dateparser_eagerly():
+    from scripts.bench_startup import import_times
+
+    rows = import_times("backend.routers.nlp, backend.routers.planner, backend.routers.agent")
+    assert not [name for name, _, _ in rows if name.startswith("dateparser")]
+
+
+def test_parse_goal_fields_returns_partial_result():
+    from backend.services.nlp import parse_goal_fields
+
+    parsed = parse_goal_fields("Buy a laptop for 60k")
+    assert parsed.amount == 60000.0
+    assert parsed.year is None
+    assert "laptop" in parsed.event_name.lower()
+
+    parsed = parse_goal_fields("Trip to Goa in 2030")
+    assert (parsed.amount, parsed.year) == (None, 2030)
+
+
+def test_year_tiers_match_legacy_dateparser_path():
+    from datetime import datetime
+    from backend.services.nlp import _extract_year_tiered
+    from scripts.bench_nlp_year import CORPUS, LEGACY_MISREADS, _legacy_extract_year
+
+    for text in CORPUS:
+        if text not in LEGACY_MISREADS:
+            assert _extract_year_tiered(text)[0] == _legacy_extract_year(text), text
+    now = datetime.now().year
+    assert _extract_year_tiered(f"MBA fees {now + 3} cost is 18 lakhs") == (now + 3, "explicit")
+    # past explicit years fall through; "Mon-DD" is a day, not a year
+    assert _extract_year_tiered("Save 2000 monthly, car in 3 years for 5 lakh") == (now + 3, "relative")
+    assert _extract_year_tiered("Christmas trip Dec-25 for 50k")[1] == "month"
+
+
+def test_year_tier_stats_endpoint():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from backend.routers import nlp as nlp_router
+    from backend.services.nlp import _extract_year
+
+    _extract_year("Car next year for 5 lakh")
+    app = FastAPI()
+    app.include_router(nlp_router.router)
+    stats = TestClient(app).get("/nlp/year-tier-stats").json()
+    assert stats["relative"] >= 1
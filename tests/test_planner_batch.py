@@ -0,0 +1,56 @@
+import json
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import planner
+from backend.services import planner_batch
+from backend.services.planner import plan_event
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.include_router(planner.router)
+    return TestClient(app)
+
+
+def test_batch_matches_plan_event_with_one_inflation_lookup(monkeypatch):
+    lookups = []
+    monkeypatch.setattr(planner_batch, "_get_inflation_percent", lambda: lookups.append(1) or 6.5)
+    this_year = datetime.now().year
+    goals = [
+        {"event_name": "Car", "today_cost": 500000, "target_year": this_year + 5},
+        {"event_name": "Trip", "today_cost": 80000.5, "target_year": this_year},
+        {"event_name": "Phone", "today_cost": 30000, "target_year": this_year + 2, "inflation_override_pct": 10},
+        {"event_name": "Bad", "today_cost": -1, "target_year": this_year + 1},
+        {"event_name": "House", "today_cost": "lots", "target_year": this_year + 1},
+    ]
+
+    resp = _client().post("/planner/batch", json={"goals": goals})
+    assert resp.status_code == 200
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+
+    assert [line["index"] for line in lines] == [0, 1, 2, 3, 4]
+    assert len(lookups) == 1
+    for goal, line in zip(goals[:3], lines):
+        expected = plan_event(goal["event_name"], float(goal["today_cost"]), goal["target_year"],
+                              goal.get("inflation_override_pct", 6.5))
+        assert {k: line[k] for k in expected} == expected
+    assert lines[3]["error"] == "today_cost must be > 0"
+    assert "numeric" in lines[4]["error"]
+
+
+def test_batch_accepts_csv_and_streams_csv():
+    this_year = datetime.now().year
+    body = f"event_name,today_cost,target_year\nCar,100000,{this_year + 1}\n,5,{this_year + 1}\n"
+    resp = _client().post(
+        "/planner/batch?format=csv&inflation_override_pct=10",
+        content=body,
+        headers={"Content-Type": "text/csv"},
+    )
+    assert resp.status_code == 200
+    header, first, second = resp.text.splitlines()
+    assert header.split(",") == list(planner_batch.CSV_FIELDS)
+    assert first.startswith("0,Car,") and ",110000.0," in first
+    assert second.endswith("event_name cannot be empty")
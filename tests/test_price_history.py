@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from backend.routers import market as market_router
+from backend.services.price_history import PriceHistoryStore, bars_from_chart
+
+DAY = 86_400
+MONDAY = 4 * DAY  # 1970-01-05
+
+
+def _bars(days, close):
+    ts = np.asarray(days, dtype=np.int64) * DAY + MONDAY
+    close = np.asarray(close, dtype=float)
+    return {"ts": ts, "open": close - 1, "high": close + 1, "low": close - 2, "close": close, "volume": np.ones_like(close)}
+
+
+def test_append_is_incremental_and_memory_mapped(tmp_path):
+    store = PriceHistoryStore(tmp_path)
+    assert store.append("^NSEI", _bars([0, 1, 2], [10, 11, 12])) == 3
+    # Overlap: day 2 replaces the last bar, only day 3 is new.
+    assert store.append("^NSEI", _bars([1, 2, 3], [0, 12.5, 13])) == 1
+
+    cols = store.columns("^NSEI")
+    assert isinstance(cols["close"], np.memmap)
+    assert cols["close"].tolist() == [10, 11, 12.5, 13]
+
+    window = store.range("^NSEI", MONDAY + DAY, MONDAY + 3 * DAY)
+    assert window["close"].tolist() == [11, 12.5]
+
+
+def test_backfill_after_live_bar_merges_older_bars(tmp_path):
+    store = PriceHistoryStore(tmp_path)
+    assert store.append("^NSEI", _bars([10], [30])) == 1  # today's bar from a live quote
+    store.columns("^NSEI")  # mapped before the rewrite
+    # Backfill: older history, a gap-filler, and a newer close for today.
+    assert store.append("^NSEI", _bars([2, 0, 1, 1, 10], [12, 10, 0, 11, 31])) == 3
+
+    cols = store.columns("^NSEI")
+    assert cols["ts"].tolist() == (np.array([0, 1, 2, 10]) * DAY + MONDAY).tolist()
+    assert cols["close"].tolist() == [10, 11, 12, 31]
+    # stored bars other than the last are kept; new ones still append
+    assert store.append("^NSEI", _bars([1, 5, 11], [99, 15, 32])) == 2
+    assert store.columns("^NSEI")["close"].tolist() == [10, 11, 12, 15, 31, 32]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["_NSEI"]  # no rewrite leftovers
+
+
+def test_weekly_downsample(tmp_path):
+    store = PriceHistoryStore(tmp_path)
+    store.append("^NSEI", _bars([0, 1, 4, 7, 8], [10, 14, 12, 20, 21]))
+    weekly = store.downsample("^NSEI", "weekly")
+    assert weekly["close"].tolist() == [12, 21]
+    assert weekly["high"].tolist() == [15, 22]
+    assert weekly["volume"].tolist() == [3, 2]
+
+
+def test_bars_from_chart_skips_missing_closes():
+    result = {
+        "timestamp": [100, 200],
+        "indicators": {"quote": [{"open": [1, 2], "high": [1, 2], "low": [1, 2], "close": [1.5, None], "volume": [5, 6]}]},
+    }
+    assert bars_from_chart(result)["ts"].tolist() == [100]
+
+
+def test_dot_only_symbols_cannot_escape_the_store(tmp_path):
+    store = PriceHistoryStore(tmp_path / "history")
+    for symbol in ("..", ".", ""):
+        with pytest.raises(ValueError):
+            store.append(symbol, _bars([0], [1.0]))
+    assert not (tmp_path / "ts.bin").exists()
+    assert store.append("^NSEI", _bars([0], [1.0])) == 1
+    assert market_router._SYMBOL_RE.match("^NSEI") and not market_router._SYMBOL_RE.match("..")
@@ -0,0 +1,133 @@
+import time
+from datetime import date, datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect, select, update
+from sqlalchemy.orm import sessionmaker
+
+from backend import database, models
+from backend.routers import diagnostics, goals
+from backend.services import inflation, recompute
+from backend.settings import settings
+
+
+def _set_inflation(monkeypatch, pct):
+    monkeypatch.setattr(inflation, "fetch_worldbank_inflation",
+                        lambda: {"inflation_percent": pct, "source": "worldbank", "series": None})
+    inflation.reset_inflation_provider()
+
+
+@pytest.fixture
+def SessionLocal(tmp_path, monkeypatch):
+    _set_inflation(monkeypatch, 10.0)
+    engine = create_engine(f"sqlite:///{tmp_path / 'recompute.db'}", connect_args={"check_same_thread": False})
+    models.Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine)
+    inflation.reset_inflation_provider()
+    engine.dispose()
+
+
+def _create_goals(SessionLocal, n):
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(goals.router)
+    app.dependency_overrides[goals.get_db] = get_db
+    client = TestClient(app)
+    year = datetime.now().year + 1
+    for i in range(n):
+        client.post("/goals/", json={"event_name": f"Goal {i}", "today_cost": 1000 * (i + 1), "target_year": year})
+
+
+def test_job_refreshes_stale_rows_in_resumable_batches(SessionLocal, monkeypatch):
+    _create_goals(SessionLocal, 5)
+    with SessionLocal() as db:
+        calc = db.execute(select(models.Calculation)).scalars().first()
+        assert (calc.inflation_version, calc.computed_on) == ("10.0000", date.today())
+        assert recompute.count_stale(db, "10.0000") == 0
+        assert recompute.count_stale(db, "10.0000", as_of=date(date.today().year + 1, 1, 1)) == 5
+
+    _set_inflation(monkeypatch, 12.0)
+    monkeypatch.setattr(settings, "recompute_batch_rows", 2)
+    job = recompute.RecomputeJob(SessionLocal)
+    original = recompute.recompute_batch
+
+    def interrupt_after_first_batch(*args):
+        ids = original(*args)
+        job.stop()
+        return ids
+
+    monkeypatch.setattr(recompute, "recompute_batch", interrupt_after_first_batch)
+    assert job.run_pass() == 2
+    assert job.status()["checkpoint"] == 2
+    with SessionLocal() as db:
+        assert recompute.count_stale(db, "12.0000") == 3
+
+    monkeypatch.setattr(recompute, "recompute_batch", original)
+    assert job.run_pass() == 3  # resumes after id 2
+    status = job.status()
+    assert (status["checkpoint"], status["updated"], status["inflation_version"]) == (None, 5, "12.0000")
+    with SessionLocal() as db:
+        assert recompute.count_stale(db, "12.0000") == 0
+        rows = db.execute(select(models.Calculation.future_cost).order_by(models.Calculation.id)).scalars().all()
+    assert rows == [1120.0, 2240.0, 3360.0, 4480.0, 5600.0]
+
+
+def test_diagnostics_reports_and_triggers_recompute(SessionLocal, monkeypatch):
+    _create_goals(SessionLocal, 3)
+    _set_inflation(monkeypatch, 12.0)
+    monkeypatch.setattr(database, "SessionLocal", SessionLocal)
+    monkeypatch.setattr(recompute, "recompute_job", recompute.RecomputeJob(SessionLocal))
+    app = FastAPI()
+    app.include_router(diagnostics.router)
+    client = TestClient(app)
+
+    before = client.get("/diagnostics/recompute").json()
+    assert (before["stale"], before["current_inflation_version"], before["running"]) == (3, "12.0000", False)
+    assert client.post("/diagnostics/recompute").json()["started"] is True
+    deadline = time.monotonic() + 10
+    while recompute.recompute_job.status()["passes"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    after = client.get("/diagnostics/recompute").json()
+    assert (after["stale"], after["updated"], after["last_error"]) == (0, 3, None)
+
+
+def test_add_missing_columns_migrates_existing_table(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE calculations (id INTEGER PRIMARY KEY, future_cost FLOAT, "
+                             "monthly_saving FLOAT, goal_id INTEGER)")
+    models.Base.metadata.create_all(bind=engine)
+    database.add_missing_columns(models.Base.metadata, engine)
+    database.create_missing_indexes(models.Base.metadata, engine)
+    inspector = inspect(engine)
+    assert {"inflation_version", "computed_on"} <= {c["name"] for c in inspector.get_columns("calculations")}
+    assert "ix_calculations_stamp" in {i["name"] for i in inspector.get_indexes("calculations")}
+    engine.dispose()
+
+
+def test_batch_does_not_overwrite_rows_changed_after_the_read(SessionLocal, monkeypatch):
+    _create_goals(SessionLocal, 3)
+    _set_inflation(monkeypatch, 12.0)
+    compute_plans = recompute.compute_plans
+
+    with SessionLocal() as db:
+        def edit_then_plan(*args):
+            # what PATCH /goals/1 and a refresh of calculation 2 would commit meanwhile
+            db.execute(update(models.Goal).where(models.Goal.id == 1).values(today_cost=999.0))
+            db.execute(update(models.Calculation).where(models.Calculation.id == 2)
+                       .values(future_cost=1.0, inflation_version="12.0000"))
+            return compute_plans(*args)
+
+        monkeypatch.setattr(recompute, "compute_plans", edit_then_plan)
+        recompute.recompute_batch(db, 12.0, 0, 10)
+        rows = db.execute(select(models.Calculation.future_cost, models.Calculation.inflation_version)
+                          .order_by(models.Calculation.id)).all()
+    assert rows == [(1100.0, "10.0000"), (1.0, "12.0000"), (3360.0, "12.0000")]
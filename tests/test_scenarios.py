@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import planner
+from backend.services import scenarios
+from backend.services.planner import plan_event
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.include_router(planner.router)
+    return TestClient(app)
+
+
+def test_sweep_grid_matches_plan_event():
+    this_year = datetime.now().year
+    resp = _client().post("/planner/scenarios", json={
+        "today_cost": 250000,
+        "inflation_pct": {"start": 4, "stop": 6, "step": 0.5},
+        "target_years": [this_year, this_year + 3, this_year + 12],
+        "expected_return_pct": [0, 12],
+    })
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["inflation_pct"] == [4.0, 4.5, 5.0, 5.5, 6.0]
+    assert len(body["future_cost"]) == 5 and len(body["future_cost"][0]) == 3
+
+    for i, pct in enumerate(body["inflation_pct"]):
+        for j, year in enumerate(body["target_years"]):
+            plan = plan_event("x", 250000, year, pct)
+            assert body["future_cost"][i][j] == plan["future_cost"]
+            assert body["monthly_saving_needed"][i][j] == plan["monthly_saving_needed"]
+            # a 0% return needs the same as the flat split
+            assert body["monthly_sip"][0][i][j] == plan["monthly_saving_needed"]
+    assert body["monthly_sip"][1][0][2] < body["monthly_sip"][0][0][2]
+
+
+def test_monthly_sip_grows_to_future_cost():
+    sip = float(scenarios.monthly_sip_for(100000.0, 12.0, 60))
+    r = 1.12 ** (1 / 12) - 1
+    corpus = sum(sip * (1 + r) ** (60 - m) for m in range(60))
+    assert abs(corpus - 100000) < 5
+
+
+def test_sweep_rejects_oversized_grid():
+    resp = _client().post("/planner/scenarios", json={
+        "today_cost": 1000,
+        "inflation_pct": {"start": 0, "stop": 50, "step": 0.0001},
+        "target_years": [2040],
+    })
+    assert resp.status_code == 413
+
+
+@pytest.mark.parametrize("body", [
+    {"inflation_pct": [6, 1e6]},
+    {"inflation_pct": {"start": -5, "stop": 5, "step": 1}},
+    {"inflation_pct": [6], "expected_return_pct": [-100]},
+    {"inflation_pct": [6], "expected_return_pct": {"start": 8, "stop": 150, "step": 1}},
+])
+def test_sweep_rejects_out_of_range_axis_values(body):
+    resp = _client().post("/planner/scenarios", json={"today_cost": 1000, "target_years": [2040], **body})
+    assert resp.status_code == 422
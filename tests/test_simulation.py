@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import planner
+from backend.services import inflation, simulation
+from backend.settings import settings
+from backend.utils.inflation_series import InflationSeries
+
+
+@pytest.fixture(autouse=True)
+def fixed_inflation(monkeypatch):
+    series = InflationSeries(1990, np.array([8.0, 6.0, 4.0, 10.0, 5.0]))
+    monkeypatch.setattr(inflation, "fetch_worldbank_inflation",
+                        lambda: {"inflation_percent": 5.0, "source": "worldbank", "series": series})
+    inflation.reset_inflation_provider()
+    yield
+    inflation.reset_inflation_provider()
+
+
+def test_same_seed_reproduces_and_probability_tracks_sip():
+    target = datetime.now().year + 20
+    a = simulation.simulate_goal(1_000_000, target, n_paths=2000, seed=7)
+    b = simulation.simulate_goal(1_000_000, target, n_paths=2000, seed=7)
+    assert {k: v for k, v in a.items() if k != "elapsed_ms"} == {k: v for k, v in b.items() if k != "elapsed_ms"}
+    assert a["inflation_model"] == "bootstrap"
+    assert a["future_cost_percentiles"]["p5"] <= a["future_cost_percentiles"]["p95"]
+
+    assert simulation.simulate_goal(1_000_000, target, monthly_sip=0, n_paths=1000, seed=1)[
+        "probability_of_reaching_goal"] == 0.0
+    assert simulation.simulate_goal(1_000_000, target, monthly_sip=10**6, n_paths=1000, seed=1)[
+        "probability_of_reaching_goal"] == 1.0
+
+
+def test_sip_corpus_matches_annuity_due_without_volatility():
+    rng = np.random.default_rng(0)
+    cum, model = simulation._cumulative_returns(rng, "parametric", 3, 120, 12.0, 0.0)
+    assert model == "parametric"
+    r = 1.12 ** (1 / 12) - 1
+    expected = 1000 * sum((1 + r) ** (120 - m) for m in range(120))
+    assert np.allclose(simulation.sip_corpus(cum, 1000), expected, rtol=1e-4)
+
+
+def test_simulate_endpoint_caps_paths():
+    app = FastAPI()
+    app.include_router(planner.router)
+    client = TestClient(app)
+    body = {"today_cost": 500000, "target_year": datetime.now().year + 10, "seed": 3, "paths": 500}
+    resp = client.post("/planner/simulate", json=body)
+    assert resp.status_code == 200 and resp.json()["seed"] == 3
+    assert client.post("/planner/simulate", json={**body, "paths": 10**9}).status_code == 413
+    assert client.post("/planner/simulate", json={**body, "target_year": 3000}).status_code == 422
+    long_run = {**body, "paths": settings.simulation_max_paths, "target_year": datetime.now().year + 90}
+    assert client.post("/planner/simulate", json=long_run).status_code == 413
@@ -0,0 +1,43 @@
+import json
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import planner
+from backend.utils.finance import monthly_saving_needed, required_monthly_sip, sip_schedule
+
+
+def test_solved_sip_schedule_reaches_target():
+    for step_up in (0.0, 10.0):
+        sip = required_monthly_sip(1_000_000, 12.0, 120, step_up)
+        rows = list(sip_schedule(sip, 12.0, 120, step_up))
+        assert len(rows) == 120
+        assert abs(rows[-1]["balance"] - 1_000_000) < 100
+        assert rows[12]["contribution"] == round(sip * (1 + step_up / 100), 2)
+
+    assert required_monthly_sip(1_000_000, 12.0, 120, 10.0) < required_monthly_sip(1_000_000, 12.0, 120)
+    assert required_monthly_sip(120_000, 0.0, 120) == monthly_saving_needed(120_000, 120)
+
+
+def test_schedule_endpoint_streams_rows_per_goal():
+    app = FastAPI()
+    app.include_router(planner.router)
+    client = TestClient(app)
+    year = datetime.now().year
+    goal = {"event_name": "Car", "today_cost": 500000, "target_year": year + 2, "inflation_override_pct": 6,
+            "expected_return_pct": 10, "step_up_pct": 5}
+
+    plan = client.post("/planner/sip", json=goal).json()
+    assert plan["monthly_sip"] < plan["monthly_saving_needed"]
+    assert plan["final_monthly_sip"] == round(plan["monthly_sip"] * 1.05, 2)
+
+    resp = client.post("/planner/sip/schedule", json={"goals": [goal, {**goal, "event_name": "Trip"}]})
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(rows) == 48
+    assert [r["goal_index"] for r in rows[::24]] == [0, 1]
+    assert abs(rows[23]["balance"] - plan["future_cost"]) < 1
+
+    csv_text = client.post("/planner/sip/schedule?format=csv", json={"goals": [goal]}).text
+    assert csv_text.splitlines()[0].startswith("goal_index,event_name,month")
+    assert len(csv_text.splitlines()) == 25